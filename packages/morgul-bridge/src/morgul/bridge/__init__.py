@@ -29,7 +29,9 @@ from .memory import (
     read_uint8,
     read_uint16,
     read_uint32,
+    read_uint32_array,
     read_uint64,
+    read_uint64_array,
     search_memory,
     write_uint8,
     write_uint16,
@@ -72,6 +74,8 @@ __all__ = [
     "read_uint16",
     "read_uint32",
     "read_uint64",
+    "read_uint32_array",
+    "read_uint64_array",
     "write_uint8",
     "write_uint16",
     "write_uint32",
@@ -9,6 +9,7 @@ try:
 except ImportError:
     lldb = None  # type: ignore[assignment]
 
+from .process import _bump_external_epoch
 from .types import CommandResult
 
 if TYPE_CHECKING:
@@ -159,6 +160,9 @@ class Debugger:
         CommandResult
             Captured output, error text, and success flag.
         """
+        # Commands such as ``memory write``, ``register write`` or
+        # ``frame select`` change state without resuming the process.
+        _bump_external_epoch()
         ret = lldb.SBCommandReturnObject()
         interpreter = self._sb.GetCommandInterpreter()
         interpreter.HandleCommand(command, ret)
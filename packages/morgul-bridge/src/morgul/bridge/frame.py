@@ -9,6 +9,7 @@ try:
 except ImportError:
     lldb = None  # type: ignore[assignment]
 
+from .process import _bump_external_epoch
 from .types import RegisterValue, Variable
 
 
@@ -151,6 +152,8 @@ class Frame:
         str
             The result value as a string, or an error message.
         """
+        # Expressions may assign to memory or registers.
+        _bump_external_epoch()
         sb_val = self._sb.EvaluateExpression(expr)
         error = sb_val.GetError()
         if error.Fail():
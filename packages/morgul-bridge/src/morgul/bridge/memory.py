@@ -89,6 +89,26 @@ def read_uint64(process: Process, address: int) -> int:
     return struct.unpack("<Q", process.read_memory(address, 8))[0]
 
 
+# ---------------------------------------------------------------------------
+# Bulk array reads
+# ---------------------------------------------------------------------------
+
+def read_uint32_array(process: Process, address: int, count: int) -> List[int]:
+    """Read *count* consecutive unsigned 32-bit little-endian integers.
+
+    Uses a single memory read, unlike calling :func:`read_uint32` in a loop.
+    """
+    return list(struct.unpack(f"<{count}I", process.read_memory(address, count * 4)))
+
+
+def read_uint64_array(process: Process, address: int, count: int) -> List[int]:
+    """Read *count* consecutive unsigned 64-bit little-endian integers.
+
+    Uses a single memory read, unlike calling :func:`read_uint64` in a loop.
+    """
+    return list(struct.unpack(f"<{count}Q", process.read_memory(address, count * 8)))
+
+
 # ---------------------------------------------------------------------------
 # Fixed-width integer writes
 # ---------------------------------------------------------------------------
@@ -15,6 +15,18 @@ if TYPE_CHECKING:
     from .target import Target
     from .thread import Thread
 
+# Bumped by bridge calls that can change process state without going through
+# a Process wrapper (CLI commands, expression evaluation); folded into every
+# wrapper's ``state_epoch``.
+_external_epoch = 0
+
+
+def _bump_external_epoch() -> None:
+    """Record a possible out-of-band change to memory, registers or selection."""
+    global _external_epoch
+    _external_epoch += 1
+
+
 # Map LLDB integer state constants to our ProcessState enum.
 _STATE_MAP: Dict[int, ProcessState] = {}
 
@@ -50,6 +62,7 @@ class Process:
     def __init__(self, sb_process: Any, target: Target) -> None:
         self._sb = sb_process
         self._target = target
+        self._state_epoch = 0
         _build_state_map()
 
     # -- properties --------------------------------------------------------
@@ -75,6 +88,22 @@ class Process:
         """Return a textual description of the exit reason."""
         return self._sb.GetExitDescription() or ""
 
+    @property
+    def stop_id(self) -> int:
+        """Return the stop ID, which LLDB bumps every time the process resumes."""
+        return self._sb.GetStopID()
+
+    @property
+    def state_epoch(self) -> int:
+        """Return a counter bumped by every call that may change process state.
+
+        Covers resume/stop/kill/detach and memory writes on this wrapper, plus
+        any :meth:`Debugger.execute_command` or
+        :meth:`Frame.evaluate_expression` call, including ones that leave
+        :attr:`stop_id` unchanged.
+        """
+        return self._state_epoch + _external_epoch
+
     @property
     def threads(self) -> List[Thread]:
         """Return all threads in the process."""
@@ -101,24 +130,28 @@ class Process:
 
     def continue_(self) -> None:
         """Resume execution of the process."""
+        self._state_epoch += 1
         error = self._sb.Continue()
         if error and not error.Success():
             raise RuntimeError(f"Failed to continue: {error}")
 
     def stop(self) -> None:
         """Halt the process."""
+        self._state_epoch += 1
         error = self._sb.Stop()
         if error and not error.Success():
             raise RuntimeError(f"Failed to stop: {error}")
 
     def kill(self) -> None:
         """Kill the process."""
+        self._state_epoch += 1
         error = self._sb.Kill()
         if error and not error.Success():
             raise RuntimeError(f"Failed to kill process: {error}")
 
     def detach(self) -> None:
         """Detach from the process."""
+        self._state_epoch += 1
         error = self._sb.Detach()
         if error and not error.Success():
             raise RuntimeError(f"Failed to detach: {error}")
@@ -162,6 +195,7 @@ class Process:
         int
             The number of bytes actually written.
         """
+        self._state_epoch += 1
         error = lldb.SBError()
         written = self._sb.WriteMemory(address, data, error)
         if error.Fail():
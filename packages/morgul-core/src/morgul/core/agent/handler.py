@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, AsyncIterator
 from morgul.core.agent.strategies import AgentStrategy, get_strategy_description
 from morgul.core.agent.tools import AGENT_TOOLS
 from morgul.core.context.builder import ContextBuilder
-from morgul.core.translate.prompts import AGENT_SYSTEM_PROMPT
+from morgul.core.translate.prompts import render_agent_system
 from morgul.core.types.llm import AgentStep
 
 if TYPE_CHECKING:
@@ -59,7 +59,7 @@ class AgentHandler:
         """Run the agent loop, yielding steps as they complete."""
         from morgul.llm.types import ChatMessage
 
-        system_prompt = AGENT_SYSTEM_PROMPT.format(
+        system_prompt = render_agent_system(
             strategy=self.strategy.value,
             strategy_description=get_strategy_description(self.strategy),
             task=task,
@@ -67,7 +67,8 @@ class AgentHandler:
         )
 
         messages: list[ChatMessage] = [
-            ChatMessage(role="system", content=system_prompt),
+            # Identical on every step of the loop, so cacheable as a prefix
+            ChatMessage(role="system", content=system_prompt, cache_control="ephemeral"),
         ]
 
         # Add initial observation
@@ -18,6 +18,8 @@ You have a Python REPL with live access to the debugger. Write code in ```python
 - read_string(process, addr) → str
 - read_pointer(process, addr) → int
 - read_uint8/16/32/64(process, addr) → int
+- read_uint32_array/read_uint64_array(process, addr, count) → list[int]
+  (one read; prefer over loops)
 - search_memory(process, start, size, pattern) → list[int]
 
 ## Stdlib Available
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import hashlib
 import logging
-from typing import Any
+import math
+from collections import OrderedDict
+from typing import Any, Sequence
 
 from morgul.core.cache.storage import FileStorage
 
@@ -19,8 +23,18 @@ class ContentCache:
     process restarts and ASLR re-randomization.
     """
 
-    def __init__(self, storage: FileStorage | None = None):
+    def __init__(self, storage: FileStorage | None = None, memory_size: int = 256):
         self.storage = storage or FileStorage()
+        # In-process LRU in front of storage so repeat lookups skip the disk;
+        # it holds private copies so callers can't mutate each other's results
+        self.memory_size = memory_size
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        # Background storage writes from set_by_key_nowait, held until done
+        self._pending: set[asyncio.Task] = set()
+        # In-memory semantic index: scope -> {storage key: unit vector}, both
+        # levels in LRU order; holds at most memory_size vectors in total
+        self._vectors: OrderedDict[str, OrderedDict[str, tuple[float, ...]]] = OrderedDict()
+        self._num_vectors = 0
 
     def make_key(self, code_bytes: bytes, suffix: str = "") -> str:
         """Create a content-addressed cache key from function bytes.
@@ -32,24 +46,155 @@ class ContentCache:
         h = hashlib.sha256(code_bytes).hexdigest()[:16]
         return f"{h}_{suffix}" if suffix else h
 
+    def _recall(self, key: str) -> Any | None:
+        """Return a copy of *key* from the in-process LRU, marking it recently used."""
+        value = self._memory.get(key)
+        if value is None:
+            return None
+        self._memory.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def _remember(self, key: str, value: Any) -> Any:
+        """Put a copy of *value* in the in-process LRU and return that copy.
+
+        The oldest entry is evicted if the LRU is full.
+        """
+        value = copy.deepcopy(value)
+        if self.memory_size > 0:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+        return value
+
     def get(self, code_bytes: bytes, suffix: str = "") -> Any | None:
         """Look up a cached value by code content."""
-        key = self.make_key(code_bytes, suffix)
-        return self.storage.get(key)
+        return self.get_by_key(self.make_key(code_bytes, suffix))
 
     def set(self, code_bytes: bytes, value: Any, suffix: str = "") -> None:
         """Store a value keyed by code content."""
-        key = self.make_key(code_bytes, suffix)
-        self.storage.set(key, value)
+        self.set_by_key(self.make_key(code_bytes, suffix), value)
 
     def get_by_key(self, key: str) -> Any | None:
         """Direct key lookup."""
-        return self.storage.get(key)
+        value = self._recall(key)
+        if value is None:
+            value = self.storage.get(key)
+            if value is not None:
+                self._remember(key, value)
+        return value
 
     def set_by_key(self, key: str, value: Any) -> None:
         """Direct key storage."""
+        self._remember(key, value)
         self.storage.set(key, value)
 
+    async def aget_by_key(self, key: str) -> Any | None:
+        """``get_by_key`` that reads storage in a worker thread on a memory miss."""
+        value = self._recall(key)
+        if value is None:
+            value = await asyncio.to_thread(self.storage.get, key)
+            if value is not None:
+                self._remember(key, value)
+        return value
+
+    async def aset_by_key(self, key: str, value: Any) -> None:
+        """``set_by_key`` that writes storage in a worker thread."""
+        self._remember(key, value)
+        await asyncio.to_thread(self.storage.set, key, value)
+
+    def set_by_key_nowait(self, key: str, value: Any) -> None:
+        """Store *value* without waiting for the storage write.
+
+        The entry is visible to lookups immediately via the in-process LRU;
+        the FileStorage write runs in a background task.  Call ``flush`` to
+        wait for outstanding writes.  Requires a running event loop.
+        """
+        # Write the snapshot, not *value*, which the caller may still mutate
+        value = self._remember(key, value)
+        task = asyncio.get_running_loop().create_task(
+            asyncio.to_thread(self.storage.set, key, value)
+        )
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def flush(self) -> None:
+        """Wait for writes started by ``set_by_key_nowait`` to finish."""
+        while self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def _match_embedding(
+        self, vector: Sequence[float], threshold: float, scope: str,
+    ) -> str | None:
+        """Return the storage key whose embedding best matches *vector*, if any."""
+        entries = self._vectors.get(scope)
+        query = _normalize(vector)
+        if not entries or query is None:
+            return None
+        best_key, best_sim = None, threshold
+        for key, unit in entries.items():
+            sim = math.fsum(a * b for a, b in zip(unit, query))
+            if sim >= best_sim:
+                best_key, best_sim = key, sim
+        if best_key is not None:
+            entries.move_to_end(best_key)
+            self._vectors.move_to_end(scope)
+        return best_key
+
+    def get_by_embedding(
+        self, vector: Sequence[float], threshold: float = 0.92, scope: str = "",
+    ) -> Any | None:
+        """Return the entry whose embedding is most similar to *vector*.
+
+        Only entries registered under the same *scope* are considered, and
+        the best match must reach cosine similarity *threshold*.
+        """
+        key = self._match_embedding(vector, threshold, scope)
+        return self.get_by_key(key) if key is not None else None
+
+    async def aget_by_embedding(
+        self, vector: Sequence[float], threshold: float = 0.92, scope: str = "",
+    ) -> Any | None:
+        """``get_by_embedding`` that reads storage in a worker thread on a memory miss."""
+        key = self._match_embedding(vector, threshold, scope)
+        return await self.aget_by_key(key) if key is not None else None
+
+    def set_by_embedding(self, vector: Sequence[float], key: str, scope: str = "") -> None:
+        """Register *vector* as an alias of the stored entry *key* within *scope*.
+
+        Like the in-process LRU, the index holds at most ``memory_size``
+        vectors; the oldest vector of the least recently used scope goes first.
+        """
+        unit = _normalize(vector)
+        if unit is None or self.memory_size <= 0:
+            return
+        entries = self._vectors.get(scope)
+        if entries is None:
+            entries = self._vectors[scope] = OrderedDict()
+        else:
+            self._vectors.move_to_end(scope)
+        if key not in entries:
+            self._num_vectors += 1
+        entries[key] = unit
+        entries.move_to_end(key)
+        while self._num_vectors > self.memory_size:
+            oldest_scope, oldest = next(iter(self._vectors.items()))
+            oldest.popitem(last=False)
+            self._num_vectors -= 1
+            if not oldest:
+                del self._vectors[oldest_scope]
+
     def clear(self) -> None:
         """Clear the entire cache."""
         self.storage.clear()
+        self._memory.clear()
+        self._vectors.clear()
+        self._num_vectors = 0
+
+
+def _normalize(vector: Sequence[float]) -> tuple[float, ...] | None:
+    """Scale *vector* to unit length; None for a zero vector."""
+    norm = math.sqrt(math.fsum(x * x for x in vector))
+    if norm == 0.0:
+        return None
+    return tuple(x / norm for x in vector)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from morgul.core.context.snapshot import capture_snapshot
+from morgul.core.context.snapshot import capture_snapshot, state_fingerprint
 from morgul.core.types.context import ProcessSnapshot
 
 
@@ -16,6 +16,27 @@ class ContextBuilder:
 
     def __init__(self, max_tokens: int = 4096):
         self.max_tokens = max_tokens
+        # (state fingerprint, snapshot, prompt text) from the last build_for_prompt()
+        self._prompt_cache: tuple[tuple, ProcessSnapshot, str] | None = None
+
+    def build_for_prompt(self, process) -> tuple[ProcessSnapshot, str]:
+        """Build and format the process context for a prompt.
+
+        The result is reused while :func:`state_fingerprint` is unchanged, so
+        handlers sharing this builder capture a paused process only once.
+        """
+        fingerprint = state_fingerprint(process)
+        cached = self._prompt_cache
+        if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+            return cached[1], cached[2]
+        snapshot = self.build(process)
+        text = self.format_for_prompt(snapshot)
+        self._prompt_cache = (fingerprint, snapshot, text) if fingerprint is not None else None
+        return snapshot, text
+
+    def invalidate(self) -> None:
+        """Drop the cached prompt context, e.g. after code that may have changed memory."""
+        self._prompt_cache = None
 
     def build(
         self,
@@ -126,8 +147,7 @@ class ContextBuilder:
 
         if snapshot.registers:
             parts.append("\n--- Registers ---")
-            for reg in snapshot.registers:
-                parts.append(f"  {reg.name} = 0x{reg.value:x}")
+            parts.append(self._format_registers(snapshot.registers))
 
         if snapshot.stack_trace:
             parts.append(f"\n--- Stack Trace (thread {snapshot.stack_trace.thread_id}) ---")
@@ -152,6 +172,11 @@ class ContextBuilder:
 
         return "\n".join(parts)
 
+    @staticmethod
+    def _format_registers(registers: list) -> str:
+        """Render the register table in one pass, one ``name = 0x..`` per line."""
+        return "\n".join([f"  {reg.name} = 0x{reg.value:x}" for reg in registers])
+
     def _format_variables(self, variables: list, parts: list, indent: int = 2) -> None:
         """Recursively format variables with struct field expansion."""
         prefix = " " * indent
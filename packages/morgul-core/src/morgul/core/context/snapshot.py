@@ -12,6 +12,31 @@ from morgul.core.types.context import (
 )
 
 
+def state_fingerprint(process) -> tuple | None:
+    """Return a cheap identity for the process's current paused state.
+
+    Combines the stop ID (bumped by LLDB whenever the process resumes) and the
+    bridge's ``state_epoch`` (bumped on resumes, memory writes, CLI commands
+    and expression evaluation made through the bridge) with the selected
+    thread and PC.  State changed behind the bridge's back, e.g. by calling
+    the raw ``lldb`` SB API directly, is not detected.  Returns None if the
+    bridge can't provide it.
+    """
+    try:
+        thread = process.selected_thread
+        frame = thread.selected_frame if thread is not None else None
+        return (
+            id(process),
+            process.stop_id,
+            process.state_epoch,
+            process.state,
+            thread.id if thread is not None else None,
+            frame.pc if frame is not None else None,
+        )
+    except Exception:
+        return None
+
+
 def capture_snapshot(
     process,
     frame=None,
@@ -25,6 +50,9 @@ def capture_snapshot(
         frame: Optional morgul.bridge.Frame. If None, uses selected thread's selected frame.
         include_memory_regions: Whether to capture memory region info (can be slow).
         disassembly_count: Number of instructions to disassemble from current PC.
+
+    Every value comes from the bridge, whose types are fixed, so the models
+    are built with ``model_construct`` and skip pydantic validation.
     """
     thread = process.selected_thread
     if frame is None and thread is not None:
@@ -33,10 +61,11 @@ def capture_snapshot(
     # Registers
     registers: list[RegisterInfo] = []
     if frame is not None:
-        for reg in frame.registers:
-            registers.append(
-                RegisterInfo(name=reg.name, value=reg.value, size=reg.size)
-            )
+        make_register = RegisterInfo.model_construct
+        registers = [
+            make_register(name=reg.name, value=reg.value, size=reg.size)
+            for reg in frame.registers
+        ]
 
     # Stack trace
     stack_trace: StackTrace | None = None
@@ -46,7 +75,7 @@ def capture_snapshot(
         for f in frames_list:
             line_entry = f.line_entry
             frame_infos.append(
-                FrameInfo(
+                FrameInfo.model_construct(
                     index=f.index,
                     function_name=f.function_name,
                     module_name=f.module_name,
@@ -55,7 +84,7 @@ def capture_snapshot(
                     line=line_entry.get("line") if line_entry else None,
                 )
             )
-        stack_trace = StackTrace(
+        stack_trace = StackTrace.model_construct(
             frames=frame_infos,
             thread_id=thread.id,
             thread_name=thread.name,
@@ -83,7 +112,7 @@ def capture_snapshot(
     if hasattr(process, "_target") and process._target is not None:
         for m in process._target.modules:
             modules.append(
-                ModuleDetail(
+                ModuleDetail.model_construct(
                     name=m.name,
                     path=m.path,
                     uuid=m.uuid,
@@ -98,7 +127,7 @@ def capture_snapshot(
 
         for region in get_memory_regions(process):
             memory_regions.append(
-                MemoryRegionInfo(
+                MemoryRegionInfo.model_construct(
                     start=region.start,
                     end=region.end,
                     readable=region.readable,
@@ -113,7 +142,7 @@ def capture_snapshot(
     if hasattr(process, "_target") and process._target is not None:
         target_triple = process._target.triple
 
-    return ProcessSnapshot(
+    return ProcessSnapshot.model_construct(
         registers=registers,
         stack_trace=stack_trace,
         memory_regions=memory_regions,
@@ -18,6 +18,7 @@ class ExecutionEventType(Enum):
     LLM_RESPONSE = "llm_response"
     CACHE_HIT = "cache_hit"
     LLM_SUB_QUERY = "llm_sub_query"
+    TIMEOUT = "timeout"
 
 
 class ExecutionEvent:
@@ -53,3 +54,7 @@ class ExecutionEvent:
 
 
 ExecutionEventCallback = Callable[[ExecutionEvent], None]
+
+
+def _noop(event: ExecutionEvent) -> None:
+    """Default execution callback: discard the event."""
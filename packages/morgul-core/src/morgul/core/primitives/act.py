@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING, Optional
 
 from morgul.core.context.builder import ContextBuilder
@@ -11,6 +12,7 @@ from morgul.core.events import (
     ExecutionEvent,
     ExecutionEventCallback,
     ExecutionEventType,
+    _noop,
 )
 from morgul.core.primitives.executor import PythonExecutor
 from morgul.core.translate.engine import TranslateEngine
@@ -47,18 +49,34 @@ class ActHandler:
         max_retries: int = 3,
         execution_callback: Optional[ExecutionEventCallback] = None,
         cache: ContentCache | None = None,
+        execution_timeout: Optional[float] = None,
+        executor_optimize: bool = False,
+        context_builder: ContextBuilder | None = None,
     ):
-        self.translate_engine = TranslateEngine(llm_client)
-        self.context_builder = ContextBuilder()
+        self._llm_client = llm_client
+        if context_builder is not None:
+            self.context_builder = context_builder
         self.executor = PythonExecutor(
             debugger, target, process,
             execution_callback=execution_callback,
+            timeout=execution_timeout,
+            optimize=2 if executor_optimize else -1,
         )
-        self._execution_callback = execution_callback
+        self._execution_callback = execution_callback or _noop
         self._cache = cache
         self.self_heal = self_heal
         self.max_retries = max_retries
 
+    @cached_property
+    def translate_engine(self) -> TranslateEngine:
+        """Translate engine, built on first ``act()`` rather than at construction."""
+        return TranslateEngine(self._llm_client)
+
+    @cached_property
+    def context_builder(self) -> ContextBuilder:
+        """Context builder, built on first ``act()`` rather than at construction."""
+        return ContextBuilder()
+
     def _get_code(self, response) -> str:
         """Extract executable code from a TranslateResponse.
 
@@ -85,8 +103,7 @@ class ActHandler:
 
     async def act(self, instruction: str, process: Process) -> ActResult:
         """Execute a natural language debugging instruction."""
-        snapshot = self.context_builder.build(process)
-        context_text = self.context_builder.format_for_prompt(snapshot)
+        snapshot, context_text = self.context_builder.build_for_prompt(process)
 
         # Check cache for a previously successful result
         if self._cache is not None:
@@ -102,7 +119,7 @@ class ActHandler:
             context_text=context_text,
         )
 
-        if self._execution_callback is not None and response.reasoning:
+        if response.reasoning:
             self._execution_callback(ExecutionEvent(
                 event_type=ExecutionEventType.LLM_RESPONSE,
                 metadata={"content": response.reasoning},
@@ -157,20 +174,19 @@ class ActHandler:
         for attempt in range(self.max_retries):
             logger.info("Self-heal attempt %d/%d", attempt + 1, self.max_retries)
 
-            if self._execution_callback is not None:
-                self._execution_callback(ExecutionEvent(
-                    event_type=ExecutionEventType.HEAL_START,
-                    code=failed_code,
-                    stderr=error,
-                    metadata={
-                        "attempt": attempt + 1,
-                        "max_retries": self.max_retries,
-                    },
-                ))
-
-            # Re-snapshot with current state
-            snapshot = self.context_builder.build(process)
-            context_text = self.context_builder.format_for_prompt(snapshot)
+            self._execution_callback(ExecutionEvent(
+                event_type=ExecutionEventType.HEAL_START,
+                code=failed_code,
+                stderr=error,
+                metadata={
+                    "attempt": attempt + 1,
+                    "max_retries": self.max_retries,
+                },
+            ))
+
+            # Re-snapshot with current state; the failed code may have changed it
+            self.context_builder.invalidate()
+            snapshot, context_text = self.context_builder.build_for_prompt(process)
 
             # Add error context to instruction
             heal_instruction = (
@@ -193,15 +209,14 @@ class ActHandler:
 
             stdout, stderr, succeeded = self.executor.execute(code)
 
-            if self._execution_callback is not None:
-                self._execution_callback(ExecutionEvent(
-                    event_type=ExecutionEventType.HEAL_END,
-                    code=code,
-                    stdout=stdout,
-                    stderr=stderr,
-                    succeeded=succeeded,
-                    metadata={"attempt": attempt + 1},
-                ))
+            self._execution_callback(ExecutionEvent(
+                event_type=ExecutionEventType.HEAL_END,
+                code=code,
+                stdout=stdout,
+                stderr=stderr,
+                succeeded=succeeded,
+                metadata={"attempt": attempt + 1},
+            ))
 
             if succeeded:
                 output = stdout
@@ -2,18 +2,38 @@
 
 from __future__ import annotations
 
+import binascii
+import collections
 import contextlib
-import io
+import ctypes
+import json
 import logging
+import math
 import re
+import struct
+import threading
 import time
 import traceback
+import types
 from typing import TYPE_CHECKING, Optional
 
+from morgul.bridge.memory import (
+    read_pointer,
+    read_string,
+    read_uint8,
+    read_uint16,
+    read_uint32,
+    read_uint32_array,
+    read_uint64,
+    read_uint64_array,
+    search_memory,
+)
+
 from morgul.core.events import (
     ExecutionEvent,
     ExecutionEventCallback,
     ExecutionEventType,
+    _noop,
 )
 
 if TYPE_CHECKING:
@@ -31,6 +51,7 @@ RESERVED_NAMES: frozenset[str] = frozenset({
     "debugger", "target", "process", "thread", "frame",
     "read_string", "read_pointer", "read_uint8", "read_uint16",
     "read_uint32", "read_uint64", "search_memory",
+    "read_uint32_array", "read_uint64_array",
     "struct", "binascii", "json", "re", "collections", "math",
     "print", "range", "len", "int", "str", "float", "bool",
     "list", "dict", "tuple", "set", "bytes", "bytearray",
@@ -49,8 +70,171 @@ REPL_SCAFFOLD_NAMES: frozenset[str] = frozenset({
     "DONE", "FINAL_VAR", "llm_query", "llm_query_batched",
 })
 
+# Names that user-supplied tools may not shadow.
+_FORBIDDEN_NAMES: frozenset[str] = RESERVED_NAMES | REPL_SCAFFOLD_NAMES
+
+# Maximum number of compiled code objects kept per executor (FIFO eviction).
+_CODE_CACHE_SIZE = 256
+
+# Seconds to wait for a timed-out worker to unwind after the injected exception.
+_TIMEOUT_GRACE = 1.0
+
+# Whitelisted builtins. They are exposed as namespace entries (so scaffold
+# protection restores them) and, per executor, as the ``__builtins__`` dict.
+_SAFE_BUILTINS: dict = {
+    "print": print,
+    "range": range,
+    "len": len,
+    "int": int,
+    "str": str,
+    "float": float,
+    "bool": bool,
+    "list": list,
+    "dict": dict,
+    "tuple": tuple,
+    "set": set,
+    "bytes": bytes,
+    "bytearray": bytearray,
+    "hex": hex,
+    "oct": oct,
+    "bin": bin,
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "sum": sum,
+    "sorted": sorted,
+    "reversed": reversed,
+    "enumerate": enumerate,
+    "zip": zip,
+    "map": map,
+    "filter": filter,
+    "isinstance": isinstance,
+    "type": type,
+    "hasattr": hasattr,
+    "getattr": getattr,
+    "setattr": setattr,
+    "repr": repr,
+    "chr": chr,
+    "ord": ord,
+    "format": format,
+    "round": round,
+    "pow": pow,
+    "divmod": divmod,
+    "hash": hash,
+    "id": id,
+    "dir": dir,
+    "vars": vars,
+    "globals": globals,
+    "locals": locals,
+    "any": any,
+    "all": all,
+    "next": next,
+    "iter": iter,
+    "slice": slice,
+    "Exception": Exception,
+    "ValueError": ValueError,
+    "TypeError": TypeError,
+    "KeyError": KeyError,
+    "IndexError": IndexError,
+    "AttributeError": AttributeError,
+    "RuntimeError": RuntimeError,
+    "StopIteration": StopIteration,
+}
+
+# Non-bridge namespace entries, shared by every executor via ``dict.copy()``.
+_STATIC_NAMESPACE: dict = {
+    # Memory utilities (pre-bound with process)
+    "read_string": read_string,
+    "read_pointer": read_pointer,
+    "read_uint8": read_uint8,
+    "read_uint16": read_uint16,
+    "read_uint32": read_uint32,
+    "read_uint64": read_uint64,
+    "search_memory": search_memory,
+    "read_uint32_array": read_uint32_array,
+    "read_uint64_array": read_uint64_array,
+    # Safe builtins
+    "struct": struct,
+    "binascii": binascii,
+    "json": json,
+    "re": re,
+    "collections": collections,
+    "math": math,
+    # Python builtins needed for code execution
+    **_SAFE_BUILTINS,
+    "True": True,
+    "False": False,
+    "None": None,
+}
+
+_MISSING = object()
+
+
+class _ExecutionTimeout(TimeoutError):
+    """Raised when executed code exceeds the executor's wall-clock cap."""
+
+
+class _InjectedTimeout(BaseException):
+    """Raised inside a timed-out worker thread to unwind the running code.
+
+    Derives from ``BaseException`` so ``except Exception`` in user code
+    cannot swallow it and keep the worker running.
+    """
+
+
+class _OutputOverflow(BaseException):
+    """Raised by a capture writer once output passes its limit.
+
+    Derives from ``BaseException`` so ``except Exception`` in user code
+    cannot swallow it and keep a runaway print loop going.
+    """
+
+
+class _ListWriter:
+    """Minimal text sink for stdout/stderr capture; chunks are joined once at the end.
+
+    Once more than *limit* characters have been written, further output is
+    dropped, bounding memory for runaway print loops.  Writes from the
+    *owner* thread (the one running the user code) then raise
+    ``_OutputOverflow`` to abort it; other threads printing while stdout is
+    redirected (the event loop, a display) are never interrupted.
+    """
+
+    __slots__ = ("chunks", "total", "limit", "owner")
+
+    def __init__(self, limit: int = MAX_OUTPUT_CHARS * 2) -> None:
+        self.chunks: list[str] = []
+        self.total = 0
+        self.limit = limit
+        self.owner = threading.get_ident()
+
+    def write(self, s: str) -> int:
+        self.total += len(s)
+        if self.total > self.limit:
+            if threading.get_ident() == self.owner:
+                raise _OutputOverflow()
+            return len(s)
+        self.chunks.append(s)
+        return len(s)
+
+    def flush(self) -> None:
+        pass
+
+
+def _format_user_traceback(exc: BaseException) -> str:
+    """Format *exc* keeping only frames from executed code (``<morgul-...>``).
+
+    Falls back to the full stack when no such frame exists, e.g. for a
+    ``SyntaxError`` raised by ``compile()``.
+    """
+    tb = traceback.TracebackException.from_exception(exc, lookup_lines=False)
+    user_frames = [f for f in tb.stack if f.filename.startswith("<morgul-")]
+    if user_frames:
+        tb.stack = traceback.StackSummary.from_list(user_frames)
+    return "".join(tb.format())
+
 
-def _truncate(text: str, limit: int = MAX_OUTPUT_CHARS) -> str:
+def _truncate(text: str, limit: int = MAX_OUTPUT_CHARS, /) -> str:
     if len(text) <= limit:
         return text
     return text[:limit] + f"\n... (truncated, {len(text)} chars total)"
@@ -62,6 +246,12 @@ class PythonExecutor:
     Used by both ``ActHandler`` (single code blocks from translate) and
     ``REPLAgent`` (multi-turn code execution).  Variables persist across
     ``execute()`` calls within the same executor instance.
+
+    When *timeout* is set, each ``execute()`` runs in a helper thread that is
+    interrupted once the wall-clock cap is exceeded.  If it cannot be stopped
+    (e.g. it is blocked in an LLDB call), the executor refuses further code
+    until that thread exits.
+    *optimize* is passed to ``compile()``; ``2`` strips asserts and docstrings.
     """
 
     def __init__(
@@ -70,132 +260,54 @@ class PythonExecutor:
         target: Target,
         process: Process,
         execution_callback: Optional[ExecutionEventCallback] = None,
+        timeout: Optional[float] = None,
+        optimize: int = -1,
     ):
         self.debugger = debugger
         self.target = target
         self.process = process
-        self._execution_callback = execution_callback
+        self._execution_callback = execution_callback or _noop
+        self.timeout = timeout
+        self.optimize = optimize
+        # (stop_id, state_epoch) seen by the last refresh(), or None.
+        self._last_state_key: Optional[tuple[int, int]] = None
+        self._stuck_worker: Optional[threading.Thread] = None
+        self._code_cache: dict[str, types.CodeType] = {}
         self.namespace = self._build_namespace()
-        self._scaffold: dict = {k: v for k, v in self.namespace.items() if k in RESERVED_NAMES}
+        self._scaffold: dict = {
+            k: self.namespace[k] for k in RESERVED_NAMES & self.namespace.keys()
+        }
+        # Snapshot of _scaffold.items() walked by _restore_scaffold after every
+        # exec; rebuilt whenever _scaffold changes.
+        self._scaffold_items: tuple = tuple(self._scaffold.items())
 
     def _build_namespace(self) -> dict:
         """Build the persistent execution namespace with bridge objects."""
-        import binascii
-        import collections
-        import json
-        import math
-        import struct
-
-        from morgul.bridge.memory import (
-            read_pointer,
-            read_string,
-            read_uint8,
-            read_uint16,
-            read_uint32,
-            read_uint64,
-            search_memory,
-        )
-
-        ns: dict = {
+        ns = _STATIC_NAMESPACE.copy()
+        thread = self.process.selected_thread if self.process is not None else None
+        ns.update({
             # Bridge objects (live debugger state)
             "debugger": self.debugger,
             "target": self.target,
             "process": self.process,
-            "thread": (
-                self.process.selected_thread
-                if self.process is not None
-                else None
-            ),
-            "frame": (
-                self.process.selected_thread.selected_frame
-                if self.process is not None
-                and self.process.selected_thread is not None
-                else None
-            ),
-            # Memory utilities (pre-bound with process)
-            "read_string": read_string,
-            "read_pointer": read_pointer,
-            "read_uint8": read_uint8,
-            "read_uint16": read_uint16,
-            "read_uint32": read_uint32,
-            "read_uint64": read_uint64,
-            "search_memory": search_memory,
-            # Safe builtins
-            "struct": struct,
-            "binascii": binascii,
-            "json": json,
-            "re": re,
-            "collections": collections,
-            "math": math,
-            # Python builtins needed for code execution
-            "print": print,
-            "range": range,
-            "len": len,
-            "int": int,
-            "str": str,
-            "float": float,
-            "bool": bool,
-            "list": list,
-            "dict": dict,
-            "tuple": tuple,
-            "set": set,
-            "bytes": bytes,
-            "bytearray": bytearray,
-            "hex": hex,
-            "oct": oct,
-            "bin": bin,
-            "abs": abs,
-            "min": min,
-            "max": max,
-            "sum": sum,
-            "sorted": sorted,
-            "reversed": reversed,
-            "enumerate": enumerate,
-            "zip": zip,
-            "map": map,
-            "filter": filter,
-            "isinstance": isinstance,
-            "type": type,
-            "hasattr": hasattr,
-            "getattr": getattr,
-            "setattr": setattr,
-            "repr": repr,
-            "chr": chr,
-            "ord": ord,
-            "format": format,
-            "round": round,
-            "pow": pow,
-            "divmod": divmod,
-            "hash": hash,
-            "id": id,
-            "dir": dir,
-            "vars": vars,
-            "globals": globals,
-            "locals": locals,
-            "any": any,
-            "all": all,
-            "next": next,
-            "iter": iter,
-            "slice": slice,
-            "Exception": Exception,
-            "ValueError": ValueError,
-            "TypeError": TypeError,
-            "KeyError": KeyError,
-            "IndexError": IndexError,
-            "AttributeError": AttributeError,
-            "RuntimeError": RuntimeError,
-            "StopIteration": StopIteration,
-            "True": True,
-            "False": False,
-            "None": None,
-            "__builtins__": {},
-        }
+            "thread": thread,
+            "frame": thread.selected_frame if thread is not None else None,
+            # Restricted builtins: no __import__/open/eval, but class
+            # statements need __build_class__ (and __name__ for __module__).
+            "__builtins__": {**_SAFE_BUILTINS, "__build_class__": __build_class__},
+            "__name__": "__morgul__",
+        })
         return ns
 
     def _restore_scaffold(self) -> None:
-        """Restore all scaffold entries in the namespace to their original values."""
-        for key, value in self._scaffold.items():
-            self.namespace[key] = value
+        """Restore scaffold entries that user code rebound or deleted.
+
+        User-defined names are left alone so variables persist across calls.
+        """
+        ns = self.namespace
+        for key, value in self._scaffold_items:
+            if ns.get(key, _MISSING) is not value:
+                ns[key] = value
 
     def update_scaffold(self, name: str, value: object) -> None:
         """Register a new scaffold entry (or update an existing one).
@@ -205,6 +317,7 @@ class PythonExecutor:
         """
         self.namespace[name] = value
         self._scaffold[name] = value
+        self._scaffold_items = tuple(self._scaffold.items())
 
     def inject_tools(self, tools: dict) -> list[tuple[str, str]]:
         """Inject custom tools into the namespace as scaffold-protected entries.
@@ -212,11 +325,13 @@ class PythonExecutor:
         Returns list of (name, description) for prompt integration.
         Raises ValueError if any name conflicts with reserved/scaffold names.
         """
-        forbidden = RESERVED_NAMES | REPL_SCAFFOLD_NAMES
+        conflicts = tools.keys() & _FORBIDDEN_NAMES
+        if conflicts:
+            name = min(conflicts)
+            raise ValueError(f"Tool name {name!r} conflicts with reserved name")
+        entries: dict = {}
         descriptions: list[tuple[str, str]] = []
         for name, value in tools.items():
-            if name in forbidden:
-                raise ValueError(f"Tool name {name!r} conflicts with reserved name")
             # Support rich format: {"tool": callable, "description": "..."}
             if isinstance(value, dict) and "tool" in value:
                 actual_value = value["tool"]
@@ -224,65 +339,171 @@ class PythonExecutor:
             else:
                 actual_value = value
                 desc = ""
-            self.update_scaffold(name, actual_value)
+            entries[name] = actual_value
             # Auto-describe callables without explicit description
             if not desc and callable(actual_value):
                 desc = f"callable({name})"
             descriptions.append((name, desc))
+        self.namespace.update(entries)
+        self._scaffold.update(entries)
+        self._scaffold_items = tuple(self._scaffold.items())
         return descriptions
 
     def _emit(self, event: ExecutionEvent) -> None:
-        """Emit an execution event if a callback is registered."""
-        if self._execution_callback is not None:
-            self._execution_callback(event)
+        """Emit an execution event to the registered callback."""
+        self._execution_callback(event)
+
+    def _compile(self, code: str) -> types.CodeType:
+        """Compile *code*, reusing the code object for previously seen sources."""
+        code_obj = self._code_cache.get(code)
+        if code_obj is None:
+            filename = f"<morgul-{hash(code) & 0xFFFFFFFFFFFFFFFF:x}>"
+            code_obj = compile(code, filename, "exec", optimize=self.optimize)
+            if len(self._code_cache) >= _CODE_CACHE_SIZE:
+                del self._code_cache[next(iter(self._code_cache))]
+            self._code_cache[code] = code_obj
+        return code_obj
+
+    def _exec_with_timeout(self, code: types.CodeType, writers: tuple[_ListWriter, ...]) -> None:
+        """Run ``exec()`` in a helper thread, bounded by ``self.timeout`` seconds.
+
+        The helper thread becomes the owner of the capture *writers*.
+        """
+        errors: list[BaseException] = []
+
+        def _worker() -> None:
+            owner = threading.get_ident()
+            for writer in writers:
+                writer.owner = owner
+            try:
+                exec(code, self.namespace)  # noqa: S102
+            except BaseException as exc:  # re-raised in the calling thread
+                errors.append(exc)
+
+        worker = threading.Thread(target=_worker, name="morgul-exec", daemon=True)
+        worker.start()
+        worker.join(self.timeout)
+        if worker.is_alive():
+            # Interrupts pure-Python loops; a worker blocked inside a C call
+            # (e.g. an LLDB request) only sees it once control returns.
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                ctypes.c_ulong(worker.ident), ctypes.py_object(_InjectedTimeout),
+            )
+            worker.join(_TIMEOUT_GRACE)
+            message = f"Execution timed out after {self.timeout}s"
+            if worker.is_alive():
+                # Still running (likely blocked in a C call): it would race the
+                # next exec on the same namespace and LLDB objects.
+                self._stuck_worker = worker
+                message += (
+                    "; the code is still running, so this executor refuses"
+                    " further execution until it exits"
+                )
+            raise _ExecutionTimeout(message)
+        if errors:
+            raise errors[0]
 
     def execute(self, code: str) -> tuple[str, str, bool]:
         """Execute *code* in the persistent namespace, capturing stdout/stderr.
 
-        Returns ``(stdout, stderr, succeeded)``.
+        Returns ``(stdout, stderr, succeeded)``.  Fails without running
+        *code* while a previously timed-out execution is still alive.
         """
-        self._emit(ExecutionEvent(
-            event_type=ExecutionEventType.CODE_START,
-            code=code,
-        ))
-
-        t0 = time.monotonic()
-        stdout_buf = io.StringIO()
-        stderr_buf = io.StringIO()
+        if self._stuck_worker is not None:
+            if self._stuck_worker.is_alive():
+                return "", (
+                    "RuntimeError: a previous execution timed out and is still"
+                    " running; this executor cannot run code until it exits\n"
+                ), False
+            self._stuck_worker = None
+
+        # Headless executors skip the clock reads and event objects entirely.
+        emit = self._execution_callback is not _noop
+        if emit:
+            self._emit(ExecutionEvent(
+                event_type=ExecutionEventType.CODE_START,
+                code=code,
+            ))
+            t0 = time.monotonic()
+
+        stdout_buf = _ListWriter()
+        stderr_buf = _ListWriter()
         succeeded = True
 
         try:
             with contextlib.redirect_stdout(stdout_buf), contextlib.redirect_stderr(stderr_buf):
-                exec(code, self.namespace)  # noqa: S102
-        except Exception:
+                code_obj = self._compile(code)
+                if self.timeout is None:
+                    exec(code_obj, self.namespace)  # noqa: S102
+                else:
+                    self._exec_with_timeout(code_obj, (stdout_buf, stderr_buf))
+        except _OutputOverflow:
+            succeeded = False
+            stderr_buf.chunks.append(
+                f"Output exceeded {stdout_buf.limit} characters; execution aborted\n"
+            )
+        except _ExecutionTimeout as exc:
+            succeeded = False
+            stderr_buf.chunks.append(f"TimeoutError: {exc}\n")
+            if emit:
+                self._emit(ExecutionEvent(
+                    event_type=ExecutionEventType.TIMEOUT,
+                    code=code,
+                    stderr=str(exc),
+                    succeeded=False,
+                    duration=time.monotonic() - t0,
+                ))
+        except Exception as exc:
             succeeded = False
-            stderr_buf.write(traceback.format_exc())
+            stderr_buf.chunks.append(_format_user_traceback(exc))
 
         self._restore_scaffold()
         self.refresh()
 
-        stdout = _truncate(stdout_buf.getvalue())
-        stderr = _truncate(stderr_buf.getvalue())
-
-        self._emit(ExecutionEvent(
-            event_type=ExecutionEventType.CODE_END,
-            code=code,
-            stdout=stdout,
-            stderr=stderr,
-            succeeded=succeeded,
-            duration=time.monotonic() - t0,
-        ))
+        # Output is almost always under the limit; only call _truncate when it isn't.
+        stdout = "".join(stdout_buf.chunks)
+        if len(stdout) > MAX_OUTPUT_CHARS:
+            stdout = _truncate(stdout)
+        stderr = "".join(stderr_buf.chunks)
+        if len(stderr) > MAX_OUTPUT_CHARS:
+            stderr = _truncate(stderr)
+
+        if emit:
+            self._emit(ExecutionEvent(
+                event_type=ExecutionEventType.CODE_END,
+                code=code,
+                stdout=stdout,
+                stderr=stderr,
+                succeeded=succeeded,
+                duration=time.monotonic() - t0,
+            ))
 
         return stdout, stderr, succeeded
 
     def refresh(self) -> None:
-        """Update thread/frame refs to reflect current debugger state."""
+        """Update thread/frame refs to reflect current debugger state.
+
+        Skipped while the process ``stop_id`` and ``state_epoch`` are both
+        unchanged: the process has not run, and no CLI command (e.g.
+        ``frame select``/``thread select``) or expression was issued since
+        the last refresh.
+        """
+        try:
+            state_key = (self.process.stop_id, self.process.state_epoch)
+        except Exception:
+            state_key = None
+        if state_key is not None and state_key == self._last_state_key:
+            return
         try:
             thread = self.process.selected_thread
-            self.namespace["thread"] = thread
-            if thread is not None:
-                self.namespace["frame"] = thread.selected_frame
-            else:
-                self.namespace["frame"] = None
+            frame = thread.selected_frame if thread is not None else None
         except Exception:
-            pass
+            return
+        self.namespace["thread"] = thread
+        self.namespace["frame"] = frame
+        # Both are scaffold names: keep _restore_scaffold() from putting the
+        # previous refs back after the next exec.
+        self._scaffold["thread"] = thread
+        self._scaffold["frame"] = frame
+        self._scaffold_items = tuple(self._scaffold.items())
+        self._last_state_key = state_key
@@ -29,9 +29,14 @@ class ExtractHandler:
     4. Validate with Pydantic, return typed result
     """
 
-    def __init__(self, llm_client: LLMClient, cache=None):
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        cache=None,
+        context_builder: ContextBuilder | None = None,
+    ):
         self.translate_engine = TranslateEngine(llm_client, cache=cache)
-        self.context_builder = ContextBuilder()
+        self.context_builder = context_builder or ContextBuilder()
 
     async def extract(
         self,
@@ -49,8 +54,7 @@ class ExtractHandler:
         Returns:
             An instance of response_model populated with extracted data.
         """
-        snapshot = self.context_builder.build(process)
-        context_text = self.context_builder.format_for_prompt(snapshot)
+        _, context_text = self.context_builder.build_for_prompt(process)
 
         result = await self.translate_engine.translate_extract(
             instruction=instruction,
@@ -23,9 +23,14 @@ class ObserveHandler:
     the state and returns a ranked list of suggested actions.
     """
 
-    def __init__(self, llm_client: LLMClient, cache=None):
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        cache=None,
+        context_builder: ContextBuilder | None = None,
+    ):
         self.translate_engine = TranslateEngine(llm_client, cache=cache)
-        self.context_builder = ContextBuilder()
+        self.context_builder = context_builder or ContextBuilder()
 
     async def observe(
         self,
@@ -41,8 +46,7 @@ class ObserveHandler:
         Returns:
             ObserveResult with ranked list of suggested actions.
         """
-        snapshot = self.context_builder.build(process)
-        context_text = self.context_builder.format_for_prompt(snapshot)
+        _, context_text = self.context_builder.build_for_prompt(process)
 
         result = await self.translate_engine.translate_observe(
             context_text=context_text,
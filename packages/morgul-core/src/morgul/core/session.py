@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
+from functools import cached_property
 from typing import List, Optional, Type, TypeVar
 
 from pydantic import BaseModel
@@ -11,6 +13,7 @@ from pydantic import BaseModel
 from morgul.core.agent.handler import AgentHandler
 from morgul.core.agent.repl import REPLAgent
 from morgul.core.agent.strategies import AgentStrategy
+from morgul.core.context.builder import ContextBuilder
 from morgul.core.primitives.act import ActHandler
 from morgul.core.primitives.extract import ExtractHandler
 from morgul.core.primitives.observe import ObserveHandler
@@ -76,10 +79,18 @@ class AsyncSession:
             base_url=config.llm.base_url,
             temperature=config.llm.temperature,
             max_tokens=config.llm.max_tokens,
+            enable_cache=config.llm.response_cache,
         )
         raw_client = create_llm_client(model_config)
         if llm_event_callback is not None:
-            self.llm_client = InstrumentedLLMClient(raw_client, llm_event_callback)
+            # Coalescing shares one sample among identical concurrent requests,
+            # which only matches what the caller asked for when it is
+            # deterministic or already served from the response cache.
+            self.llm_client = InstrumentedLLMClient(
+                raw_client,
+                llm_event_callback,
+                coalesce=model_config.temperature == 0 or model_config.enable_cache,
+            )
         else:
             self.llm_client = raw_client
 
@@ -94,10 +105,27 @@ class AsyncSession:
             storage = FileStorage(directory=config.cache.directory)
             self._cache = ContentCache(storage=storage)
 
-        # ActHandler is created lazily after target/process are available
+        # ActHandler is created lazily after target/process are available;
+        # extract/observe handlers are built on first use (see properties below).
         self._act_handler: ActHandler | None = None
-        self._extract_handler = ExtractHandler(llm_client=self.llm_client, cache=self._cache)
-        self._observe_handler = ObserveHandler(llm_client=self.llm_client, cache=self._cache)
+        # One builder shared by every handler that captures process context
+        self._context_builder = ContextBuilder()
+
+    @cached_property
+    def _extract_handler(self) -> ExtractHandler:
+        """Extract handler, built on first ``extract()``."""
+        return ExtractHandler(
+            llm_client=self.llm_client, cache=self._cache,
+            context_builder=self._context_builder,
+        )
+
+    @cached_property
+    def _observe_handler(self) -> ObserveHandler:
+        """Observe handler, built on first ``observe()``."""
+        return ObserveHandler(
+            llm_client=self.llm_client, cache=self._cache,
+            context_builder=self._context_builder,
+        )
 
     def _init_handlers(self) -> None:
         """Create handlers that require target/process."""
@@ -110,6 +138,9 @@ class AsyncSession:
             max_retries=self.config.healing.max_retries,
             execution_callback=self._execution_callback,
             cache=self._cache,
+            execution_timeout=self.config.execution_timeout,
+            executor_optimize=self.config.executor_optimize,
+            context_builder=self._context_builder,
         )
 
     def start(self, target_path: str, args: Optional[List[str]] = None) -> None:
@@ -147,11 +178,18 @@ class AsyncSession:
             raise RuntimeError("No target. Call start() or attach() first.")
         return self._target
 
+    def _invalidate_contexts(self) -> None:
+        """Drop the shared prompt context after code ran against the process."""
+        self._context_builder.invalidate()
+
     async def act(self, instruction: str) -> ActResult:
         """Execute a natural language debugging instruction."""
         if self._act_handler is None:
             raise RuntimeError("No process. Call start() or attach() first.")
-        return await self._act_handler.act(instruction, self.process)
+        try:
+            return await self._act_handler.act(instruction, self.process)
+        finally:
+            self._invalidate_contexts()
 
     async def extract(self, instruction: str, response_model: Type[T]) -> T:
         """Extract structured data from the current process state."""
@@ -217,12 +255,15 @@ class AsyncSession:
             async def tool_executor(name: str, args: dict) -> str:
                 return await handler._execute_tool(name, args)
 
-            agentic_result: AgenticResult = await agentic_client.run_agent(
-                task=task,
-                tools=AGENT_TOOLS,
-                tool_executor=tool_executor,
-                max_iterations=max_steps or agent_cfg.max_steps,
-            )
+            try:
+                agentic_result: AgenticResult = await agentic_client.run_agent(
+                    task=task,
+                    tools=AGENT_TOOLS,
+                    tool_executor=tool_executor,
+                    max_iterations=max_steps or agent_cfg.max_steps,
+                )
+            finally:
+                self._invalidate_contexts()
 
             # Convert AgenticResult into List[AgentStep] for compatibility.
             steps: List[AgentStep] = []
@@ -255,7 +296,10 @@ class AsyncSession:
             max_steps=max_steps or agent_cfg.max_steps,
             timeout=timeout or agent_cfg.timeout,
         )
-        return await handler.run(task)
+        try:
+            return await handler.run(task)
+        finally:
+            self._invalidate_contexts()
 
     def _repl_result_to_steps(self, repl_result: REPLResult) -> List[AgentStep]:
         """Convert REPLResult into List[AgentStep] for API compatibility."""
@@ -296,6 +340,21 @@ class AsyncSession:
         persistent: bool = False,
     ) -> REPLResult:
         """Run an RLM REPL agent with LLDB bridge access."""
+        try:
+            return await self._run_repl_agent(
+                task, max_iterations, log_path=log_path, tools=tools, persistent=persistent,
+            )
+        finally:
+            self._invalidate_contexts()
+
+    async def _run_repl_agent(
+        self,
+        task: str,
+        max_iterations: int,
+        log_path: Optional[str],
+        tools: Optional[dict],
+        persistent: bool,
+    ) -> REPLResult:
         if persistent:
             if self._persistent_repl is None:
                 self._persistent_repl = REPLAgent(
@@ -334,6 +393,21 @@ class AsyncSession:
             self._web_display.wait()
             self._web_display = None
 
+    async def flush(self) -> None:
+        """Wait for background cache writes to reach storage."""
+        if self._cache is not None:
+            await self._cache.flush()
+
+    async def _aclose_llm_client(self) -> None:
+        """Close the LLM client's pooled HTTP connections, if it has any."""
+        aclose = getattr(self.llm_client, "aclose", None)
+        if aclose is None:
+            return
+        try:
+            await aclose()
+        except Exception:
+            logger.warning("Failed to close LLM client", exc_info=True)
+
     def end(self) -> None:
         """End the session and clean up."""
         self._persistent_repl = None
@@ -358,6 +432,8 @@ class AsyncSession:
         return self
 
     async def __aexit__(self, *exc):
+        await self.flush()
+        await self._aclose_llm_client()
         self.end()
 
 
@@ -370,24 +446,44 @@ class Session:
             llm_event_callback=llm_event_callback,
             execution_callback=execution_callback,
         )
+        # Background loop that runs every coroutine; started lazily by _run().
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
 
     def _get_loop(self) -> asyncio.AbstractEventLoop:
         if self._loop is None or self._loop.is_closed():
-            try:
-                self._loop = asyncio.get_running_loop()
-            except RuntimeError:
-                self._loop = asyncio.new_event_loop()
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="morgul-session-loop", daemon=True,
+            )
+            self._loop_thread.start()
         return self._loop
 
     def _run(self, coro):
-        loop = self._get_loop()
-        if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(asyncio.run, coro)
-                return future.result()
-        return loop.run_until_complete(coro)
+        if self._loop_thread is not None and threading.current_thread() is self._loop_thread:
+            # Blocking here would wait on the very loop this thread runs.
+            coro.close()
+            raise RuntimeError(
+                "Sync Session methods cannot be called from the session's own "
+                "event loop (e.g. from a callback); use AsyncSession instead"
+            )
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+        try:
+            return future.result()
+        except BaseException:
+            # E.g. Ctrl+C: don't leave the call driving the debugger in the background.
+            future.cancel()
+            raise
+
+    def _stop_loop(self) -> None:
+        loop, thread = self._loop, self._loop_thread
+        self._loop = self._loop_thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+        loop.close()
 
     def start(self, target_path: str, args: Optional[List[str]] = None) -> None:
         self._async_session.start(target_path, args)
@@ -451,7 +547,12 @@ class Session:
         self._async_session.wait_for_dashboard()
 
     def end(self) -> None:
+        if self._loop is not None and not self._loop.is_closed():
+            self._run(self._async_session.flush())
+            # The client's connection pools belong to the background loop.
+            self._run(self._async_session._aclose_llm_client())
         self._async_session.end()
+        self._stop_loop()
 
     def __enter__(self):
         return self
@@ -2,37 +2,183 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
 import hashlib
+import inspect
 import json
 import logging
-from typing import TYPE_CHECKING
-
-from morgul.core.translate.prompts import ACT_PROMPT, EXTRACT_PROMPT, OBSERVE_PROMPT
+from enum import Enum
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Optional, Sequence, Union
+
+from morgul.core.translate.prompts import (
+    ACT_SYSTEM_PROMPT,
+    EXTRACT_SYSTEM_PROMPT,
+    OBSERVE_SYSTEM_PROMPT,
+    render_act,
+    render_extract,
+    render_observe,
+)
 from morgul.core.types.actions import Action, ObserveResult
 from morgul.core.types.context import ProcessSnapshot
 from morgul.core.types.llm import TranslateResponse
+from morgul.llm.structured import extract_json_object, pydantic_to_json_schema
+from morgul.llm.types import ChatMessage
 
 if TYPE_CHECKING:
     from pydantic import BaseModel
 
     from morgul.core.cache import ContentCache
     from morgul.llm import LLMClient
-    from morgul.llm.types import ChatMessage
 
 logger = logging.getLogger(__name__)
 
 
+class CacheStatus(str, Enum):
+    """Outcome of the most recent cached translate call."""
+
+    HIT_L1 = "HIT-L1"  # exact key match
+    HIT_L2 = "HIT-L2"  # semantic (embedding) match
+    MISS = "MISS"
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+class _ActionStreamScanner:
+    """Incrementally pull complete objects out of a streamed ``"actions": [...]``.
+
+    Text is appended with ``feed``; each call returns the action dicts that
+    became complete since the previous one.  An object that is still being
+    streamed fails to decode and is retried once more text arrives.
+    """
+
+    def __init__(self) -> None:
+        self.buffer = ""
+        self._pos = -1  # index inside the actions array, -1 until it is found
+        self._done = False
+
+    def feed(self, chunk: str) -> list[dict]:
+        self.buffer += chunk
+        if self._done:
+            return []
+        buf = self.buffer
+        if self._pos < 0:
+            key = buf.find('"actions"')
+            if key < 0:
+                return []
+            bracket = buf.find("[", key)
+            if bracket < 0:
+                return []
+            self._pos = bracket + 1
+
+        found: list[dict] = []
+        pos = self._pos
+        length = len(buf)
+        while pos < length:
+            ch = buf[pos]
+            if ch in " \t\r\n,":
+                pos += 1
+            elif ch == "]":
+                self._done = True
+                break
+            else:
+                try:
+                    item, pos = _JSON_DECODER.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    break  # incomplete; wait for more text
+                if isinstance(item, dict):
+                    found.append(item)
+        self._pos = pos
+        return found
+
+
+def _str_field(data: dict, name: str) -> str:
+    """``data[name]`` (default ``""``), raising TypeError unless it is a str."""
+    value = data.get(name, "")
+    if type(value) is not str:
+        raise TypeError(f"{name!r} must be a string, got {type(value).__name__}")
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def _schema_for(model: type[BaseModel]) -> str:
+    """JSON schema text for *model*, as embedded in the extract prompt."""
+    return json.dumps(pydantic_to_json_schema(model), indent=2)
+
+
+# Maps text to an embedding vector, synchronously or as an awaitable.
+Embedder = Callable[[str], Union[Sequence[float], Awaitable[Sequence[float]]]]
+
+
 class TranslateEngine:
     """Translates natural language instructions into Python code or LLDB commands."""
 
-    def __init__(self, llm_client: LLMClient, cache: ContentCache | None = None):
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        cache: ContentCache | None = None,
+        embedder: Optional[Embedder] = None,
+        semantic_threshold: float = 0.92,
+    ):
         self.llm = llm_client
         self._cache = cache
+        # Optional semantic lookup: paraphrased instructions against the exact
+        # same context reuse a cached result when cosine similarity is high.
+        self._embedder = embedder
+        self.semantic_threshold = semantic_threshold
+        # Per task, so concurrent calls (e.g. translate_observe_batch) each
+        # see their own outcome.
+        self._cache_status: contextvars.ContextVar[CacheStatus | None] = (
+            contextvars.ContextVar(f"morgul_cache_status_{id(self):x}", default=None)
+        )
+        # (context_text, digest) for the most recently keyed context
+        self._last_context: tuple[str, str] | None = None
+
+    @property
+    def last_cache_status(self) -> CacheStatus | None:
+        """Cache outcome of the last cached call made by the current task."""
+        return self._cache_status.get()
+
+    @last_cache_status.setter
+    def last_cache_status(self, status: CacheStatus | None) -> None:
+        self._cache_status.set(status)
 
     def _cache_key(self, *parts: str) -> str:
-        """Build a deterministic cache key from string parts."""
-        blob = "\n".join(parts).encode()
-        return hashlib.sha256(blob).hexdigest()[:16]
+        """Build a deterministic 16-hex-char cache key from string parts."""
+        h = hashlib.blake2b(digest_size=8)
+        for part in parts:
+            h.update(part.encode())
+            h.update(b"\n")
+        return h.hexdigest()
+
+    def _context_digest(self, context_text: str) -> str:
+        """Digest of *context_text* for use in cache keys.
+
+        Consecutive primitives in one step usually share the same context
+        string (often the same object, from ContextBuilder's prompt cache), so
+        the last digest is reused instead of rehashing the full text.
+        """
+        last = self._last_context
+        if last is not None and (last[0] is context_text or last[0] == context_text):
+            return last[1]
+        digest = self._cache_key(context_text)
+        self._last_context = (context_text, digest)
+        return digest
+
+    async def _embed(self, text: str) -> Sequence[float] | None:
+        """Embed *text* for semantic cache lookup; None when unavailable."""
+        if self._embedder is None or self._cache is None:
+            return None
+        try:
+            vector = self._embedder(text)
+            if inspect.isawaitable(vector):
+                vector = await vector
+            return vector
+        except Exception:
+            logger.warning("Embedding failed; skipping semantic cache", exc_info=True)
+            return None
 
     async def translate(
         self,
@@ -46,14 +192,12 @@ class TranslateEngine:
         (after execution succeeds) rather than here, because the LLM
         may produce code that fails and requires self-healing.
         """
-        from morgul.llm.types import ChatMessage
+        prompt = render_act(context_text, instruction)
 
-        prompt = ACT_PROMPT.format(
-            context=context_text,
-            instruction=instruction,
-        )
-
-        messages = [ChatMessage(role="user", content=prompt)]
+        messages = [
+            ChatMessage(role="system", content=ACT_SYSTEM_PROMPT),
+            ChatMessage(role="user", content=prompt),
+        ]
 
         try:
             response = await self.llm.chat_structured(
@@ -67,6 +211,52 @@ class TranslateEngine:
 
         return response
 
+    async def _cached_call(
+        self,
+        key_parts: tuple[str, ...],
+        scope_parts: tuple[str, ...],
+        embed_text: str | None,
+        validate: Callable[[Any], BaseModel],
+        produce: Callable[[], Awaitable[BaseModel]],
+    ):
+        """Run *produce* behind the two-tier cache.
+
+        L1 is the exact ``_cache_key(*key_parts)`` lookup.  On an L1 miss, L2
+        compares the embedding of *embed_text* against entries in the same
+        ``scope_parts`` scope; an L2 hit is written back under the L1 key so
+        the next identical call is exact.  ``last_cache_status`` records the
+        outcome.
+        """
+        if self._cache is None:
+            self.last_cache_status = CacheStatus.MISS
+            return await produce()
+
+        key = self._cache_key(*key_parts)
+        cached = await self._cache.aget_by_key(key)
+        if cached is not None:
+            logger.info("Cache hit: %s", key)
+            self.last_cache_status = CacheStatus.HIT_L1
+            return validate(cached)
+
+        scope = self._cache_key(*scope_parts)
+        vector = await self._embed(embed_text) if embed_text else None
+        if vector is not None:
+            cached = await self._cache.aget_by_embedding(
+                vector, self.semantic_threshold, scope,
+            )
+            if cached is not None:
+                logger.info("Semantic cache hit: %s", key)
+                self._cache.set_by_key_nowait(key, cached)
+                self.last_cache_status = CacheStatus.HIT_L2
+                return validate(cached)
+
+        result = await produce()
+        self._cache.set_by_key_nowait(key, result.model_dump())
+        if vector is not None:
+            self._cache.set_by_embedding(vector, key, scope)
+        self.last_cache_status = CacheStatus.MISS
+        return result
+
     async def translate_extract(
         self,
         instruction: str,
@@ -74,104 +264,176 @@ class TranslateEngine:
         response_model: type[BaseModel],
     ):
         """Translate an extraction instruction and return structured data."""
-        from morgul.llm.structured import pydantic_to_json_schema
-        from morgul.llm.types import ChatMessage
-
-        if self._cache is not None:
-            key = self._cache_key(instruction, context_text, response_model.__name__, "extract")
-            cached = self._cache.get_by_key(key)
-            if cached is not None:
-                logger.info("Cache hit: %s", key)
-                return response_model.model_validate(cached)
-
-        schema = pydantic_to_json_schema(response_model)
-        prompt = EXTRACT_PROMPT.format(
-            context=context_text,
-            instruction=instruction,
-            schema=json.dumps(schema, indent=2),
-        )
+        async def produce():
+            prompt = render_extract(context_text, instruction, _schema_for(response_model))
+            messages = [
+                ChatMessage(role="system", content=EXTRACT_SYSTEM_PROMPT),
+                ChatMessage(role="user", content=prompt),
+            ]
+            return await self.llm.chat_structured(
+                messages=messages,
+                response_model=response_model,
+            )
 
-        messages = [ChatMessage(role="user", content=prompt)]
-        result = await self.llm.chat_structured(
-            messages=messages,
-            response_model=response_model,
+        name = response_model.__name__
+        context_digest = self._context_digest(context_text)
+        return await self._cached_call(
+            (instruction, context_digest, name, "extract"),
+            (context_digest, name, "extract"),
+            instruction,
+            response_model.model_validate,
+            produce,
         )
 
-        if self._cache is not None:
-            self._cache.set_by_key(key, result.model_dump())
-
-        return result
-
     async def translate_observe(
         self,
         context_text: str,
         instruction: str | None = None,
     ) -> ObserveResult:
         """Generate observation-based action suggestions."""
-        from morgul.llm.types import ChatMessage
-
-        if self._cache is not None:
-            key = self._cache_key(context_text, instruction or "", "observe")
-            cached = self._cache.get_by_key(key)
-            if cached is not None:
-                logger.info("Cache hit: %s", key)
-                return ObserveResult.model_validate(cached)
-
-        instruction_section = ""
-        if instruction:
-            instruction_section = f"## User Focus\n{instruction}"
+        async def produce():
+            prompt = render_observe(context_text, instruction)
+            messages = [
+                ChatMessage(role="system", content=OBSERVE_SYSTEM_PROMPT),
+                ChatMessage(role="user", content=prompt),
+            ]
+
+            try:
+                return await self.llm.chat_structured(
+                    messages=messages,
+                    response_model=ObserveResult,
+                )
+            except Exception:
+                logger.exception("Observe translation failed, attempting raw chat")
+                raw_response = await self.llm.chat(messages=messages)
+                return self._parse_observe_response(raw_response.content)
+
+        context_digest = self._context_digest(context_text)
+        return await self._cached_call(
+            (context_digest, instruction or "", "observe"),
+            (context_digest, "observe"),
+            instruction,
+            ObserveResult.model_validate,
+            produce,
+        )
 
-        prompt = OBSERVE_PROMPT.format(
-            context=context_text,
-            instruction_section=instruction_section,
+    async def translate_observe_batch(
+        self,
+        items: Sequence[tuple[str, str | None]],
+    ) -> list[ObserveResult]:
+        """Run ``translate_observe`` for several (context_text, instruction) pairs.
+
+        Identical pairs share one call, and the distinct calls run
+        concurrently, so N observations cost roughly one LLM round trip.
+        Results are returned in input order.  Each call records its own
+        ``last_cache_status``; the caller's value is left unchanged.
+        """
+        slots: dict[tuple[str, str | None], list[int]] = {}
+        for index, item in enumerate(items):
+            slots.setdefault(item, []).append(index)
+
+        unique = list(slots)
+        results = await asyncio.gather(
+            *(
+                self.translate_observe(context_text, instruction)
+                for context_text, instruction in unique
+            )
         )
 
-        messages = [ChatMessage(role="user", content=prompt)]
+        ordered: list[ObserveResult] = [None] * len(items)  # type: ignore[list-item]
+        for item, result in zip(unique, results):
+            for index in slots[item]:
+                ordered[index] = result
+        return ordered
 
-        try:
-            result = await self.llm.chat_structured(
-                messages=messages,
-                response_model=ObserveResult,
-            )
-        except Exception:
-            logger.exception("Observe translation failed, attempting raw chat")
-            raw_response = await self.llm.chat(messages=messages)
-            result = self._parse_observe_response(raw_response.content)
+    async def translate_observe_stream(
+        self,
+        context_text: str,
+        instruction: str | None = None,
+    ) -> AsyncIterator[Action]:
+        """Yield observe suggestions as soon as each one has been generated.
 
+        Uses the client's optional ``chat_stream(messages)`` text-delta
+        iterator and scans the ``actions`` array as it arrives.  Clients
+        without streaming fall back to ``translate_observe``; they and exact
+        cache hits yield all their actions in one go.
+        """
+        chat_stream = getattr(self.llm, "chat_stream", None)
+        if chat_stream is None:
+            result = await self.translate_observe(context_text, instruction)
+            for action in result.actions:
+                yield action
+            return
+
+        key = None
         if self._cache is not None:
-            self._cache.set_by_key(key, result.model_dump())
-
-        return result
+            key = self._cache_key(self._context_digest(context_text), instruction or "", "observe")
+            cached = await self._cache.aget_by_key(key)
+            if cached is not None:
+                logger.info("Cache hit: %s", key)
+                self.last_cache_status = CacheStatus.HIT_L1
+                for action in ObserveResult.model_validate(cached).actions:
+                    yield action
+                return
+
+        messages = [
+            ChatMessage(role="system", content=OBSERVE_SYSTEM_PROMPT),
+            ChatMessage(role="user", content=render_observe(context_text, instruction)),
+        ]
+        scanner = _ActionStreamScanner()
+        streamed = 0
+        async for delta in chat_stream(messages=messages):
+            for item in scanner.feed(delta):
+                try:
+                    action = self._parse_action(item)
+                except (TypeError, AttributeError):
+                    continue
+                streamed += 1
+                yield action
+
+        result = self._parse_observe_response(scanner.buffer)
+        # Anything the scanner could not pick up (e.g. malformed framing)
+        for action in result.actions[streamed:]:
+            yield action
+        if key is not None and result.actions:
+            self._cache.set_by_key_nowait(key, result.model_dump())
+        self.last_cache_status = CacheStatus.MISS
+
+    @staticmethod
+    def _parse_action(data: dict) -> Action:
+        """Build an Action from one parsed ``actions`` entry.
+
+        The entry was just decoded from JSON, so its few fields are
+        type-checked here and pydantic validation is skipped.
+        """
+        return Action.model_construct(
+            command=_str_field(data, "command"),
+            code=_str_field(data, "code"),
+            description=_str_field(data, "description"),
+            args={},
+        )
 
     def _parse_raw_response(self, content: str) -> TranslateResponse:
         """Parse a raw LLM response into a TranslateResponse."""
         try:
-            start = content.find("{")
-            end = content.rfind("}") + 1
-            if start >= 0 and end > start:
-                data = json.loads(content[start:end])
-
+            data = extract_json_object(content)
+            if data is not None:
                 # New format: single "code" field
                 if "code" in data and isinstance(data["code"], str):
-                    return TranslateResponse(
+                    return TranslateResponse.model_construct(
+                        actions=[],
                         code=data["code"],
-                        reasoning=data.get("reasoning", ""),
+                        reasoning=_str_field(data, "reasoning"),
                     )
 
                 # Legacy format: "actions" list with "command" keys
-                actions = [
-                    Action(
-                        command=a.get("command", ""),
-                        code=a.get("code", ""),
-                        description=a.get("description", ""),
-                    )
-                    for a in data.get("actions", [])
-                ]
-                return TranslateResponse(
+                actions = [self._parse_action(a) for a in data.get("actions", [])]
+                return TranslateResponse.model_construct(
                     actions=actions,
-                    reasoning=data.get("reasoning", ""),
+                    code="",
+                    reasoning=_str_field(data, "reasoning"),
                 )
-        except (json.JSONDecodeError, KeyError, TypeError):
+        except (KeyError, TypeError, AttributeError):
             pass
 
         # Last resort: treat entire content as a single code block
@@ -183,23 +445,14 @@ class TranslateEngine:
     def _parse_observe_response(self, content: str) -> ObserveResult:
         """Parse a raw LLM response into an ObserveResult."""
         try:
-            start = content.find("{")
-            end = content.rfind("}") + 1
-            if start >= 0 and end > start:
-                data = json.loads(content[start:end])
-                actions = [
-                    Action(
-                        command=a.get("command", ""),
-                        code=a.get("code", ""),
-                        description=a.get("description", ""),
-                    )
-                    for a in data.get("actions", [])
-                ]
-                return ObserveResult(
+            data = extract_json_object(content)
+            if data is not None:
+                actions = [self._parse_action(a) for a in data.get("actions", [])]
+                return ObserveResult.model_construct(
                     actions=actions,
-                    description=data.get("description", ""),
+                    description=_str_field(data, "description"),
                 )
-        except (json.JSONDecodeError, KeyError, TypeError):
+        except (KeyError, TypeError, AttributeError):
             pass
 
         return ObserveResult(actions=[], description="Failed to parse observation")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from string import Formatter, Template
+
 # ── Shared bridge API reference ─────────────────────────────────────────
 # Documents the Python objects available in the execution namespace.
 # Used by ACT_PROMPT, OBSERVE_PROMPT, and AGENT_SYSTEM_PROMPT.
@@ -27,6 +29,8 @@ BRIDGE_API_REFERENCE = """\
 - `read_uint16(process, addr)` → int
 - `read_uint32(process, addr)` → int
 - `read_uint64(process, addr)` → int
+- `read_uint32_array(process, addr, count)` / `read_uint64_array(...)` → list[int] \
+(one read; prefer over looping `read_uint32`)
 - `search_memory(process, start, size, pattern)` → list[int]
 
 ### Stdlib Available
@@ -89,15 +93,14 @@ over `expression` when you just need to inspect a local variable.
 - Step one instruction: `thread step-inst` (`si`), `thread step-inst-over` (`ni`).
 """
 
-ACT_PROMPT = """\
+# ── act / extract / observe prompts ────────────────────────────────────
+# Each is split into a static *_SYSTEM_PROMPT (role, bridge reference, rules)
+# that is identical on every call, and a *_USER_PROMPT template holding the
+# per-call context and instruction.
+
+ACT_SYSTEM_PROMPT = """\
 You are an expert LLDB debugger assistant. Given a natural language instruction and the current \
 process state, write Python code to accomplish the task using the bridge API.
-
-## Current Process State
-{context}
-
-## Instruction
-{instruction}
 """ + BRIDGE_API_REFERENCE + """
 ## Rules
 - Write Python code that uses the bridge API objects (process, thread, frame, target, debugger)
@@ -113,19 +116,20 @@ Return a JSON object with:
 - "reasoning": brief explanation of the approach
 """
 
-EXTRACT_PROMPT = """\
-You are an expert LLDB debugger assistant. Given the current process state and an instruction, \
-extract the requested structured information.
-
+ACT_USER_PROMPT = """\
 ## Current Process State
 {context}
 
 ## Instruction
 {instruction}
+"""
 
-## Schema
-The response must conform to this JSON schema:
-{schema}
+# Single-message form (system part followed by the user template).
+ACT_PROMPT = ACT_SYSTEM_PROMPT + "\n" + ACT_USER_PROMPT
+
+EXTRACT_SYSTEM_PROMPT = """\
+You are an expert LLDB debugger assistant. Given the current process state and an instruction, \
+extract the requested structured information.
 
 ## Rules
 - Extract information directly from the provided process state
@@ -134,14 +138,24 @@ The response must conform to this JSON schema:
 - Return valid JSON matching the schema exactly
 """
 
-OBSERVE_PROMPT = """\
-You are an expert LLDB debugger assistant. Analyze the current process state and suggest \
-useful debugging actions the user might want to take.
-
+EXTRACT_USER_PROMPT = """\
 ## Current Process State
 {context}
 
-{instruction_section}
+## Instruction
+{instruction}
+
+## Schema
+The response must conform to this JSON schema:
+{schema}
+"""
+
+# Single-message form (system part followed by the user template).
+EXTRACT_PROMPT = EXTRACT_SYSTEM_PROMPT + "\n" + EXTRACT_USER_PROMPT
+
+OBSERVE_SYSTEM_PROMPT = """\
+You are an expert LLDB debugger assistant. Analyze the current process state and suggest \
+useful debugging actions the user might want to take.
 """ + BRIDGE_API_REFERENCE + """
 ## Rules
 - Suggest 3-8 relevant debugging actions ranked by usefulness
@@ -157,6 +171,16 @@ Return a JSON object with:
 - "description": overall summary of the observed state and why these actions are suggested
 """
 
+OBSERVE_USER_PROMPT = """\
+## Current Process State
+{context}
+
+{instruction_section}
+"""
+
+# Single-message form (system part followed by the user template).
+OBSERVE_PROMPT = OBSERVE_SYSTEM_PROMPT + "\n" + OBSERVE_USER_PROMPT
+
 AGENT_SYSTEM_PROMPT = """\
 You are Morgul, an autonomous LLDB debugger agent. You analyze programs by iterating through \
 observe → act → extract → reason cycles.
@@ -186,6 +210,61 @@ You have access to the following tools:
 - Maximum steps: {max_steps}
 """
 
+# ── Precompiled renderers ──────────────────────────────────────────────
+# The *_PROMPT constants above stay in str.format syntax for callers that
+# format them directly; the render_* helpers below substitute into
+# string.Template copies parsed once at import, instead of re-parsing the
+# format string on every call.
+
+
+def _to_template(fmt: str) -> Template:
+    """Convert a ``str.format`` template into an equivalent ``string.Template``."""
+    parts: list[str] = []
+    for literal, field, _spec, _conv in Formatter().parse(fmt):
+        parts.append(literal.replace("$", "$$"))
+        if field is not None:
+            parts.append("${" + field + "}")
+    return Template("".join(parts))
+
+
+_ACT_TEMPLATE = _to_template(ACT_USER_PROMPT)
+_EXTRACT_TEMPLATE = _to_template(EXTRACT_USER_PROMPT)
+_OBSERVE_TEMPLATE = _to_template(OBSERVE_USER_PROMPT)
+_AGENT_SYSTEM_TEMPLATE = _to_template(AGENT_SYSTEM_PROMPT)
+
+
+def render_act(context: str, instruction: str) -> str:
+    """Render the per-call user message for act()."""
+    return _ACT_TEMPLATE.substitute(context=context, instruction=instruction)
+
+
+def render_extract(context: str, instruction: str, schema: str) -> str:
+    """Render the per-call user message for extract()."""
+    return _EXTRACT_TEMPLATE.substitute(
+        context=context, instruction=instruction, schema=schema
+    )
+
+
+def render_observe(context: str, instruction: str | None = None) -> str:
+    """Render the per-call user message for observe()."""
+    instruction_section = f"## User Focus\n{instruction}" if instruction else ""
+    return _OBSERVE_TEMPLATE.substitute(
+        context=context, instruction_section=instruction_section
+    )
+
+
+def render_agent_system(
+    strategy: str, strategy_description: str, task: str, max_steps: int
+) -> str:
+    """Render the agent loop's system prompt."""
+    return _AGENT_SYSTEM_TEMPLATE.substitute(
+        strategy=strategy,
+        strategy_description=strategy_description,
+        task=task,
+        max_steps=max_steps,
+    )
+
+
 STRATEGY_DESCRIPTIONS = {
     "depth-first": (
         "Follow the most promising lead deeply before exploring alternatives. "
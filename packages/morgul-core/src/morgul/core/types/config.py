@@ -16,6 +16,7 @@ class LLMConfig(BaseModel):
     base_url: Optional[str] = None
     temperature: float = 0.7
     max_tokens: int = 4096
+    response_cache: bool = False
 
 
 class CacheConfig(BaseModel):
@@ -57,6 +58,10 @@ class MorgulConfig(BaseModel):
     verbose: bool = False
     visible: bool = False
     self_heal: bool = True
+    execution_timeout: Optional[float] = None
+    """Wall-clock cap in seconds for each act() code execution (None = unbounded)."""
+    executor_optimize: bool = False
+    """Compile act() code with ``optimize=2``, dropping asserts and docstrings."""
     dashboard_port: Optional[int] = None
 
     @model_validator(mode="after")
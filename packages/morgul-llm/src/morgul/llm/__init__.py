@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from .client import LLMClient, create_llm_client
+from .client import (
+    LLMClient,
+    StreamingLLMClient,
+    chat_many,
+    chat_structured_many,
+    create_llm_client,
+)
 from .agentic import AgenticClient, AgenticEvent, AgenticResult, ToolExecutor, create_agentic_client
 from .events import InstrumentedLLMClient, LLMEvent, LLMEventCallback
 from .types import ChatMessage, LLMResponse, ModelConfig, ToolCall, ToolDefinition, ToolResult, Usage
@@ -27,10 +33,13 @@ def __getattr__(name: str):  # noqa: N807
 
 __all__ = [
     "LLMClient",
+    "StreamingLLMClient",
     "AnthropicClient",
     "OpenAIClient",
     "OllamaClient",
     "create_llm_client",
+    "chat_many",
+    "chat_structured_many",
     # Agentic backends
     "AgenticClient",
     "AgenticEvent",
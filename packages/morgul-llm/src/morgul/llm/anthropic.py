@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from pydantic import BaseModel
 
-from .structured import create_extraction_tool, parse_structured_response
+from .cache import ResponseCache, ToolFormatCache
+from .structured import (
+    create_extraction_tool,
+    parse_structured_response,
+    validate_structured_data,
+)
+from .transport import http_client_options
 from .types import (
+    _ZERO_USAGE,
     ChatMessage,
     LLMResponse,
     ModelConfig,
@@ -36,7 +42,14 @@ class AnthropicClient:
             kwargs["api_key"] = config.api_key
         if config.base_url is not None:
             kwargs["base_url"] = config.base_url
+        kwargs["http_client"] = anthropic.DefaultAsyncHttpxClient(
+            **http_client_options(config)
+        )
         self._client = anthropic.AsyncAnthropic(**kwargs)
+        self._response_cache: Optional[ResponseCache] = (
+            ResponseCache(config.cache_size) if config.enable_cache else None
+        )
+        self._tool_cache = ToolFormatCache(self._tool_to_anthropic)
 
     # ------------------------------------------------------------------
     # Public interface
@@ -45,21 +58,17 @@ class AnthropicClient:
     async def chat(
         self,
         messages: List[ChatMessage],
-        tools: Optional[List[ToolDefinition]] = None,
+        tools: Optional[Sequence[ToolDefinition]] = None,
     ) -> LLMResponse:
         """Send *messages* to the Anthropic API and return a unified response."""
-        system_prompt, api_messages = self._to_anthropic_messages(messages)
+        kwargs = self._request_kwargs(messages, tools)
 
-        kwargs: Dict[str, Any] = {
-            "model": self._config.model_name,
-            "max_tokens": self._config.max_tokens,
-            "temperature": self._config.temperature,
-            "messages": api_messages,
-        }
-        if system_prompt is not None:
-            kwargs["system"] = system_prompt
-        if tools:
-            kwargs["tools"] = [self._tool_to_anthropic(t) for t in tools]
+        cache_key: Optional[str] = None
+        if self._response_cache is not None:
+            cache_key = self._response_cache.key_for(kwargs)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         try:
             response = await self._client.messages.create(**kwargs)
@@ -68,58 +77,128 @@ class AnthropicClient:
                 f"Anthropic API call failed: {exc}"
             ) from exc
 
-        return self._from_anthropic_response(response)
+        result = self._from_anthropic_response(response, self._config.keep_raw)
+        if cache_key is not None:
+            self._response_cache.put(cache_key, result)
+        return result
+
+    async def chat_stream(
+        self,
+        messages: List[ChatMessage],
+        tools: Optional[Sequence[ToolDefinition]] = None,
+    ) -> AsyncIterator[str]:
+        """Like ``chat`` but yield the response text as it is generated.
+
+        Only text deltas are yielded; use ``chat`` when tool calls are
+        needed.  The completed message still populates the response cache.
+        """
+        kwargs = self._request_kwargs(messages, tools)
+
+        cache_key: Optional[str] = None
+        if self._response_cache is not None:
+            cache_key = self._response_cache.key_for(kwargs)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                if cached.content:
+                    yield cached.content
+                return
+
+        try:
+            async with self._client.messages.stream(**kwargs) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                final = await stream.get_final_message()
+        except Exception as exc:
+            raise RuntimeError(
+                f"Anthropic API call failed: {exc}"
+            ) from exc
+
+        if cache_key is not None:
+            self._response_cache.put(
+                cache_key, self._from_anthropic_response(final, self._config.keep_raw)
+            )
 
     async def chat_structured(
         self,
         messages: List[ChatMessage],
         response_model: Type[T],
-        tools: Optional[List[ToolDefinition]] = None,
+        tools: Optional[Sequence[ToolDefinition]] = None,
     ) -> T:
         """Force structured output by injecting a schema tool, then parse the result."""
         extraction_tool = create_extraction_tool(response_model)
-        all_tools = list(tools or []) + [extraction_tool]
+        all_tools = (*tools, extraction_tool) if tools else (extraction_tool,)
 
         response = await self.chat(messages, tools=all_tools)
 
         # If the model called the extraction tool, use its arguments directly
         if response.tool_calls:
-            for tc in response.tool_calls:
-                if tc.name == extraction_tool.name:
-                    return parse_structured_response(
-                        json.dumps(tc.arguments), response_model
-                    )
+            tc = next(
+                (tc for tc in response.tool_calls if tc.name == extraction_tool.name),
+                None,
+            )
+            if tc is not None:
+                return validate_structured_data(tc.arguments, response_model)
 
         # Fallback: try to parse content directly
         return parse_structured_response(response.content, response_model)
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self._client.close()
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    def _request_kwargs(
+        self,
+        messages: List[ChatMessage],
+        tools: Optional[Sequence[ToolDefinition]],
+    ) -> Dict[str, Any]:
+        """Build the ``messages.create`` / ``messages.stream`` arguments."""
+        system_prompt, api_messages = self._to_anthropic_messages(messages)
+
+        kwargs: Dict[str, Any] = {
+            "model": self._config.model_name,
+            "max_tokens": self._config.max_tokens,
+            "temperature": self._config.temperature,
+            "messages": api_messages,
+        }
+        if system_prompt is not None:
+            kwargs["system"] = system_prompt
+        if tools:
+            kwargs["tools"] = self._tools_to_anthropic(tools)
+        return kwargs
+
+    def _tools_to_anthropic(self, tools: Sequence[ToolDefinition]) -> List[Dict[str, Any]]:
+        """Convert *tools*, reusing dicts for ToolDefinitions seen before."""
+        return self._tool_cache.convert_all(tools)
+
     @staticmethod
     def _to_anthropic_messages(
         messages: List[ChatMessage],
-    ) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    ) -> Tuple[Optional[Union[str, List[Dict[str, Any]]]], List[Dict[str, Any]]]:
         """Convert ``ChatMessage`` list to Anthropic format.
 
         Returns ``(system_prompt, api_messages)``.  Anthropic expects
         the system prompt as a separate parameter rather than as a message.
+        Messages with ``cache_control`` become text blocks carrying an
+        ephemeral ``cache_control`` marker, so the system prompt is then a
+        list of blocks rather than a string.
         """
-        system_prompt: Optional[str] = None
+        system_msgs: List[ChatMessage] = []
         api_messages: List[Dict[str, Any]] = []
+        append = api_messages.append
+        text_block = AnthropicClient._text_block
 
         for msg in messages:
-            if msg.role == "system":
-                # Anthropic only supports a single system prompt; concatenate
-                if system_prompt is None:
-                    system_prompt = msg.content
-                else:
-                    system_prompt += "\n\n" + msg.content
+            role = msg.role
+            if role == "system":
+                system_msgs.append(msg)
                 continue
 
-            if msg.role == "tool":
-                api_messages.append(
+            if role == "tool":
+                append(
                     {
                         "role": "user",
                         "content": [
@@ -149,43 +228,76 @@ class AnthropicClient:
                         }
                     )
                 content = blocks
+            elif msg.cache_control:
+                content = [text_block(msg)]
             else:
                 content = msg.content
 
-            api_messages.append({"role": msg.role, "content": content})
+            append({"role": role, "content": content})
+
+        if not system_msgs:
+            return None, api_messages
+        if any(m.cache_control for m in system_msgs):
+            return [text_block(m) for m in system_msgs], api_messages
+        # Anthropic only supports a single system prompt; concatenate once
+        return "\n\n".join(m.content for m in system_msgs), api_messages
 
-        return system_prompt, api_messages
+    @staticmethod
+    def _text_block(msg: ChatMessage) -> Dict[str, Any]:
+        """Build a text content block, carrying the message's cache marker."""
+        block: Dict[str, Any] = {"type": "text", "text": msg.content}
+        if msg.cache_control:
+            block["cache_control"] = {"type": msg.cache_control}
+        return block
 
     @staticmethod
-    def _from_anthropic_response(response: Any) -> LLMResponse:
+    def _from_anthropic_response(response: Any, keep_raw: bool = True) -> LLMResponse:
         """Convert an Anthropic ``Message`` object to a unified ``LLMResponse``."""
-        text_parts: List[str] = []
-        tool_calls: List[ToolCall] = []
+        # Most responses carry exactly one text block, so only build a list
+        # (and join) when a second one shows up.
+        first_text: Optional[str] = None
+        extra_texts: Optional[List[str]] = None
+        tool_calls: Optional[List[ToolCall]] = None
 
         for block in response.content:
             if block.type == "text":
-                text_parts.append(block.text)
+                if first_text is None:
+                    first_text = block.text
+                elif extra_texts is None:
+                    extra_texts = [block.text]
+                else:
+                    extra_texts.append(block.text)
             elif block.type == "tool_use":
-                tool_calls.append(
-                    ToolCall(
-                        id=block.id,
-                        name=block.name,
-                        arguments=block.input,
-                    )
+                call = ToolCall(
+                    id=block.id,
+                    name=block.name,
+                    arguments=block.input,
                 )
+                if tool_calls is None:
+                    tool_calls = [call]
+                else:
+                    tool_calls.append(call)
+
+        if extra_texts is None:
+            content = first_text or ""
+        else:
+            content = first_text + "\n" + "\n".join(extra_texts)
 
         usage = None
-        if hasattr(response, "usage") and response.usage is not None:
-            usage = Usage(
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
-            )
+        raw_usage = getattr(response, "usage", None)
+        if raw_usage is not None:
+            input_tokens = raw_usage.input_tokens
+            output_tokens = raw_usage.output_tokens
+            if input_tokens or output_tokens:
+                usage = Usage(input_tokens=input_tokens, output_tokens=output_tokens)
+            else:
+                usage = _ZERO_USAGE
 
         return LLMResponse(
-            content="\n".join(text_parts),
-            tool_calls=tool_calls or None,
+            content=content,
+            tool_calls=tool_calls,
             usage=usage,
-            raw=response,
+            raw=response if keep_raw else None,
         )
 
     @staticmethod
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .types import ToolDefinition
+
+
+class ResponseCache:
+    """In-memory LRU of provider responses, keyed by the exact request.
+
+    Clients build the keyword arguments for their SDK call, derive a key with
+    ``key_for`` and consult the cache before dispatching.  Only identical
+    requests (model, messages, tools and sampling options) hit.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+
+    @staticmethod
+    def key_for(request: Dict[str, Any]) -> str:
+        """Hash the SDK request arguments into a cache key."""
+        blob = json.dumps(request, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for *key*, marking it recently used."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Cache *value* under *key*, evicting the least recently used entry."""
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ToolFormatCache:
+    """Per-client memo of provider-format tool dicts, keyed by ToolDefinition identity.
+
+    Agent loops pass the same ToolDefinition objects on every iteration, so
+    each is converted by *convert* once.  Entries hold the tool itself, so
+    its ``id`` cannot be reused while cached; the map is dropped once it
+    reaches *maxsize* entries.
+    """
+
+    def __init__(
+        self,
+        convert: Callable[[ToolDefinition], Dict[str, Any]],
+        maxsize: int = 256,
+    ) -> None:
+        self._convert = convert
+        self.maxsize = maxsize
+        self._entries: Dict[int, Tuple[ToolDefinition, Dict[str, Any]]] = {}
+
+    def convert_all(self, tools: Sequence[ToolDefinition]) -> List[Dict[str, Any]]:
+        """Return the provider-format dicts for *tools*, in order."""
+        entries = self._entries
+        converted: List[Dict[str, Any]] = []
+        for tool in tools:
+            entry = entries.get(id(tool))
+            if entry is None or entry[0] is not tool:
+                if len(entries) >= self.maxsize:
+                    entries.clear()
+                entry = (tool, self._convert(tool))
+                entries[id(tool)] = entry
+            converted.append(entry[1])
+        return converted
+
+    def __len__(self) -> int:
+        return len(self._entries)
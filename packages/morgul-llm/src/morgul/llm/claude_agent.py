@@ -24,6 +24,31 @@ _LLDB_SYSTEM_CONTEXT = (
 
 _MCP_SERVER_NAME = "morgul-lldb"
 
+# JSON Schema primitive type -> Python type hint for SDK tool parameters.
+_JSON_TYPE_MAP: Dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+}
+
+_sdk: Any = None
+
+
+def _load_sdk() -> Any:
+    """Import ``claude_agent_sdk`` once and cache the module."""
+    global _sdk
+    if _sdk is None:
+        try:
+            import claude_agent_sdk
+        except ImportError:
+            raise ImportError(
+                "claude-agent-sdk is required for the 'claude-code' agentic provider. "
+                "Install it with: pip install claude-agent-sdk"
+            )
+        _sdk = claude_agent_sdk
+    return _sdk
+
 
 def _build_mcp_tools(
     tools: List[ToolDefinition],
@@ -35,27 +60,20 @@ def _build_mcp_tools(
     *results_log* is a shared list that each handler appends to so callers can
     capture tool results even when the SDK doesn't surface ToolResultBlocks.
     """
-    try:
-        from claude_agent_sdk import tool as sdk_tool
-    except ImportError:
-        raise ImportError(
-            "claude-agent-sdk is required for the 'claude-code' agentic provider. "
-            "Install it with: pip install claude-agent-sdk"
-        )
+    sdk_tool = _load_sdk().tool
+    type_for = _JSON_TYPE_MAP.get
+    log_result = results_log.append
 
     mcp_tools = []
     for tdef in tools:
         # Build the parameter type hints dict from JSON Schema properties.
-        props = tdef.parameters.get("properties", {})
+        props = tdef.parameters.get("properties")
         param_types: Dict[str, type] = {}
-        for pname, pschema in props.items():
-            json_type = pschema.get("type", "string")
-            param_types[pname] = {
-                "string": str,
-                "integer": int,
-                "number": float,
-                "boolean": bool,
-            }.get(json_type, str)
+        if props:
+            param_types = {
+                pname: type_for(pschema.get("type", "string"), str)
+                for pname, pschema in props.items()
+            }
 
         # Capture tdef.name in closure.
         _tool_name = tdef.name
@@ -63,7 +81,9 @@ def _build_mcp_tools(
         @sdk_tool(_tool_name, tdef.description, param_types)
         async def _handler(args: dict, __name=_tool_name) -> dict:
             result = await tool_executor(__name, args)
-            results_log.append({"name": __name, "arguments": dict(args), "result": result})
+            # The SDK hands each call a freshly decoded dict and executors only
+            # read from it, so log it as-is rather than copying.
+            log_result({"name": __name, "arguments": args, "result": result})
             return {"content": [{"type": "text", "text": result}]}
 
         mcp_tools.append(_handler)
@@ -95,54 +115,14 @@ class ClaudeAgentClient:
         max_iterations: int = 50,
     ) -> AgenticResult:
         """Run Claude Agent SDK, routing tool calls through tool_executor."""
-        try:
-            from claude_agent_sdk import (
-                AssistantMessage,
-                ClaudeAgentOptions,
-                ClaudeSDKClient,
-                TextBlock,
-                ToolResultBlock,
-                ToolUseBlock,
-                create_sdk_mcp_server,
-            )
-        except ImportError:
-            raise ImportError(
-                "claude-agent-sdk is required for the 'claude-code' agentic provider. "
-                "Install it with: pip install claude-agent-sdk"
-            )
-
         # Shared log populated by MCP tool handlers so we always have results.
         tool_calls_log: List[Dict[str, Any]] = []
-
-        mcp_tools = _build_mcp_tools(tools, tool_executor, tool_calls_log)
-        server = create_sdk_mcp_server(
-            name=_MCP_SERVER_NAME,
-            version="1.0.0",
-            tools=mcp_tools,
-        )
-
-        # Build allowed_tools list: mcp__<server>__<tool_name>
-        allowed_tools = [f"mcp__{_MCP_SERVER_NAME}__{t.name}" for t in tools]
-
-        options = ClaudeAgentOptions(
-            system_prompt=_LLDB_SYSTEM_CONTEXT,
-            max_turns=max_iterations,
-            mcp_servers={_MCP_SERVER_NAME: server},
-            allowed_tools=allowed_tools,
-        )
-        if self.model:
-            options.model = self.model
+        options = self._make_options(tools, tool_executor, max_iterations, tool_calls_log)
 
         result_text = ""
-
-        async with ClaudeSDKClient(options=options) as client:
-            await client.query(task)
-
-            async for message in client.receive_response():
-                if isinstance(message, AssistantMessage):
-                    for block in message.content:
-                        if isinstance(block, TextBlock):
-                            result_text = block.text
+        async for event in self._events(task, options, tool_calls_log):
+            if event.type == "done":
+                result_text = event.data
 
         return AgenticResult(
             result=result_text or "Agent completed without explicit result.",
@@ -158,34 +138,37 @@ class ClaudeAgentClient:
         max_iterations: int = 50,
     ) -> AsyncIterator[AgenticEvent]:
         """Stream events from Claude Agent SDK."""
-        try:
-            from claude_agent_sdk import (
-                AssistantMessage,
-                ClaudeAgentOptions,
-                ClaudeSDKClient,
-                TextBlock,
-                ToolResultBlock,
-                ToolUseBlock,
-                create_sdk_mcp_server,
-            )
-        except ImportError:
-            raise ImportError(
-                "claude-agent-sdk is required for the 'claude-code' agentic provider. "
-                "Install it with: pip install claude-agent-sdk"
-            )
-
         tool_calls_log: List[Dict[str, Any]] = []
+        options = self._make_options(tools, tool_executor, max_iterations, tool_calls_log)
+
+        async for event in self._events(task, options, tool_calls_log):
+            yield event
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _make_options(
+        self,
+        tools: List[ToolDefinition],
+        tool_executor: ToolExecutor,
+        max_iterations: int,
+        tool_calls_log: List[Dict[str, Any]],
+    ) -> Any:
+        """Build ``ClaudeAgentOptions`` with Morgul's tools on an in-process MCP server."""
+        sdk = _load_sdk()
 
         mcp_tools = _build_mcp_tools(tools, tool_executor, tool_calls_log)
-        server = create_sdk_mcp_server(
+        server = sdk.create_sdk_mcp_server(
             name=_MCP_SERVER_NAME,
             version="1.0.0",
             tools=mcp_tools,
         )
 
+        # Build allowed_tools list: mcp__<server>__<tool_name>
         allowed_tools = [f"mcp__{_MCP_SERVER_NAME}__{t.name}" for t in tools]
 
-        options = ClaudeAgentOptions(
+        options = sdk.ClaudeAgentOptions(
             system_prompt=_LLDB_SYSTEM_CONTEXT,
             max_turns=max_iterations,
             mcp_servers={_MCP_SERVER_NAME: server},
@@ -193,11 +176,24 @@ class ClaudeAgentClient:
         )
         if self.model:
             options.model = self.model
+        return options
+
+    @staticmethod
+    async def _events(
+        task: str,
+        options: Any,
+        tool_calls_log: List[Dict[str, Any]],
+    ) -> AsyncIterator[AgenticEvent]:
+        """Run one SDK session and translate its messages into AgenticEvents."""
+        sdk = _load_sdk()
+        AssistantMessage = sdk.AssistantMessage
+        TextBlock = sdk.TextBlock
+        ToolUseBlock = sdk.ToolUseBlock
 
         result_text = ""
         last_log_idx = 0
 
-        async with ClaudeSDKClient(options=options) as client:
+        async with sdk.ClaudeSDKClient(options=options) as client:
             await client.query(task)
 
             async for message in client.receive_response():
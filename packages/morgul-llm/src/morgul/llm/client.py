@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from typing import List, Optional, Protocol, Type, TypeVar, runtime_checkable
+import asyncio
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Protocol,
+    Type,
+    TypeVar,
+    runtime_checkable,
+)
 
 from pydantic import BaseModel
 
@@ -31,6 +42,76 @@ class LLMClient(Protocol):
         ...
 
 
+@runtime_checkable
+class StreamingLLMClient(LLMClient, Protocol):
+    """An ``LLMClient`` that can also stream response text.
+
+    Optional: callers probe for ``chat_stream`` and fall back to ``chat``.
+    """
+
+    def chat_stream(
+        self,
+        messages: List[ChatMessage],
+        tools: Optional[List[ToolDefinition]] = None,
+    ) -> AsyncIterator[str]:
+        """Yield the response text incrementally as it is generated."""
+        ...
+
+
+R = TypeVar("R")
+
+
+async def _gather_bounded(
+    call: Callable[[List[ChatMessage]], Awaitable[R]],
+    conversations: List[List[ChatMessage]],
+    max_concurrency: int,
+) -> List[R]:
+    """Run *call* over *conversations* with at most *max_concurrency* in flight."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(messages: List[ChatMessage]) -> R:
+        async with semaphore:
+            return await call(messages)
+
+    return list(await asyncio.gather(*(bounded(m) for m in conversations)))
+
+
+async def chat_many(
+    client: LLMClient,
+    conversations: List[List[ChatMessage]],
+    tools: Optional[List[ToolDefinition]] = None,
+    max_concurrency: int = 8,
+) -> List[LLMResponse]:
+    """Send several independent conversations through *client* concurrently.
+
+    At most *max_concurrency* requests are in flight at once so a large batch
+    doesn't exhaust the client's connection pool.  Responses are returned in
+    the same order as *conversations*; the first failure is raised.
+    """
+    return await _gather_bounded(
+        lambda messages: client.chat(messages, tools), conversations, max_concurrency
+    )
+
+
+async def chat_structured_many(
+    client: LLMClient,
+    conversations: List[List[ChatMessage]],
+    response_model: Type[T],
+    tools: Optional[List[ToolDefinition]] = None,
+    max_concurrency: int = 8,
+) -> List[T]:
+    """Structured counterpart of ``chat_many``: parse each reply as *response_model*.
+
+    For Ollama, the server only runs ``OLLAMA_NUM_PARALLEL`` requests at a
+    time, so a *max_concurrency* above that just queues on the server.
+    """
+    return await _gather_bounded(
+        lambda messages: client.chat_structured(messages, response_model, tools),
+        conversations,
+        max_concurrency,
+    )
+
+
 def create_llm_client(config: ModelConfig) -> LLMClient:
     """Factory that returns the appropriate client for *config.provider*.
 
@@ -21,6 +21,30 @@ _LLDB_SYSTEM_CONTEXT = (
     "the 'done' tool with your findings."
 )
 
+# StreamReader buffer limit for the CLI's stdout.  With asyncio's 64 KiB
+# default, readline() fails on a single large JSONL event (e.g. a big tool
+# result echoed back), and the pipe is paused whenever 128 KiB is buffered.
+_STREAM_LIMIT = 1 << 20
+
+
+# Fixed pieces of the tool_result JSONL line; only name and result vary.
+_TR_PREFIX = b'{"type": "tool_result", "name": '
+_TR_MID = b', "result": '
+_TR_END = b"}\n"
+
+
+def _tool_result_line(name: str, result: Any) -> bytes:
+    """Encode a ``tool_result`` event as one JSONL line for Codex's stdin."""
+    return b"".join(
+        (
+            _TR_PREFIX,
+            json.dumps(name).encode("utf-8"),
+            _TR_MID,
+            json.dumps(result).encode("utf-8"),
+            _TR_END,
+        )
+    )
+
 
 class CodexClient:
     """Agentic backend that spawns the ``codex`` CLI as a subprocess.
@@ -64,6 +88,22 @@ class CodexClient:
         cmd.append(prompt)
         return cmd
 
+    async def _spawn(self, cmd: List[str]) -> asyncio.subprocess.Process:
+        """Start the codex CLI with piped stdio."""
+        try:
+            return await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=_STREAM_LIMIT,
+            )
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"Codex CLI not found at '{self.cli_path}'. "
+                "Install it with: npm install -g @openai/codex"
+            )
+
     async def run_agent(
         self,
         task: str,
@@ -79,18 +119,7 @@ class CodexClient:
         result_text = ""
         steps = 0
 
-        try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-        except FileNotFoundError:
-            raise RuntimeError(
-                f"Codex CLI not found at '{self.cli_path}'. "
-                "Install it with: npm install -g @openai/codex"
-            )
+        proc = await self._spawn(cmd)
 
         try:
             result_text, tool_calls_log, steps = await self._process_events(
@@ -118,18 +147,7 @@ class CodexClient:
         prompt = self._build_prompt(task, tools)
         cmd = self._build_command(prompt, max_iterations)
 
-        try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-        except FileNotFoundError:
-            raise RuntimeError(
-                f"Codex CLI not found at '{self.cli_path}'. "
-                "Install it with: npm install -g @openai/codex"
-            )
+        proc = await self._spawn(cmd)
 
         try:
             async for event in self._stream_events(proc, tool_executor):
@@ -157,14 +175,17 @@ class CodexClient:
             if not line:
                 break
 
-            line_str = line.decode("utf-8").strip()
-            if not line_str:
+            if line.isspace():
                 continue
 
+            # json.loads accepts the raw bytes; no decode/strip copy needed
             try:
-                event = json.loads(line_str)
-            except json.JSONDecodeError:
-                logger.warning("Non-JSON line from codex: %s", line_str)
+                event = json.loads(line)
+            except ValueError:
+                logger.warning(
+                    "Non-JSON line from codex: %s",
+                    line.decode("utf-8", errors="replace").strip(),
+                )
                 continue
 
             event_type = event.get("type", "")
@@ -182,10 +203,7 @@ class CodexClient:
                 )
 
                 # Send tool result back to Codex
-                response = json.dumps(
-                    {"type": "tool_result", "name": tool_name, "result": tool_result}
-                )
-                proc.stdin.write(response.encode("utf-8") + b"\n")
+                proc.stdin.write(_tool_result_line(tool_name, tool_result))
                 await proc.stdin.drain()
 
                 steps += 1
@@ -215,13 +233,12 @@ class CodexClient:
             if not line:
                 break
 
-            line_str = line.decode("utf-8").strip()
-            if not line_str:
+            if line.isspace():
                 continue
 
             try:
-                event = json.loads(line_str)
-            except json.JSONDecodeError:
+                event = json.loads(line)
+            except ValueError:
                 continue
 
             event_type = event.get("type", "")
@@ -242,10 +259,7 @@ class CodexClient:
                     data={"name": tool_name, "result": tool_result},
                 )
 
-                response = json.dumps(
-                    {"type": "tool_result", "name": tool_name, "result": tool_result}
-                )
-                proc.stdin.write(response.encode("utf-8") + b"\n")
+                proc.stdin.write(_tool_result_line(tool_name, tool_result))
                 await proc.stdin.drain()
 
             elif event_type in ("text", "message"):
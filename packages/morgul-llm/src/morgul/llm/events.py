@@ -2,8 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import time
-from typing import Any, Callable, List, Optional, Protocol, Type, TypeVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from pydantic import BaseModel
 
@@ -25,7 +38,7 @@ class LLMEvent:
         model_type: Optional[str] = None,
         error: Optional[str] = None,
     ):
-        self.method = method          # "chat" or "chat_structured"
+        self.method = method          # "chat", "chat_stream" or "chat_structured"
         self.duration = duration      # seconds
         self.usage = usage            # token counts
         self.model_type = model_type  # response_model class name (structured only)
@@ -38,33 +51,109 @@ class LLMEvent:
 LLMEventCallback = Callable[[LLMEvent, bool], None]
 
 
+def _request_key(
+    messages: List[ChatMessage], tools: Optional[List[ToolDefinition]]
+) -> Tuple:
+    """Identify a ``chat`` request for coalescing.
+
+    Built from the message fields as a plain tuple rather than a serialized
+    digest: ``str`` hashes are cached, so re-keying a long history that is
+    passed again costs one tuple per message.  Tools are compared by
+    identity, which only ever under-coalesces.
+    """
+    return (
+        tuple(
+            (
+                m.role,
+                m.content,
+                m.tool_call_id,
+                m.name,
+                tuple(tc.id for tc in m.tool_calls) if m.tool_calls else None,
+            )
+            for m in messages
+        ),
+        tuple(map(id, tools)) if tools else None,
+    )
+
+
 class InstrumentedLLMClient:
-    """Wraps any LLMClient and fires callbacks on each call."""
+    """Wraps any LLMClient and fires callbacks on each call.
+
+    With no callback the wrapper forwards calls without building events or
+    reading the clock.  With *coalesce*, concurrent identical ``chat``
+    requests are coalesced: only the first reaches the wrapped client (and
+    fires events), the rest await its response.  That hands every caller
+    the same sample, so enable it only for deterministic (temperature 0) or
+    response-cached clients.  Streams are never coalesced.
+    """
 
-    def __init__(self, client: Any, callback: LLMEventCallback):
+    def __init__(
+        self,
+        client: Any,
+        callback: Optional[LLMEventCallback],
+        coalesce: bool = False,
+    ):
         self._client = client
         self._callback = callback
+        self._coalesce = coalesce
+        # request key -> [in-flight _chat task, number of callers awaiting it]
+        self._pending: Dict[Tuple, List[Any]] = {}
 
     async def chat(
         self,
         messages: List[ChatMessage],
         tools: Optional[List[ToolDefinition]] = None,
     ) -> LLMResponse:
+        if not self._coalesce:
+            return await self._chat(messages, tools)
+        key = _request_key(messages, tools)
+        entry = self._pending.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(self._chat(messages, tools))
+            entry = self._pending[key] = [task, 0]
+            task.add_done_callback(functools.partial(self._forget, key, entry))
+        task = entry[0]
+        # Every caller, the first included, waits on a shield so cancelling
+        # one of them leaves the shared request running for the others.
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not task.done():
+                task.cancel()
+
+    def _forget(self, key: Tuple, entry: List[Any], task: asyncio.Future) -> None:
+        if self._pending.get(key) is entry:
+            del self._pending[key]
+        if not task.cancelled():
+            # Mark retrieved so an exception nobody awaited isn't logged.
+            task.exception()
+
+    async def _chat(
+        self,
+        messages: List[ChatMessage],
+        tools: Optional[List[ToolDefinition]],
+    ) -> LLMResponse:
+        cb = self._callback
+        if cb is None:
+            return await self._client.chat(messages, tools)
+
         event = LLMEvent(method="chat")
-        self._callback(event, True)
-        start = time.monotonic()
+        cb(event, True)
+        start = time.perf_counter_ns()
 
         try:
             response = await self._client.chat(messages, tools)
         except Exception as exc:
-            event.duration = time.monotonic() - start
+            event.duration = (time.perf_counter_ns() - start) * 1e-9
             event.error = str(exc)
-            self._callback(event, False)
+            cb(event, False)
             raise
 
-        event.duration = time.monotonic() - start
+        event.duration = (time.perf_counter_ns() - start) * 1e-9
         event.usage = response.usage
-        self._callback(event, False)
+        cb(event, False)
         return response
 
     async def chat_structured(
@@ -73,21 +162,67 @@ class InstrumentedLLMClient:
         response_model: Type[T],
         tools: Optional[List[ToolDefinition]] = None,
     ) -> T:
+        cb = self._callback
+        if cb is None:
+            return await self._client.chat_structured(messages, response_model, tools)
+
         event = LLMEvent(method="chat_structured", model_type=response_model.__name__)
-        self._callback(event, True)
-        start = time.monotonic()
+        cb(event, True)
+        start = time.perf_counter_ns()
 
         try:
             response = await self._client.chat_structured(messages, response_model, tools)
         except Exception as exc:
-            event.duration = time.monotonic() - start
+            event.duration = (time.perf_counter_ns() - start) * 1e-9
             event.error = str(exc)
-            self._callback(event, False)
+            cb(event, False)
             raise
 
-        event.duration = time.monotonic() - start
-        self._callback(event, False)
+        event.duration = (time.perf_counter_ns() - start) * 1e-9
+        cb(event, False)
         return response
 
+    @property
+    def chat_stream(self) -> Callable[..., AsyncIterator[str]]:
+        """The wrapped client's ``chat_stream``, instrumented.
+
+        Raises ``AttributeError`` like any missing attribute when the wrapped
+        client cannot stream, so callers can keep probing with ``getattr``.
+        """
+        stream = self._client.chat_stream
+        if self._callback is None:
+            return stream
+        return functools.partial(self._chat_stream, stream)
+
+    async def _chat_stream(
+        self,
+        stream: Callable[..., AsyncIterator[str]],
+        messages: List[ChatMessage],
+        tools: Optional[List[ToolDefinition]] = None,
+    ) -> AsyncIterator[str]:
+        cb = self._callback
+        event = LLMEvent(method="chat_stream")
+        cb(event, True)
+        start = time.perf_counter_ns()
+
+        # The end event also fires when the consumer stops iterating early.
+        try:
+            async for delta in stream(messages, tools):
+                yield delta
+        except Exception as exc:
+            event.error = str(exc)
+            raise
+        finally:
+            event.duration = (time.perf_counter_ns() - start) * 1e-9
+            cb(event, False)
+
     def __getattr__(self, name: str) -> Any:
-        return getattr(self._client, name)
+        # Only reached on a miss; methods of the wrapped client are cached on
+        # the instance so later lookups are plain attribute hits.  Data
+        # attributes are forwarded each time so they never go stale.
+        if name.startswith("__") or name in ("_client", "_callback", "_coalesce", "_pending"):
+            raise AttributeError(name)
+        value = getattr(self._client, name)
+        if callable(value):
+            self.__dict__[name] = value
+        return value
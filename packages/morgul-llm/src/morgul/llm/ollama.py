@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import functools
 import json
 import uuid
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
 from pydantic import BaseModel
 
+from .cache import ResponseCache, ToolFormatCache
 from .structured import (
     create_extraction_tool,
     parse_structured_response,
     pydantic_to_json_schema,
 )
+from .transport import http_client_options
 from .types import (
+    _ZERO_USAGE,
     ChatMessage,
     LLMResponse,
     ModelConfig,
@@ -22,9 +26,42 @@ from .types import (
 
 T = TypeVar("T", bound=BaseModel)
 
+# Default Ollama server address, as used by the ``ollama`` SDK.
+_DEFAULT_HOST = "http://localhost:11434"
+
+_JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+
+def _tool_call_to_ollama(tc: ToolCall) -> Dict[str, Any]:
+    """Convert a ``ToolCall`` to an Ollama assistant ``tool_calls`` entry."""
+    return {
+        "id": tc.id,
+        "type": "function",
+        "function": {
+            "name": tc.name,
+            "arguments": tc.arguments,
+        },
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def _schema_instruction_for(model: Type[BaseModel]) -> str:
+    """Render (once per model) the system prompt asking for JSON matching *model*."""
+    schema = pydantic_to_json_schema(model)
+    return (
+        "You MUST respond with valid JSON matching this exact schema:\n"
+        f"```json\n{json.dumps(schema, indent=2)}\n```\n"
+        "Do NOT include any text outside the JSON object."
+    )
+
 
 class OllamaClient:
-    """LLM client backed by a local Ollama instance."""
+    """LLM client backed by a local Ollama instance.
+
+    Requests share one pooled httpx client, but the Ollama server itself
+    only serves ``OLLAMA_NUM_PARALLEL`` requests per model at a time; raise
+    it on the server to benefit from concurrent calls.
+    """
 
     def __init__(self, config: ModelConfig) -> None:
         try:
@@ -39,7 +76,22 @@ class OllamaClient:
         kwargs: Dict[str, Any] = {}
         if config.base_url is not None:
             kwargs["host"] = config.base_url
+        # Extra keyword arguments are forwarded to the underlying httpx client.
+        kwargs.update(http_client_options(config))
         self._client = ollama.AsyncClient(**kwargs)
+        self._response_cache: Optional[ResponseCache] = (
+            ResponseCache(config.cache_size) if config.enable_cache else None
+        )
+        self._tool_cache = ToolFormatCache(self._tool_to_ollama)
+        self._http: Any = None
+        if config.direct_http:
+            import httpx
+
+            self._http = httpx.AsyncClient(
+                base_url=config.base_url or _DEFAULT_HOST,
+                timeout=None,
+                **http_client_options(config),
+            )
 
     # ------------------------------------------------------------------
     # Public interface
@@ -62,16 +114,26 @@ class OllamaClient:
             },
         }
         if tools:
-            kwargs["tools"] = [self._tool_to_ollama(t) for t in tools]
+            kwargs["tools"] = self._tool_cache.convert_all(tools)
+
+        cache_key: Optional[str] = None
+        if self._response_cache is not None:
+            cache_key = self._response_cache.key_for(kwargs)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         try:
-            response = await self._client.chat(**kwargs)
+            response = await self._send_chat(kwargs)
         except Exception as exc:
             raise RuntimeError(
                 f"Ollama API call failed: {exc}"
             ) from exc
 
-        return self._from_ollama_response(response)
+        result = self._from_ollama_response(response, self._config.keep_raw)
+        if cache_key is not None:
+            self._response_cache.put(cache_key, result)
+        return result
 
     async def chat_structured(
         self,
@@ -80,16 +142,9 @@ class OllamaClient:
         tools: Optional[List[ToolDefinition]] = None,
     ) -> T:
         """Get structured output by requesting JSON format with a schema instruction."""
-        schema = pydantic_to_json_schema(response_model)
-        schema_instruction = (
-            "You MUST respond with valid JSON matching this exact schema:\n"
-            f"```json\n{json.dumps(schema, indent=2)}\n```\n"
-            "Do NOT include any text outside the JSON object."
-        )
-
         # Prepend schema instruction as a system message
         augmented: List[ChatMessage] = [
-            ChatMessage(role="system", content=schema_instruction),
+            ChatMessage(role="system", content=_schema_instruction_for(response_model)),
             *messages,
         ]
 
@@ -105,70 +160,104 @@ class OllamaClient:
             },
         }
 
-        try:
-            response = await self._client.chat(**kwargs)
-        except Exception as exc:
-            raise RuntimeError(
-                f"Ollama API call failed: {exc}"
-            ) from exc
+        cache_key: Optional[str] = None
+        content: Optional[str] = None
+        if self._response_cache is not None:
+            cache_key = self._response_cache.key_for(kwargs)
+            content = self._response_cache.get(cache_key)
+
+        if content is None:
+            try:
+                response = await self._send_chat(kwargs)
+            except Exception as exc:
+                raise RuntimeError(
+                    f"Ollama API call failed: {exc}"
+                ) from exc
 
-        content = response.get("message", {}).get("content", "")
-        if hasattr(response, "message"):
-            content = response.message.content or ""
+            content = self._unpack_response(response)[0]
+            if cache_key is not None:
+                self._response_cache.put(cache_key, content)
 
         return parse_structured_response(content, response_model)
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        # ollama.AsyncClient keeps its httpx client on ``_client`` and has no
+        # public close method.
+        await self._client._client.aclose()
+        if self._http is not None:
+            await self._http.aclose()
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    async def _send_chat(self, kwargs: Dict[str, Any]) -> Any:
+        """Dispatch a chat request through the SDK or, if enabled, direct HTTP."""
+        if self._http is None:
+            return await self._client.chat(**kwargs)
+        # Encode once and hand back the decoded dict; _unpack_response
+        # handles dict responses the same as SDK objects.
+        response = await self._http.post(
+            "/api/chat",
+            content=json.dumps({**kwargs, "stream": False}).encode("utf-8"),
+            headers=_JSON_HEADERS,
+        )
+        response.raise_for_status()
+        return response.json()
+
     @staticmethod
     def _to_ollama_messages(messages: List[ChatMessage]) -> List[Dict[str, Any]]:
         """Convert ``ChatMessage`` list to Ollama format."""
         api_messages: List[Dict[str, Any]] = []
+        append = api_messages.append
 
         for msg in messages:
+            role = msg.role
             entry: Dict[str, Any] = {
-                "role": msg.role,
+                "role": role,
                 "content": msg.content,
             }
 
-            if msg.role == "tool" and msg.tool_call_id is not None:
+            if role == "tool" and msg.tool_call_id is not None:
                 entry["tool_call_id"] = msg.tool_call_id
 
             if msg.tool_calls:
-                entry["tool_calls"] = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": tc.arguments,
-                        },
-                    }
-                    for tc in msg.tool_calls
-                ]
-
-            api_messages.append(entry)
+                entry["tool_calls"] = list(map(_tool_call_to_ollama, msg.tool_calls))
+
+            append(entry)
 
         return api_messages
 
     @staticmethod
-    def _from_ollama_response(response: Any) -> LLMResponse:
-        """Convert an Ollama response to a unified ``LLMResponse``."""
-        # Ollama responses can be dict-like or object-like depending on version
+    def _unpack_response(response: Any) -> Tuple[str, Any, int, int]:
+        """Return ``(content, raw_tool_calls, prompt_eval_count, eval_count)``.
+
+        Ollama responses are dict-like or object-like depending on the SDK
+        version; this picks the access style once per response.
+        """
         if isinstance(response, dict):
             message = response.get("message", {})
-            content = message.get("content", "")
-            raw_tool_calls = message.get("tool_calls")
-            prompt_eval_count = response.get("prompt_eval_count", 0)
-            eval_count = response.get("eval_count", 0)
-        else:
-            message = getattr(response, "message", None)
-            content = getattr(message, "content", "") or "" if message else ""
-            raw_tool_calls = getattr(message, "tool_calls", None)
-            prompt_eval_count = getattr(response, "prompt_eval_count", 0) or 0
-            eval_count = getattr(response, "eval_count", 0) or 0
+            return (
+                message.get("content", ""),
+                message.get("tool_calls"),
+                response.get("prompt_eval_count", 0),
+                response.get("eval_count", 0),
+            )
+        message = getattr(response, "message", None)
+        return (
+            getattr(message, "content", "") or "" if message else "",
+            getattr(message, "tool_calls", None),
+            getattr(response, "prompt_eval_count", 0) or 0,
+            getattr(response, "eval_count", 0) or 0,
+        )
+
+    @staticmethod
+    def _from_ollama_response(response: Any, keep_raw: bool = True) -> LLMResponse:
+        """Convert an Ollama response to a unified ``LLMResponse``."""
+        content, raw_tool_calls, prompt_eval_count, eval_count = (
+            OllamaClient._unpack_response(response)
+        )
 
         tool_calls: List[ToolCall] = []
         if raw_tool_calls:
@@ -177,7 +266,7 @@ class OllamaClient:
                     func = tc.get("function", {})
                     tool_calls.append(
                         ToolCall(
-                            id=tc.get("id", str(uuid.uuid4())),
+                            id=tc.get("id") or uuid.uuid4().hex,
                             name=func.get("name", ""),
                             arguments=func.get("arguments", {}),
                         )
@@ -186,22 +275,25 @@ class OllamaClient:
                     func = getattr(tc, "function", None)
                     tool_calls.append(
                         ToolCall(
-                            id=getattr(tc, "id", str(uuid.uuid4())),
+                            id=getattr(tc, "id", None) or uuid.uuid4().hex,
                             name=getattr(func, "name", "") if func else "",
                             arguments=getattr(func, "arguments", {}) if func else {},
                         )
                     )
 
-        usage = Usage(
-            input_tokens=prompt_eval_count,
-            output_tokens=eval_count,
-        )
+        if prompt_eval_count or eval_count:
+            usage = Usage(
+                input_tokens=prompt_eval_count,
+                output_tokens=eval_count,
+            )
+        else:
+            usage = _ZERO_USAGE
 
         return LLMResponse(
             content=content,
             tool_calls=tool_calls or None,
             usage=usage,
-            raw=response,
+            raw=response if keep_raw else None,
         )
 
     @staticmethod
@@ -6,8 +6,16 @@ from typing import Any, Dict, List, Optional, Type, TypeVar
 
 from pydantic import BaseModel
 
-from .structured import create_extraction_tool, parse_structured_response, pydantic_to_json_schema
+from .cache import ResponseCache, ToolFormatCache
+from .structured import (
+    create_extraction_tool,
+    parse_structured_response,
+    pydantic_to_json_schema,
+    validate_structured_data,
+)
+from .transport import http_client_options
 from .types import (
+    _ZERO_USAGE,
     ChatMessage,
     LLMResponse,
     ModelConfig,
@@ -19,6 +27,18 @@ from .types import (
 T = TypeVar("T", bound=BaseModel)
 
 
+def _tool_call_to_openai(tc: ToolCall) -> Dict[str, Any]:
+    """Convert a ``ToolCall`` to an OpenAI assistant ``tool_calls`` entry."""
+    return {
+        "id": tc.id,
+        "type": "function",
+        "function": {
+            "name": tc.name,
+            "arguments": json.dumps(tc.arguments),
+        },
+    }
+
+
 class OpenAIClient:
     """LLM client backed by the OpenAI Chat Completions API."""
 
@@ -37,7 +57,14 @@ class OpenAIClient:
             kwargs["api_key"] = config.api_key
         if config.base_url is not None:
             kwargs["base_url"] = config.base_url
+        kwargs["http_client"] = openai.DefaultAsyncHttpxClient(
+            **http_client_options(config)
+        )
         self._client = openai.AsyncOpenAI(**kwargs)
+        self._response_cache: Optional[ResponseCache] = (
+            ResponseCache(config.cache_size) if config.enable_cache else None
+        )
+        self._tool_cache = ToolFormatCache(self._tool_to_function)
 
     # ------------------------------------------------------------------
     # Public interface
@@ -58,7 +85,14 @@ class OpenAIClient:
             "max_completion_tokens": self._config.max_tokens,
         }
         if tools:
-            kwargs["tools"] = [self._tool_to_function(t) for t in tools]
+            kwargs["tools"] = self._tool_cache.convert_all(tools)
+
+        cache_key: Optional[str] = None
+        if self._response_cache is not None:
+            cache_key = self._response_cache.key_for(kwargs)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         try:
             response = await self._client.chat.completions.create(**kwargs)
@@ -67,7 +101,10 @@ class OpenAIClient:
                 f"OpenAI API call failed: {exc}"
             ) from exc
 
-        return self._from_openai_response(response)
+        result = self._from_openai_response(response, self._config.keep_raw)
+        if cache_key is not None:
+            self._response_cache.put(cache_key, result)
+        return result
 
     async def chat_structured(
         self,
@@ -75,7 +112,15 @@ class OpenAIClient:
         response_model: Type[T],
         tools: Optional[List[ToolDefinition]] = None,
     ) -> T:
-        """Force structured output via function calling, then parse the result."""
+        """Force structured output via function calling, then parse the result.
+
+        With ``structured_mode="native"`` (and no extra *tools*) the schema is
+        sent as a strict ``response_format`` instead, so the reply is the
+        JSON object itself rather than a synthetic tool call.
+        """
+        if self._config.structured_mode == "native" and not tools:
+            return await self._chat_native_structured(messages, response_model)
+
         extraction_tool = create_extraction_tool(response_model)
         all_tools = list(tools or []) + [extraction_tool]
 
@@ -85,13 +130,41 @@ class OpenAIClient:
         if response.tool_calls:
             for tc in response.tool_calls:
                 if tc.name == extraction_tool.name:
-                    return parse_structured_response(
-                        json.dumps(tc.arguments), response_model
-                    )
+                    return validate_structured_data(tc.arguments, response_model)
 
         # Fallback: try to parse content directly
         return parse_structured_response(response.content, response_model)
 
+    async def _chat_native_structured(
+        self,
+        messages: List[ChatMessage],
+        response_model: Type[T],
+    ) -> T:
+        """Use OpenAI structured outputs via the SDK's Pydantic-aware ``parse``."""
+        try:
+            completion = await self._client.chat.completions.parse(
+                model=self._config.model_name,
+                messages=self._to_openai_messages(messages),
+                response_format=response_model,
+                temperature=self._config.temperature,
+                max_completion_tokens=self._config.max_tokens,
+            )
+        except Exception as exc:
+            raise RuntimeError(
+                f"OpenAI API call failed: {exc}"
+            ) from exc
+
+        message = completion.choices[0].message
+        if message.parsed is not None:
+            return message.parsed
+        if message.refusal:
+            raise ValueError(f"LLM refused to produce {response_model.__name__}: {message.refusal}")
+        return parse_structured_response(message.content or "", response_model)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self._client.close()
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -100,10 +173,12 @@ class OpenAIClient:
     def _to_openai_messages(messages: List[ChatMessage]) -> List[Dict[str, Any]]:
         """Convert ``ChatMessage`` list to OpenAI Chat Completions format."""
         api_messages: List[Dict[str, Any]] = []
+        append = api_messages.append
 
         for msg in messages:
-            if msg.role == "tool":
-                api_messages.append(
+            role = msg.role
+            if role == "tool":
+                append(
                     {
                         "role": "tool",
                         "content": msg.content,
@@ -113,7 +188,7 @@ class OpenAIClient:
                 continue
 
             entry: Dict[str, Any] = {
-                "role": msg.role,
+                "role": role,
                 "content": msg.content,
             }
 
@@ -121,24 +196,14 @@ class OpenAIClient:
                 entry["name"] = msg.name
 
             if msg.tool_calls:
-                entry["tool_calls"] = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": json.dumps(tc.arguments),
-                        },
-                    }
-                    for tc in msg.tool_calls
-                ]
+                entry["tool_calls"] = list(map(_tool_call_to_openai, msg.tool_calls))
 
-            api_messages.append(entry)
+            append(entry)
 
         return api_messages
 
     @staticmethod
-    def _from_openai_response(response: Any) -> LLMResponse:
+    def _from_openai_response(response: Any, keep_raw: bool = True) -> LLMResponse:
         """Convert an OpenAI ``ChatCompletion`` object to a unified ``LLMResponse``."""
         choice = response.choices[0]
         message = choice.message
@@ -155,24 +220,30 @@ class OpenAIClient:
 
                 tool_calls.append(
                     ToolCall(
-                        id=tc.id or str(uuid.uuid4()),
+                        id=tc.id or uuid.uuid4().hex,
                         name=tc.function.name,
                         arguments=arguments,
                     )
                 )
 
         usage = None
-        if response.usage is not None:
-            usage = Usage(
-                input_tokens=response.usage.prompt_tokens,
-                output_tokens=response.usage.completion_tokens,
-            )
+        raw_usage = response.usage
+        if raw_usage is not None:
+            prompt_tokens = raw_usage.prompt_tokens
+            completion_tokens = raw_usage.completion_tokens
+            if prompt_tokens or completion_tokens:
+                usage = Usage(
+                    input_tokens=prompt_tokens,
+                    output_tokens=completion_tokens,
+                )
+            else:
+                usage = _ZERO_USAGE
 
         return LLMResponse(
             content=content,
             tool_calls=tool_calls or None,
             usage=usage,
-            raw=response,
+            raw=response if keep_raw else None,
         )
 
     @staticmethod
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 import json
-from typing import Any, Dict, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
 from pydantic import BaseModel, ValidationError
 
@@ -9,12 +10,17 @@ from .types import ToolDefinition
 
 T = TypeVar("T", bound=BaseModel)
 
+_JSON_DECODER = json.JSONDecoder()
 
+
+@functools.lru_cache(maxsize=256)
 def pydantic_to_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
     """Convert a Pydantic model class to a JSON Schema dict.
 
     Strips internal Pydantic keys (``$defs``, ``title``) so the schema is
     suitable for use in tool / function definitions sent to LLM providers.
+    The result is cached per model class and shared between callers, so it
+    must not be mutated.
     """
     schema = model.model_json_schema()
     # Remove top-level keys that providers don't need
@@ -27,7 +33,11 @@ def pydantic_to_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
 
 
 def _inline_refs(node: Any, defs: Dict[str, Any]) -> Any:
-    """Recursively replace ``$ref`` pointers with their definitions."""
+    """Recursively replace ``$ref`` pointers with their definitions.
+
+    Containers with no ``$ref`` beneath them are returned as-is rather than
+    rebuilt, so only the paths leading to references are copied.
+    """
     if isinstance(node, dict):
         if "$ref" in node:
             ref_path = node["$ref"]  # e.g. "#/$defs/Foo"
@@ -36,24 +46,77 @@ def _inline_refs(node: Any, defs: Dict[str, Any]) -> Any:
             resolved = dict(resolved)  # shallow copy
             resolved.pop("title", None)
             return _inline_refs(resolved, defs)
-        return {k: _inline_refs(v, defs) for k, v in node.items()}
+        out: Optional[Dict[str, Any]] = None
+        for k, v in node.items():
+            new = _inline_refs(v, defs)
+            if new is not v:
+                if out is None:
+                    out = dict(node)
+                out[k] = new
+        return node if out is None else out
     if isinstance(node, list):
-        return [_inline_refs(item, defs) for item in node]
+        items: Optional[List[Any]] = None
+        for i, item in enumerate(node):
+            new = _inline_refs(item, defs)
+            if new is not item:
+                if items is None:
+                    items = list(node)
+                items[i] = new
+        return node if items is None else items
     return node
 
 
+def extract_json_object(content: str) -> Optional[Dict[str, Any]]:
+    """Return the first JSON object embedded in *content*, or None.
+
+    ``raw_decode`` parses from each candidate ``{`` and stops at the end of
+    that object, so surrounding prose (or a stray brace before the JSON)
+    costs no extra scans of the whole response.
+    """
+    start = content.find("{")
+    while start != -1:
+        try:
+            data, _ = _JSON_DECODER.raw_decode(content, start)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(data, dict):
+                return data
+        start = content.find("{", start + 1)
+    return None
+
+
 def parse_structured_response(content: str, model: Type[T]) -> T:
     """Parse a JSON string into a Pydantic model instance.
 
+    If the response is not pure JSON (e.g. the model wrapped it in prose or
+    a code fence), the first embedded JSON object is used instead, which
+    saves re-prompting for a common LLM quirk.
+
     Raises ``ValueError`` with a helpful message on failure.
     """
+    # pydantic-core parses and validates in one pass, without building an
+    # intermediate dict; malformed JSON surfaces as a ``json_invalid`` error.
     try:
-        data = json.loads(content)
-    except json.JSONDecodeError as exc:
+        return model.model_validate_json(content)
+    except ValidationError as exc:
+        if any(err["type"] == "json_invalid" for err in exc.errors()):
+            data = extract_json_object(content)
+            if data is not None:
+                return validate_structured_data(data, model)
+            raise ValueError(
+                f"LLM response is not valid JSON: {exc}"
+            ) from exc
         raise ValueError(
-            f"LLM response is not valid JSON: {exc}"
+            f"LLM response does not match schema for {model.__name__}: {exc}"
         ) from exc
 
+
+def validate_structured_data(data: Any, model: Type[T]) -> T:
+    """Validate already-decoded JSON *data* (e.g. tool-call arguments) as *model*.
+
+    Raises ``ValueError`` with a helpful message on failure.
+    """
     try:
         return model.model_validate(data)
     except ValidationError as exc:
@@ -62,11 +125,13 @@ def parse_structured_response(content: str, model: Type[T]) -> T:
         ) from exc
 
 
+@functools.lru_cache(maxsize=128)
 def create_extraction_tool(model: Type[BaseModel]) -> ToolDefinition:
     """Create a ``ToolDefinition`` that forces the LLM to output data matching *model*.
 
     The tool is named ``extract_{model_name}`` and its parameters are the
-    JSON schema derived from the Pydantic model.
+    JSON schema derived from the Pydantic model.  Results are cached per
+    model class, so callers must treat the returned tool as read-only.
     """
     schema = pydantic_to_json_schema(model)
     name = f"extract_{model.__name__.lower()}"
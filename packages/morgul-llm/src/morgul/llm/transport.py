@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from .types import ModelConfig
+
+
+def http_client_options(config: ModelConfig) -> Dict[str, Any]:
+    """Connection-pool options for a provider SDK's httpx client.
+
+    httpx drops idle keep-alive connections after 5 seconds by default, which
+    is shorter than a typical agent turn, so every LLM call would pay a fresh
+    TCP + TLS handshake.  These options keep a pool of warm connections
+    around for ``config.http_keepalive_expiry`` seconds instead.
+    """
+    import httpx
+
+    return {
+        "limits": httpx.Limits(
+            max_connections=config.http_max_connections,
+            max_keepalive_connections=config.http_max_keepalive,
+            keepalive_expiry=config.http_keepalive_expiry,
+        ),
+        "http2": config.http2,
+    }
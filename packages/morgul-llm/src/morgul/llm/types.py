@@ -14,6 +14,25 @@ class ModelConfig(BaseModel):
     base_url: Optional[str] = None
     temperature: float = 0.7
     max_tokens: int = 4096
+    enable_cache: bool = False
+    """Reuse responses for byte-identical requests (see ``ResponseCache``)."""
+    cache_size: int = 256
+    http_max_connections: int = 64
+    http_max_keepalive: int = 32
+    http_keepalive_expiry: float = 90.0
+    """Seconds an idle pooled connection is kept open for reuse."""
+    http2: bool = False
+    """Negotiate HTTP/2 (requires the ``h2`` package)."""
+    keep_raw: bool = True
+    """Keep the provider SDK's response object on ``LLMResponse.raw``.  Set to
+    ``False`` in long-running agents so they don't retain every raw response
+    graph."""
+    direct_http: bool = False
+    """Ollama only: POST to ``/api/chat`` over a pooled httpx client instead of
+    going through the ``ollama`` SDK's request/response models."""
+    structured_mode: Literal["tool", "native"] = "tool"
+    """How OpenAI ``chat_structured`` gets JSON: an extraction tool call, or
+    native ``response_format`` structured outputs (strict JSON schema)."""
 
 
 class ToolCall(BaseModel):
@@ -40,6 +59,8 @@ class ChatMessage(BaseModel):
     tool_calls: Optional[List[ToolCall]] = None
     tool_call_id: Optional[str] = None
     name: Optional[str] = None
+    cache_control: Optional[Literal["ephemeral"]] = None
+    """Mark this message as a cacheable prompt prefix (honoured by Anthropic)."""
 
 
 class ToolDefinition(BaseModel):
@@ -56,10 +77,16 @@ class ToolDefinition(BaseModel):
 class Usage(BaseModel):
     """Token usage information from an LLM response."""
 
+    model_config = {"frozen": True}
+
     input_tokens: int
     output_tokens: int
 
 
+# Shared by responses that report no token counts (safe since Usage is frozen).
+_ZERO_USAGE = Usage(input_tokens=0, output_tokens=0)
+
+
 class LLMResponse(BaseModel):
     """Unified response from any LLM provider."""
 
@@ -143,6 +143,8 @@ def mock_bridge_process():
     process = MagicMock()
     process.state = ProcessState.STOPPED
     process.pid = 12345
+    process.stop_id = 1
+    process.state_epoch = 0
     process.exit_status = 0
     process.exit_description = ""
     process.selected_thread = thread
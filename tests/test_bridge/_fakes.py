@@ -0,0 +1,148 @@
+"""Lightweight typed stand-ins for LLDB SB objects used by bridge fixtures.
+
+Each fake exposes only the SB methods the bridge wrappers call, so a typo or
+an unexpected call fails loudly instead of returning another MagicMock.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class FakeSBError:
+    success: bool = True
+
+    def Success(self) -> bool:
+        return self.success
+
+    def Fail(self) -> bool:
+        return not self.success
+
+    def __str__(self) -> str:
+        return "" if self.success else "mock error"
+
+
+@dataclass
+class FakeSBFileSpec:
+    path: str
+    valid: bool = True
+
+    def IsValid(self) -> bool:
+        return self.valid
+
+    def GetFilename(self) -> str:
+        return os.path.basename(self.path)
+
+    def __str__(self) -> str:
+        return self.path
+
+
+@dataclass
+class FakeSBModule:
+    file_spec: FakeSBFileSpec
+    valid: bool = True
+
+    def IsValid(self) -> bool:
+        return self.valid
+
+    def GetFileSpec(self) -> FakeSBFileSpec:
+        return self.file_spec
+
+
+@dataclass
+class FakeSBLineEntry:
+    line: int
+    file_spec: FakeSBFileSpec
+    column: int = 0
+    valid: bool = True
+
+    def IsValid(self) -> bool:
+        return self.valid
+
+    def GetLine(self) -> int:
+        return self.line
+
+    def GetColumn(self) -> int:
+        return self.column
+
+    def GetFileSpec(self) -> FakeSBFileSpec:
+        return self.file_spec
+
+
+@dataclass
+class FakeSBType:
+    type_class: int = 1  # eTypeClassBuiltin
+
+    def GetTypeClass(self) -> int:
+        return self.type_class
+
+
+@dataclass
+class FakeSBValue:
+    """An ``SBValue``: a variable, a register, or an expression result."""
+
+    name: str = ""
+    type_name: str = ""
+    value: Optional[str] = None
+    summary: Optional[str] = None
+    load_address: int = 0
+    byte_size: int = 0
+    unsigned: int = 0
+    children: List["FakeSBValue"] = field(default_factory=list)
+    type: FakeSBType = field(default_factory=FakeSBType)
+    error: FakeSBError = field(default_factory=FakeSBError)
+    pointee: Optional["FakeSBValue"] = None
+    valid: bool = True
+
+    def IsValid(self) -> bool:
+        return self.valid
+
+    def GetName(self) -> str:
+        return self.name
+
+    def GetTypeName(self) -> str:
+        return self.type_name
+
+    def GetValue(self) -> Optional[str]:
+        return self.value
+
+    def GetSummary(self) -> Optional[str]:
+        return self.summary
+
+    def GetLoadAddress(self) -> int:
+        return self.load_address
+
+    def GetByteSize(self) -> int:
+        return self.byte_size
+
+    def GetValueAsUnsigned(self, fail_value: int = 0) -> int:
+        return self.unsigned
+
+    def GetType(self) -> FakeSBType:
+        return self.type
+
+    def GetError(self) -> FakeSBError:
+        return self.error
+
+    def GetNumChildren(self) -> int:
+        return len(self.children)
+
+    def GetChildAtIndex(self, index: int) -> "FakeSBValue":
+        return self.children[index]
+
+    def Dereference(self) -> "FakeSBValue":
+        return self.pointee if self.pointee is not None else FakeSBValue(valid=False)
+
+
+@dataclass
+class FakeSBValueList:
+    values: List[FakeSBValue] = field(default_factory=list)
+
+    def GetSize(self) -> int:
+        return len(self.values)
+
+    def GetValueAtIndex(self, index: int) -> FakeSBValue:
+        return self.values[index]
@@ -1,33 +1,42 @@
-"""Bridge test fixtures — mock SB objects for each LLDB class."""
+"""Bridge test fixtures — mock SB objects for each LLDB class.
+
+Each SB mock tree is built once per session as a prototype; the
+function-scoped fixtures hand every test its own ``deepcopy`` of it, which
+is much cheaper than rebuilding the MagicMock tree.
+"""
 
 from __future__ import annotations
 
+import copy
 from unittest.mock import MagicMock, PropertyMock
 
 import pytest
 
 from morgul.bridge.types import ProcessState, StopReason
 
+from ._fakes import (
+    FakeSBError,
+    FakeSBFileSpec,
+    FakeSBLineEntry,
+    FakeSBModule,
+    FakeSBValue,
+    FakeSBValueList,
+)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _sb_error(success: bool = True) -> MagicMock:
-    err = MagicMock()
-    err.Success.return_value = success
-    err.Fail.return_value = not success
-    err.__str__ = lambda self: "" if success else "mock error"
-    err.__bool__ = lambda self: True  # SBError is truthy
-    return err
+def _sb_error(success: bool = True) -> FakeSBError:
+    return FakeSBError(success)
 
 
 # ---------------------------------------------------------------------------
 # SBDebugger
 # ---------------------------------------------------------------------------
 
-@pytest.fixture()
-def mock_sb_debugger():
+def _build_sb_debugger() -> MagicMock:
     sb = MagicMock(name="SBDebugger")
     sb.GetAsync.return_value = False
     sb.GetCommandInterpreter.return_value = MagicMock()
@@ -42,19 +51,25 @@ def mock_sb_debugger():
     return sb
 
 
+@pytest.fixture(scope="session")
+def _proto_sb_debugger():
+    return _build_sb_debugger()
+
+
+@pytest.fixture()
+def mock_sb_debugger(_proto_sb_debugger):
+    return copy.deepcopy(_proto_sb_debugger)
+
+
 # ---------------------------------------------------------------------------
 # SBTarget
 # ---------------------------------------------------------------------------
 
-@pytest.fixture()
-def mock_sb_target():
+def _build_sb_target() -> MagicMock:
     sb = MagicMock(name="SBTarget")
 
     # Executable
-    exe = MagicMock()
-    exe.IsValid.return_value = True
-    exe.__str__ = lambda self: "/tmp/a.out"
-    sb.GetExecutable.return_value = exe
+    sb.GetExecutable.return_value = FakeSBFileSpec("/tmp/a.out")
 
     sb.GetTriple.return_value = "arm64-apple-macosx15.0.0"
     sb.GetByteOrder.return_value = 1  # little endian
@@ -71,19 +86,27 @@ def mock_sb_target():
     return sb
 
 
+@pytest.fixture(scope="session")
+def _proto_sb_target():
+    return _build_sb_target()
+
+
+@pytest.fixture()
+def mock_sb_target(_proto_sb_target):
+    return copy.deepcopy(_proto_sb_target)
+
+
 # ---------------------------------------------------------------------------
 # SBProcess
 # ---------------------------------------------------------------------------
 
-@pytest.fixture()
-def mock_sb_process(mock_sb_target):
+def _build_sb_process() -> MagicMock:
     sb = MagicMock(name="SBProcess")
     sb.GetState.return_value = 5  # eStateStopped
     sb.GetProcessID.return_value = 12345
     sb.GetExitStatus.return_value = 0
     sb.GetExitDescription.return_value = ""
     sb.GetNumThreads.return_value = 1
-    sb.GetTarget.return_value = mock_sb_target
 
     sb.Continue.return_value = _sb_error(True)
     sb.Stop.return_value = _sb_error(True)
@@ -102,12 +125,23 @@ def mock_sb_process(mock_sb_target):
     return sb
 
 
+@pytest.fixture(scope="session")
+def _proto_sb_process():
+    return _build_sb_process()
+
+
+@pytest.fixture()
+def mock_sb_process(_proto_sb_process, mock_sb_target):
+    sb = copy.deepcopy(_proto_sb_process)
+    sb.GetTarget.return_value = mock_sb_target
+    return sb
+
+
 # ---------------------------------------------------------------------------
 # SBThread
 # ---------------------------------------------------------------------------
 
-@pytest.fixture()
-def mock_sb_thread():
+def _build_sb_thread() -> MagicMock:
     sb = MagicMock(name="SBThread")
     sb.GetThreadID.return_value = 1
     sb.GetName.return_value = "main"
@@ -116,92 +150,85 @@ def mock_sb_thread():
     return sb
 
 
+@pytest.fixture(scope="session")
+def _proto_sb_thread():
+    return _build_sb_thread()
+
+
+@pytest.fixture()
+def mock_sb_thread(_proto_sb_thread):
+    return copy.deepcopy(_proto_sb_thread)
+
+
 # ---------------------------------------------------------------------------
 # SBFrame
 # ---------------------------------------------------------------------------
 
-@pytest.fixture()
-def mock_sb_frame():
+def _build_sb_frame_basic() -> MagicMock:
     sb = MagicMock(name="SBFrame")
     sb.GetPC.return_value = 0x100003F00
     sb.GetSP.return_value = 0x7FF7BFEFF680
     sb.GetFP.return_value = 0x7FF7BFEFF690
     sb.GetFrameID.return_value = 0
     sb.GetFunctionName.return_value = "main"
+    return sb
 
-    # Module
-    mod = MagicMock()
-    mod.IsValid.return_value = True
-    fs = MagicMock()
-    fs.IsValid.return_value = True
-    fs.GetFilename.return_value = "a.out"
-    mod.GetFileSpec.return_value = fs
-    sb.GetModule.return_value = mod
-
-    # Line entry
-    le = MagicMock()
-    le.IsValid.return_value = True
-    le.GetLine.return_value = 10
-    le.GetColumn.return_value = 0
-    le_fs = MagicMock()
-    le_fs.IsValid.return_value = True
-    le_fs.__str__ = lambda self: "/tmp/main.c"
-    le.GetFileSpec.return_value = le_fs
-    sb.GetLineEntry.return_value = le
+
+def _build_sb_frame() -> MagicMock:
+    sb = _build_sb_frame_basic()
+
+    sb.GetModule.return_value = FakeSBModule(FakeSBFileSpec("a.out"))
+    sb.GetLineEntry.return_value = FakeSBLineEntry(
+        line=10, column=0, file_spec=FakeSBFileSpec("/tmp/main.c")
+    )
 
     # Registers — one set with one register
-    reg = MagicMock()
-    reg.GetName.return_value = "rax"
-    reg.GetValueAsUnsigned.return_value = 0x42
-    reg.GetByteSize.return_value = 8
-
-    reg_set = MagicMock()
-    reg_set.GetNumChildren.return_value = 1
-    reg_set.GetChildAtIndex.return_value = reg
-
-    reg_sets = MagicMock()
-    reg_sets.GetSize.return_value = 1
-    reg_sets.GetValueAtIndex.return_value = reg_set
-    sb.GetRegisters.return_value = reg_sets
-
-    # Variables
-    var = MagicMock()
-    var.GetName.return_value = "argc"
-    var.GetTypeName.return_value = "int"
-    var.GetValue.return_value = "1"
-    var.GetSummary.return_value = None
-    var.GetLoadAddress.return_value = 0x7FF7BFEFF6A0
-    var.GetByteSize.return_value = 4
-    # Type info for _to_variable() recursive expansion
-    var_type = MagicMock()
-    var_type.GetTypeClass.return_value = 1  # eTypeClassBuiltin (not a pointer)
-    var.GetType.return_value = var_type
-    var.GetNumChildren.return_value = 0
-    var.IsValid.return_value = True
-
-    vars_list = MagicMock()
-    vars_list.GetSize.return_value = 1
-    vars_list.GetValueAtIndex.return_value = var
-    sb.GetVariables.return_value = vars_list
+    reg = FakeSBValue(name="rax", unsigned=0x42, byte_size=8)
+    reg_set = FakeSBValue(children=[reg])
+    sb.GetRegisters.return_value = FakeSBValueList([reg_set])
+
+    # Variables (builtin type, no children, so _to_variable won't recurse)
+    var = FakeSBValue(
+        name="argc",
+        type_name="int",
+        value="1",
+        load_address=0x7FF7BFEFF6A0,
+        byte_size=4,
+    )
+    sb.GetVariables.return_value = FakeSBValueList([var])
 
     # Expression evaluation
-    expr_val = MagicMock()
-    expr_error = MagicMock()
-    expr_error.Fail.return_value = False
-    expr_val.GetError.return_value = expr_error
-    expr_val.GetValue.return_value = "42"
-    expr_val.GetSummary.return_value = None
-    sb.EvaluateExpression.return_value = expr_val
+    sb.EvaluateExpression.return_value = FakeSBValue(value="42")
 
     return sb
 
 
+@pytest.fixture(scope="session")
+def _proto_sb_frame():
+    return _build_sb_frame()
+
+
+@pytest.fixture()
+def mock_sb_frame(_proto_sb_frame):
+    return copy.deepcopy(_proto_sb_frame)
+
+
+@pytest.fixture(scope="session")
+def _proto_sb_frame_basic():
+    return _build_sb_frame_basic()
+
+
+@pytest.fixture()
+def mock_sb_frame_basic(_proto_sb_frame_basic):
+    """An SBFrame with only PC/SP/FP, frame index and function name set."""
+    return copy.deepcopy(_proto_sb_frame_basic)
+
+
 # ---------------------------------------------------------------------------
 # SBBreakpoint
 # ---------------------------------------------------------------------------
 
-@pytest.fixture()
-def mock_sb_breakpoint():
+def _build_sb_breakpoint() -> MagicMock:
     sb = MagicMock(name="SBBreakpoint")
     sb.GetID.return_value = 1
     sb.IsEnabled.return_value = True
@@ -217,6 +244,16 @@ def mock_sb_breakpoint():
     return sb
 
 
+@pytest.fixture(scope="session")
+def _proto_sb_breakpoint():
+    return _build_sb_breakpoint()
+
+
+@pytest.fixture()
+def mock_sb_breakpoint(_proto_sb_breakpoint):
+    return copy.deepcopy(_proto_sb_breakpoint)
+
+
 # ---------------------------------------------------------------------------
 # Convenience: error fixtures
 # ---------------------------------------------------------------------------
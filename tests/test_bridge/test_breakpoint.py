@@ -4,29 +4,27 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from morgul.bridge.breakpoint import Breakpoint, _BP_CALLBACKS, _invoke_bp_callback
 
 
 class TestBreakpoint:
-    def test_id(self, mock_sb_breakpoint):
-        bp = Breakpoint(mock_sb_breakpoint)
-        assert bp.id == 1
-
-    def test_enabled(self, mock_sb_breakpoint):
-        bp = Breakpoint(mock_sb_breakpoint)
-        assert bp.enabled is True
-
-    def test_hit_count(self, mock_sb_breakpoint):
-        bp = Breakpoint(mock_sb_breakpoint)
-        assert bp.hit_count == 0
-
-    def test_num_locations(self, mock_sb_breakpoint):
-        bp = Breakpoint(mock_sb_breakpoint)
-        assert bp.num_locations == 1
-
-    def test_condition_none(self, mock_sb_breakpoint):
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("id", 1),
+            ("enabled", True),
+            ("hit_count", 0),
+            ("num_locations", 1),
+            ("condition", None),
+        ],
+    )
+    def test_property(self, mock_sb_breakpoint, attr, expected):
         bp = Breakpoint(mock_sb_breakpoint)
-        assert bp.condition is None
+        value = getattr(bp, attr)
+        assert value == expected
+        assert type(value) is type(expected)
 
     def test_condition_set(self, mock_sb_breakpoint):
         mock_sb_breakpoint.GetCondition.return_value = "x > 5"
@@ -12,17 +12,21 @@ from morgul.bridge.types import CommandResult
 class TestDebugger:
     """Test the Debugger class with a mocked lldb module."""
 
+    @pytest.fixture(autouse=True)
+    def _patch_lldb(self):
+        """Patch the debugger module's lldb once for the whole test."""
+        patcher = patch("morgul.bridge.debugger.lldb")
+        self.mock_lldb = patcher.start()
+        yield
+        patcher.stop()
+
     def _make_debugger(self, mock_sb_debugger):
         """Create a Debugger with a pre-built mock SBDebugger."""
-        with patch("morgul.bridge.debugger.lldb") as mock_lldb:
-            mock_lldb.SBDebugger.Initialize.return_value = None
-            mock_lldb.SBDebugger.Create.return_value = mock_sb_debugger
-            mock_lldb.SBDebugger.Destroy.return_value = None
-            mock_lldb.__bool__ = lambda self: True
-            # Make lldb truthy so _require_lldb passes
-            from morgul.bridge.debugger import Debugger
-            dbg = Debugger()
-        return dbg
+        self.mock_lldb.SBDebugger.Initialize.return_value = None
+        self.mock_lldb.SBDebugger.Create.return_value = mock_sb_debugger
+        self.mock_lldb.SBDebugger.Destroy.return_value = None
+        from morgul.bridge.debugger import Debugger
+        return Debugger()
 
     def test_create_target(self, mock_sb_debugger):
         sb_target = MagicMock()
@@ -50,14 +54,23 @@ class TestDebugger:
         mock_sb_debugger.GetCommandInterpreter.return_value = interpreter
 
         dbg = self._make_debugger(mock_sb_debugger)
-        with patch("morgul.bridge.debugger.lldb") as mock_lldb:
-            mock_lldb.SBCommandReturnObject.return_value = ret_obj
-            result = dbg.execute_command("bt")
+        self.mock_lldb.SBCommandReturnObject.return_value = ret_obj
+        result = dbg.execute_command("bt")
 
         assert isinstance(result, CommandResult)
         assert result.succeeded
         assert "main" in result.output
 
+    def test_execute_command_bumps_state_epoch(self, mock_sb_debugger, mock_sb_process):
+        from morgul.bridge.process import Process
+
+        with patch("morgul.bridge.process._build_state_map"):
+            proc = Process(mock_sb_process, MagicMock())
+        dbg = self._make_debugger(mock_sb_debugger)
+        start = proc.state_epoch
+        dbg.execute_command("memory write 0x1000 0x41")
+        assert proc.state_epoch == start + 1
+
     def test_async_mode(self, mock_sb_debugger):
         dbg = self._make_debugger(mock_sb_debugger)
         assert dbg.async_mode is False
@@ -69,15 +82,13 @@ class TestDebugger:
 
     def test_destroy(self, mock_sb_debugger):
         dbg = self._make_debugger(mock_sb_debugger)
-        with patch("morgul.bridge.debugger.lldb") as mock_lldb:
-            dbg.destroy()
+        dbg.destroy()
         assert dbg._sb is None
 
     def test_context_manager(self, mock_sb_debugger):
         dbg = self._make_debugger(mock_sb_debugger)
-        with patch("morgul.bridge.debugger.lldb"):
-            with dbg:
-                pass
+        with dbg:
+            pass
         assert dbg._sb is None
 
     def test_attach(self, mock_sb_debugger):
@@ -94,9 +105,8 @@ class TestDebugger:
         mock_sb_debugger.GetListener.return_value = MagicMock()
 
         dbg = self._make_debugger(mock_sb_debugger)
-        with patch("morgul.bridge.debugger.lldb") as mock_lldb:
-            mock_lldb.SBError.return_value = error
-            target, process = dbg.attach(12345)
+        self.mock_lldb.SBError.return_value = error
+        target, process = dbg.attach(12345)
         assert target is not None
         assert process is not None
 
@@ -114,9 +124,8 @@ class TestDebugger:
         mock_sb_debugger.GetListener.return_value = MagicMock()
 
         dbg = self._make_debugger(mock_sb_debugger)
-        with patch("morgul.bridge.debugger.lldb") as mock_lldb:
-            mock_lldb.SBError.return_value = error
-            target, process = dbg.attach_by_name("Safari")
+        self.mock_lldb.SBError.return_value = error
+        target, process = dbg.attach_by_name("Safari")
         assert target is not None
         assert process is not None
 
@@ -133,10 +142,9 @@ class TestDebugger:
         mock_sb_debugger.GetListener.return_value = MagicMock()
 
         dbg = self._make_debugger(mock_sb_debugger)
-        with patch("morgul.bridge.debugger.lldb") as mock_lldb:
-            mock_lldb.SBError.return_value = error
-            with pytest.raises(RuntimeError, match="Failed to attach to PID"):
-                dbg.attach(99999)
+        self.mock_lldb.SBError.return_value = error
+        with pytest.raises(RuntimeError, match="Failed to attach to PID"):
+            dbg.attach(99999)
 
     def test_attach_by_name_failure(self, mock_sb_debugger):
         sb_target = MagicMock()
@@ -151,15 +159,13 @@ class TestDebugger:
         mock_sb_debugger.GetListener.return_value = MagicMock()
 
         dbg = self._make_debugger(mock_sb_debugger)
-        with patch("morgul.bridge.debugger.lldb") as mock_lldb:
-            mock_lldb.SBError.return_value = error
-            with pytest.raises(RuntimeError, match="Failed to attach to process"):
-                dbg.attach_by_name("NonExistent")
+        self.mock_lldb.SBError.return_value = error
+        with pytest.raises(RuntimeError, match="Failed to attach to process"):
+            dbg.attach_by_name("NonExistent")
 
     def test_attach_empty_target_failure(self, mock_sb_debugger):
         mock_sb_debugger.CreateTarget.return_value = None
 
         dbg = self._make_debugger(mock_sb_debugger)
-        with patch("morgul.bridge.debugger.lldb") as mock_lldb:
-            with pytest.raises(RuntimeError, match="Failed to create empty target"):
-                dbg.attach(123)
+        with pytest.raises(RuntimeError, match="Failed to create empty target"):
+            dbg.attach(123)
@@ -4,34 +4,42 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from morgul.bridge.frame import Frame
 from morgul.bridge.types import RegisterValue, Variable
 
+from ._fakes import FakeSBType, FakeSBValue
+
+_INVALID_ADDRESS = 0xFFFFFFFFFFFFFFFF
+
 # Ensure the module-level ``lldb`` inside frame.py has the constant we need.
 _mock_lldb = MagicMock()
-_mock_lldb.LLDB_INVALID_ADDRESS = 0xFFFFFFFFFFFFFFFF
+_mock_lldb.LLDB_INVALID_ADDRESS = _INVALID_ADDRESS
 
 
-class TestFrame:
-    def test_pc(self, mock_sb_frame):
-        frame = Frame(mock_sb_frame)
-        assert frame.pc == 0x100003F00
+@pytest.fixture(autouse=True, scope="module")
+def _patch_lldb():
+    with patch("morgul.bridge.frame.lldb", _mock_lldb):
+        yield
 
-    def test_sp(self, mock_sb_frame):
-        frame = Frame(mock_sb_frame)
-        assert frame.sp == 0x7FF7BFEFF680
 
-    def test_fp(self, mock_sb_frame):
-        frame = Frame(mock_sb_frame)
-        assert frame.fp == 0x7FF7BFEFF690
-
-    def test_index(self, mock_sb_frame):
-        frame = Frame(mock_sb_frame)
-        assert frame.index == 0
-
-    def test_function_name(self, mock_sb_frame):
-        frame = Frame(mock_sb_frame)
-        assert frame.function_name == "main"
+class TestFrame:
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("pc", 0x100003F00),
+            ("sp", 0x7FF7BFEFF680),
+            ("fp", 0x7FF7BFEFF690),
+            ("index", 0),
+            ("function_name", "main"),
+        ],
+    )
+    def test_property(self, mock_sb_frame_basic, attr, expected):
+        frame = Frame(mock_sb_frame_basic)
+        value = getattr(frame, attr)
+        assert value == expected
+        assert type(value) is type(expected)
 
     def test_function_name_none(self, mock_sb_frame):
         mock_sb_frame.GetFunctionName.return_value = None
@@ -71,9 +79,8 @@ class TestFrame:
         assert regs[0].value == 0x42
 
     def test_variables(self, mock_sb_frame):
-        with patch("morgul.bridge.frame.lldb", _mock_lldb):
-            frame = Frame(mock_sb_frame)
-            vs = frame.variables()
+        frame = Frame(mock_sb_frame)
+        vs = frame.variables()
         assert len(vs) == 1
         assert isinstance(vs[0], Variable)
         assert vs[0].name == "argc"
@@ -81,50 +88,26 @@ class TestFrame:
 
     def test_variables_struct_expansion(self):
         """Test that _to_variable recursively expands struct children."""
-        # Build a mock struct variable with two fields
-        child1 = MagicMock(name="child_x")
-        child1.GetName.return_value = "x"
-        child1.GetTypeName.return_value = "int"
-        child1.GetValue.return_value = "10"
-        child1.GetSummary.return_value = None
-        child1.GetLoadAddress.return_value = 0xFFFFFFFFFFFFFFFF
-        child1.GetByteSize.return_value = 4
-        child1.IsValid.return_value = True
-        child1.GetNumChildren.return_value = 0
-        child1_type = MagicMock()
-        child1_type.GetTypeClass.return_value = 1  # builtin
-        child1.GetType.return_value = child1_type
-
-        child2 = MagicMock(name="child_y")
-        child2.GetName.return_value = "y"
-        child2.GetTypeName.return_value = "int"
-        child2.GetValue.return_value = "20"
-        child2.GetSummary.return_value = None
-        child2.GetLoadAddress.return_value = 0xFFFFFFFFFFFFFFFF
-        child2.GetByteSize.return_value = 4
-        child2.IsValid.return_value = True
-        child2.GetNumChildren.return_value = 0
-        child2_type = MagicMock()
-        child2_type.GetTypeClass.return_value = 1
-        child2.GetType.return_value = child2_type
-
-        # Parent struct
-        sb_val = MagicMock(name="struct_point")
-        sb_val.GetName.return_value = "pt"
-        sb_val.GetTypeName.return_value = "Point"
-        sb_val.GetValue.return_value = None
-        sb_val.GetSummary.return_value = "(x=10, y=20)"
-        sb_val.GetLoadAddress.return_value = 0x1000
-        sb_val.GetByteSize.return_value = 8
-        sb_val.IsValid.return_value = True
-        sb_val.GetNumChildren.return_value = 2
-        sb_val.GetChildAtIndex.side_effect = lambda i: [child1, child2][i]
-        sb_type = MagicMock()
-        sb_type.GetTypeClass.return_value = 2  # eTypeClassStruct (not pointer)
-        sb_val.GetType.return_value = sb_type
-
-        with patch("morgul.bridge.frame.lldb", _mock_lldb):
-            var = Frame._to_variable(sb_val)
+        # A struct with two builtin int fields
+        child1 = FakeSBValue(
+            name="x", type_name="int", value="10",
+            load_address=_INVALID_ADDRESS, byte_size=4,
+        )
+        child2 = FakeSBValue(
+            name="y", type_name="int", value="20",
+            load_address=_INVALID_ADDRESS, byte_size=4,
+        )
+        sb_val = FakeSBValue(
+            name="pt",
+            type_name="Point",
+            summary="(x=10, y=20)",
+            load_address=0x1000,
+            byte_size=8,
+            children=[child1, child2],
+            type=FakeSBType(2),  # eTypeClassStruct (not pointer)
+        )
+
+        var = Frame._to_variable(sb_val)
 
         assert var.name == "pt"
         assert var.type_name == "Point"
@@ -139,43 +122,25 @@ class TestFrame:
     def test_variables_pointer_dereference(self):
         """Test that _to_variable dereferences pointers to expand pointee fields."""
         # Field inside the pointee struct
-        field = MagicMock(name="field_val")
-        field.GetName.return_value = "value"
-        field.GetTypeName.return_value = "int"
-        field.GetValue.return_value = "42"
-        field.GetSummary.return_value = None
-        field.GetLoadAddress.return_value = 0xFFFFFFFFFFFFFFFF
-        field.GetByteSize.return_value = 4
-        field.IsValid.return_value = True
-        field.GetNumChildren.return_value = 0
-        field_type = MagicMock()
-        field_type.GetTypeClass.return_value = 1
-        field.GetType.return_value = field_type
-
-        # Pointee (dereferenced struct)
-        pointee = MagicMock(name="pointee")
-        pointee.IsValid.return_value = True
-        pointee.GetError.return_value = MagicMock(Success=MagicMock(return_value=True))
-        pointee.GetNumChildren.return_value = 1
-        pointee.GetChildAtIndex.return_value = field
-
-        # Pointer variable
-        sb_val = MagicMock(name="ptr_var")
-        sb_val.GetName.return_value = "ctx"
-        sb_val.GetTypeName.return_value = "Context *"
-        sb_val.GetValue.return_value = "0x0000000100200000"
-        sb_val.GetSummary.return_value = None
-        sb_val.GetLoadAddress.return_value = 0x7FFF5000
-        sb_val.GetByteSize.return_value = 8
-        sb_val.IsValid.return_value = True
-        sb_val.GetNumChildren.return_value = 1  # pointer has 1 synthetic child
-        sb_type = MagicMock()
-        sb_type.GetTypeClass.return_value = 65536  # eTypeClassPointer
-        sb_val.GetType.return_value = sb_type
-        sb_val.Dereference.return_value = pointee
-
-        with patch("morgul.bridge.frame.lldb", _mock_lldb):
-            var = Frame._to_variable(sb_val)
+        field = FakeSBValue(
+            name="value", type_name="int", value="42",
+            load_address=_INVALID_ADDRESS, byte_size=4,
+        )
+        pointee = FakeSBValue(children=[field])
+
+        # Pointer variable; LLDB gives it one synthetic child
+        sb_val = FakeSBValue(
+            name="ctx",
+            type_name="Context *",
+            value="0x0000000100200000",
+            load_address=0x7FFF5000,
+            byte_size=8,
+            children=[pointee],
+            type=FakeSBType(65536),  # eTypeClassPointer
+            pointee=pointee,
+        )
+
+        var = Frame._to_variable(sb_val)
 
         assert var.name == "ctx"
         assert var.type_name == "Context *"
@@ -14,7 +14,9 @@ from morgul.bridge.memory import (
     read_uint8,
     read_uint16,
     read_uint32,
+    read_uint32_array,
     read_uint64,
+    read_uint64_array,
     search_memory,
     write_uint8,
     write_uint16,
@@ -92,6 +94,18 @@ class TestFixedWidthReads:
         assert read_uint64(mock_process, 0x1000) == 0x123456789ABCDEF0
 
 
+class TestArrayReads:
+    def test_read_uint32_array(self, mock_process):
+        mock_process.read_memory.return_value = struct.pack("<3I", 1, 2, 0xDEADBEEF)
+        assert read_uint32_array(mock_process, 0x1000, 3) == [1, 2, 0xDEADBEEF]
+        mock_process.read_memory.assert_called_once_with(0x1000, 12)
+
+    def test_read_uint64_array(self, mock_process):
+        mock_process.read_memory.return_value = struct.pack("<2Q", 7, 0x123456789ABCDEF0)
+        assert read_uint64_array(mock_process, 0x1000, 2) == [7, 0x123456789ABCDEF0]
+        mock_process.read_memory.assert_called_once_with(0x1000, 16)
+
+
 class TestFixedWidthWrites:
     def test_write_uint8(self, mock_process):
         write_uint8(mock_process, 0x1000, 0x42)
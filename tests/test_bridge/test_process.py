@@ -29,6 +29,11 @@ class TestProcess:
         proc = self._make_process(mock_sb_process)
         assert proc.exit_description == ""
 
+    def test_stop_id(self, mock_sb_process):
+        mock_sb_process.GetStopID.return_value = 3
+        proc = self._make_process(mock_sb_process)
+        assert proc.stop_id == 3
+
     def test_num_threads(self, mock_sb_process):
         proc = self._make_process(mock_sb_process)
         assert proc.num_threads == 1
@@ -113,6 +118,26 @@ class TestProcess:
             written = proc.write_memory(0x1000, b"\x01\x02\x03\x04")
         assert written == 4
 
+    def test_state_epoch_bumped_by_resume_and_writes(self, mock_sb_process, mock_sb_error_success):
+        mock_sb_process.Continue.return_value = mock_sb_error_success
+        mock_sb_process.WriteMemory.return_value = 1
+        proc = self._make_process(mock_sb_process)
+        start = proc.state_epoch
+        proc.continue_()
+        assert proc.state_epoch == start + 1
+        with patch("morgul.bridge.process.lldb") as mock_lldb:
+            mock_lldb.SBError.return_value.Fail.return_value = False
+            proc.write_memory(0x1000, b"\x01")
+        assert proc.state_epoch == start + 2
+
+    def test_state_epoch_bumped_by_expressions(self, mock_sb_process, mock_sb_frame):
+        from morgul.bridge.frame import Frame
+
+        proc = self._make_process(mock_sb_process)
+        start = proc.state_epoch
+        Frame(mock_sb_frame).evaluate_expression("g = 5")
+        assert proc.state_epoch == start + 1
+
     def test_write_memory_failure(self, mock_sb_process):
         error = MagicMock()
         error.Fail.return_value = True
@@ -26,6 +26,8 @@ def _make_handler(mock_llm_client, mock_debugger):
     mock_process = MagicMock()
     mock_process.selected_thread = MagicMock()
     mock_process.selected_thread.selected_frame = MagicMock()
+    mock_process.stop_id = 1
+    mock_process.state_epoch = 0
     return ActHandler(
         mock_llm_client,
         mock_debugger,
@@ -182,3 +184,11 @@ class TestActHandler:
             result = await handler.act("show backtrace", mock_bridge_process)
             # Should attempt to execute via debugger.execute_command wrapper
             assert isinstance(result, ActResult)
+
+    def test_translate_engine_built_lazily(self, handler):
+        """TranslateEngine and ContextBuilder are not constructed until first use."""
+        assert "translate_engine" not in handler.__dict__
+        assert "context_builder" not in handler.__dict__
+        engine = handler.translate_engine
+        assert handler.translate_engine is engine
+        assert "translate_engine" in handler.__dict__
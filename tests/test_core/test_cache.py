@@ -53,3 +53,66 @@ class TestContentCache:
         cache.clear()
         assert cache.get(b"\x01") is None
         assert cache.get(b"\x02") is None
+
+    def test_embedding_lookup(self, tmp_cache_dir):
+        storage = FileStorage(directory=str(tmp_cache_dir))
+        cache = ContentCache(storage=storage)
+        cache.set_by_key("k", {"v": 1})
+        cache.set_by_embedding([1.0, 0.0], "k", scope="extract")
+        assert cache.get_by_embedding([0.99, 0.05], scope="extract") == {"v": 1}
+        assert cache.get_by_embedding([0.0, 1.0], scope="extract") is None
+        assert cache.get_by_embedding([1.0, 0.0], scope="observe") is None
+
+    def test_embedding_index_bounded(self, tmp_cache_dir):
+        storage = FileStorage(directory=str(tmp_cache_dir))
+        cache = ContentCache(storage=storage, memory_size=2)
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.set_by_embedding([1.0, float(i)], key, scope="extract")
+        assert list(cache._vectors["extract"]) == ["b", "c"]
+        cache.set_by_embedding([1.0, 0.0], "a", scope="observe")
+        cache.set_by_embedding([0.0, 1.0], "d", scope="other")
+        assert list(cache._vectors) == ["observe", "other"]
+        assert cache._num_vectors == 2
+
+    async def test_async_embedding_lookup(self, tmp_cache_dir):
+        storage = FileStorage(directory=str(tmp_cache_dir))
+        cache = ContentCache(storage=storage)
+        storage.set("k", {"v": 1})
+        cache.set_by_embedding([1.0, 0.0], "k")
+        assert await cache.aget_by_embedding([0.99, 0.05]) == {"v": 1}
+        assert await cache.aget_by_embedding([0.0, 1.0]) is None
+
+    def test_memory_layer_serves_repeat_lookups(self, tmp_cache_dir):
+        storage = FileStorage(directory=str(tmp_cache_dir))
+        cache = ContentCache(storage=storage, memory_size=1)
+        cache.set_by_key("a", {"v": 1})
+        storage.delete("a")
+        assert cache.get_by_key("a") == {"v": 1}
+        cache.set_by_key("b", {"v": 2})  # evicts "a"
+        assert cache.get_by_key("a") is None
+
+    def test_memory_layer_hands_out_copies(self, tmp_cache_dir):
+        cache = ContentCache(storage=FileStorage(directory=str(tmp_cache_dir)))
+        value = {"v": [1]}
+        cache.set_by_key("a", value)
+        value["v"].append(2)
+        first = cache.get_by_key("a")
+        first["v"].append(3)
+        assert cache.get_by_key("a") == {"v": [1]}
+
+    async def test_async_access(self, tmp_cache_dir):
+        storage = FileStorage(directory=str(tmp_cache_dir))
+        cache = ContentCache(storage=storage)
+        await cache.aset_by_key("k", {"v": 1})
+        assert storage.get("k") == {"v": 1}
+        assert await ContentCache(storage=storage).aget_by_key("k") == {"v": 1}
+        assert await cache.aget_by_key("missing") is None
+
+    async def test_set_by_key_nowait_then_flush(self, tmp_cache_dir):
+        storage = FileStorage(directory=str(tmp_cache_dir))
+        cache = ContentCache(storage=storage)
+        cache.set_by_key_nowait("k", {"v": 1})
+        assert cache.get_by_key("k") == {"v": 1}  # visible before the write lands
+        await cache.flush()
+        assert storage.get("k") == {"v": 1}
+        assert not cache._pending
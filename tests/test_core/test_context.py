@@ -40,6 +40,19 @@ def test_context_builder_format():
     assert "push rbp" in text
 
 
+def test_context_builder_register_table():
+    builder = ContextBuilder()
+    snapshot = ProcessSnapshot(
+        registers=[
+            RegisterInfo(name="rax", value=0x42, size=8),
+            RegisterInfo(name="rip", value=0x100000F00, size=8),
+        ],
+        process_state="stopped",
+    )
+    text = builder.format_for_prompt(snapshot)
+    assert "--- Registers ---\n  rax = 0x42\n  rip = 0x100000f00" in text
+
+
 def test_context_builder_prune_noop():
     """Small snapshots should not be pruned."""
     builder = ContextBuilder(max_tokens=10000)
@@ -63,3 +76,18 @@ def test_context_builder_prune_large():
     )
     pruned = builder._prune(snapshot)
     assert len(pruned.disassembly) < 2000
+
+
+def test_build_for_prompt_reused_until_state_changes():
+    from unittest.mock import MagicMock, patch
+
+    builder = ContextBuilder()
+    process = MagicMock(stop_id=1, state_epoch=0)
+    snapshot = ProcessSnapshot(registers=[], process_state="stopped")
+    with patch.object(builder, "build", return_value=snapshot) as mock_build:
+        first = builder.build_for_prompt(process)
+        assert builder.build_for_prompt(process) == first
+        assert mock_build.call_count == 1
+        process.state_epoch = 1
+        builder.build_for_prompt(process)
+        assert mock_build.call_count == 2
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import threading
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from morgul.core.events import ExecutionEventType
 from morgul.core.primitives.executor import REPL_SCAFFOLD_NAMES, RESERVED_NAMES, PythonExecutor
 
 
@@ -20,6 +23,8 @@ def _mock_process():
     process = MagicMock()
     process.selected_thread = thread
     process.pid = 12345
+    process.stop_id = 0
+    process.state_epoch = 0
     return process
 
 
@@ -104,6 +109,76 @@ class TestExecute:
         stdout, _, _ = executor.execute("print('x' * 30000)")
         assert "truncated" in stdout
 
+    def test_traceback_limited_to_executed_code(self):
+        executor = _make_executor()
+        _, stderr, success = executor.execute("def f():\n    1 / 0\nf()")
+        assert not success
+        assert "ZeroDivisionError" in stderr
+        assert stderr.count('File "<morgul-') == 2
+        assert "executor.py" not in stderr
+
+    def test_events_emitted_with_callback(self):
+        events = []
+        executor = PythonExecutor(
+            MagicMock(), MagicMock(), _mock_process(), execution_callback=events.append,
+        )
+        executor.execute("x = 1")
+        assert [e.event_type for e in events] == [
+            ExecutionEventType.CODE_START, ExecutionEventType.CODE_END,
+        ]
+        assert events[1].duration is not None
+
+    def test_no_clock_reads_without_callback(self, monkeypatch):
+        import morgul.core.primitives.executor as executor_mod
+
+        executor = _make_executor()
+        clock = MagicMock(return_value=0.0)
+        monkeypatch.setattr(executor_mod.time, "monotonic", clock)
+        assert executor.execute("x = 1")[2] is True
+        clock.assert_not_called()
+
+    def test_runaway_print_aborted(self):
+        executor = _make_executor()
+        stdout, stderr, succeeded = executor.execute(
+            "while True:\n    try:\n        print('x' * 1000)\n    except Exception:\n        pass"
+        )
+        assert succeeded is False
+        assert "execution aborted" in stderr
+        assert "truncated" in stdout
+
+    def test_runaway_print_aborted_with_timeout(self):
+        executor = PythonExecutor(MagicMock(), MagicMock(), _mock_process(), timeout=5.0)
+        stdout, stderr, succeeded = executor.execute("while True:\n    print('x' * 1000)")
+        assert succeeded is False
+        assert "execution aborted" in stderr
+
+    def test_overflow_only_interrupts_owner_thread(self):
+        from morgul.core.primitives.executor import _ListWriter, _OutputOverflow
+
+        writer = _ListWriter(limit=4)
+        errors = []
+
+        def other():
+            try:
+                writer.write("from another thread")
+            except BaseException as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        thread.join()
+        assert errors == []
+        assert writer.chunks == []
+        with pytest.raises(_OutputOverflow):
+            writer.write("owner")
+
+    def test_print_to_sys_stderr_captured(self):
+        executor = _make_executor()
+        executor.namespace["sys"] = __import__("sys")
+        _, stderr, succeeded = executor.execute("print('warn', file=sys.stderr)")
+        assert stderr == "warn\n"
+        assert succeeded is True
+
 
 class TestRefresh:
     def test_refresh_updates_thread_and_frame(self):
@@ -133,11 +208,30 @@ class TestScaffoldProtection:
         executor.execute("debugger = 'oops'")
         assert executor.namespace["debugger"] is original_debugger
 
+    def test_class_definitions_allowed(self):
+        executor = _make_executor()
+        stdout, _, success = executor.execute("class Node:\n    pass\nprint(Node.__name__)")
+        assert success
+        assert stdout == "Node\n"
+
+    def test_builtins_stay_restricted(self):
+        executor = _make_executor()
+        _, stderr, success = executor.execute("import os")
+        assert not success
+        assert "ImportError" in stderr
+        assert "open" not in executor.namespace["__builtins__"]
+
     def test_overwritten_builtin_restored(self):
         executor = _make_executor()
         executor.execute("print = None")
         assert executor.namespace["print"] is print
 
+    def test_deleted_scaffold_entry_restored(self):
+        executor = _make_executor()
+        executor.execute("del struct")
+        import struct
+        assert executor.namespace["struct"] is struct
+
     def test_user_variables_survive_scaffold_restore(self):
         executor = _make_executor()
         executor.execute("my_var = 42")
@@ -188,6 +282,20 @@ class TestInjectTools:
         with pytest.raises(ValueError, match="conflicts with reserved name"):
             executor.inject_tools({"debugger": lambda: None})
 
+    def test_inject_tools_conflict_injects_nothing(self):
+        """A conflicting name is rejected before any tool is injected."""
+        executor = _make_executor()
+        with pytest.raises(ValueError, match="conflicts with reserved name"):
+            executor.inject_tools({"my_helper": 1, "DONE": 2})
+        assert "my_helper" not in executor.namespace
+
+    def test_injected_tools_restored_after_rebind(self):
+        executor = _make_executor()
+        executor.inject_tools({"BLOCK_SIZE": 4096, "scale": {"tool": abs, "description": "d"}})
+        executor.execute("BLOCK_SIZE = 0\nscale = None")
+        assert executor.namespace["BLOCK_SIZE"] == 4096
+        assert executor.namespace["scale"] is abs
+
     def test_inject_tools_scaffold_name_rejected(self):
         """ValueError raised if tool name conflicts with REPL_SCAFFOLD_NAMES."""
         executor = _make_executor()
@@ -201,3 +309,145 @@ class TestInjectTools:
         executor.inject_tools({"my_tool": my_fn})
         executor.execute("my_tool = 'overwritten'")
         assert executor.namespace["my_tool"] is my_fn
+
+
+class TestTimeout:
+    def test_runaway_loop_interrupted(self):
+        events = []
+        executor = PythonExecutor(
+            MagicMock(), MagicMock(), _mock_process(),
+            execution_callback=events.append, timeout=0.2,
+        )
+        stdout, stderr, succeeded = executor.execute("while True:\n    pass")
+        assert succeeded is False
+        assert "timed out" in stderr
+        assert ExecutionEventType.TIMEOUT in [e.event_type for e in events]
+
+    def test_except_exception_cannot_swallow_timeout(self):
+        executor = PythonExecutor(MagicMock(), MagicMock(), _mock_process(), timeout=0.2)
+        code = "n = 0\nwhile True:\n    try:\n        n += 1\n    except Exception:\n        pass"
+        _, stderr, succeeded = executor.execute(code)
+        assert succeeded is False
+        assert "still running" not in stderr
+        n = executor.namespace["n"]
+        time.sleep(0.05)
+        assert executor.namespace["n"] == n
+
+    def test_stuck_worker_blocks_further_execution(self):
+        executor = PythonExecutor(MagicMock(), MagicMock(), _mock_process(), timeout=0.1)
+        release = threading.Event()
+        executor.namespace["block"] = release.wait
+        with patch("morgul.core.primitives.executor._TIMEOUT_GRACE", 0.05):
+            _, stderr, succeeded = executor.execute("block()")
+        assert succeeded is False
+        assert "still running" in stderr
+
+        _, stderr, succeeded = executor.execute("x = 1")
+        assert succeeded is False
+        assert "cannot run code" in stderr
+        assert "x" not in executor.namespace
+
+        release.set()
+        executor._stuck_worker.join(1.0)
+        _, _, succeeded = executor.execute("x = 1")
+        assert succeeded is True
+
+    def test_errors_propagate_from_worker(self):
+        executor = PythonExecutor(MagicMock(), MagicMock(), _mock_process(), timeout=5.0)
+        stdout, stderr, succeeded = executor.execute("print('hi')\n1/0")
+        assert "hi" in stdout
+        assert "ZeroDivisionError" in stderr
+        assert succeeded is False
+
+
+class TestRefreshStopId:
+    def test_unchanged_stop_id_skips_bridge_lookups(self):
+        executor = _make_executor()
+        executor.process.stop_id = 7
+        executor.process.state_epoch = 0
+        executor.refresh()
+        new_thread = MagicMock()
+        executor.process.selected_thread = new_thread
+        executor.refresh()
+        assert executor.namespace["thread"] is not new_thread
+
+    def test_frame_stays_current_after_resume(self):
+        """A frame rebound after a resume survives later execs that skip refresh."""
+        executor = _make_executor()
+        executor.process.selected_thread.selected_frame.name = "f0"
+
+        def resume():
+            thread = MagicMock()
+            thread.selected_frame.name = "f1"
+            executor.process.selected_thread = thread
+            executor.process.stop_id += 1
+
+        executor.namespace["resume"] = resume
+        seen = []
+        for code in ("print(frame.name)", "print(frame.name); resume()",
+                     "print(frame.name)", "print(frame.name)"):
+            stdout, _, _ = executor.execute(code)
+            seen.append(stdout.strip())
+        assert seen == ["f0", "f0", "f1", "f1"]
+
+    def test_selection_command_rebinds_without_resume(self):
+        """``frame select``/``thread select`` bump state_epoch but not stop_id."""
+        executor = _make_executor()
+        executor.process.stop_id = 7
+        executor.process.state_epoch = 0
+        executor.refresh()
+        new_thread = MagicMock()
+        executor.process.selected_thread = new_thread
+        executor.process.state_epoch = 1
+        executor.refresh()
+        assert executor.namespace["thread"] is new_thread
+        assert executor.namespace["frame"] is new_thread.selected_frame
+
+    def test_new_stop_id_rebinds_thread_and_frame(self):
+        executor = _make_executor()
+        executor.process.state_epoch = 0
+        executor.process.stop_id = 7
+        executor.refresh()
+        new_thread = MagicMock()
+        executor.process.selected_thread = new_thread
+        executor.process.stop_id = 8
+        executor.refresh()
+        assert executor.namespace["thread"] is new_thread
+        assert executor.namespace["frame"] is new_thread.selected_frame
+
+
+class TestCompileCache:
+    def test_repeated_code_reuses_code_object(self):
+        executor = _make_executor()
+        executor.execute("x = 1")
+        code_obj = executor._code_cache["x = 1"]
+        executor.execute("x = 1")
+        assert executor._code_cache["x = 1"] is code_obj
+
+    def test_optimize_strips_asserts(self):
+        executor = _make_executor()
+        executor.optimize = 2
+        stdout, stderr, success = executor.execute("assert False, 'boom'\nprint('after')")
+        assert success
+        assert stdout == "after\n"
+
+    def test_asserts_kept_by_default(self):
+        executor = _make_executor()
+        _, stderr, success = executor.execute("assert False, 'boom'")
+        assert not success
+        assert "AssertionError" in stderr
+
+    def test_cache_is_bounded(self):
+        from morgul.core.primitives.executor import _CODE_CACHE_SIZE
+
+        executor = _make_executor()
+        for i in range(_CODE_CACHE_SIZE + 5):
+            executor.execute(f"x = {i}")
+        assert len(executor._code_cache) == _CODE_CACHE_SIZE
+        assert "x = 0" not in executor._code_cache
+
+    def test_syntax_error_reported(self):
+        executor = _make_executor()
+        _, stderr, succeeded = executor.execute("def (")
+        assert succeeded is False
+        assert "SyntaxError" in stderr
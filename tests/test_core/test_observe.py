@@ -71,3 +71,27 @@ class TestObserveHandler:
                 mock_to.return_value = ObserveResult(actions=[], description="ok")
                 await handler.observe(mock_bridge_process, instruction=None)
             assert mock_to.call_args.kwargs.get("instruction") is None
+
+    async def test_context_reused_while_state_unchanged(self, handler, mock_bridge_process):
+        mock_bridge_process.stop_id = 1
+        mock_bridge_process.state_epoch = 0
+        engine = handler.translate_engine
+        with patch.object(engine, "translate_observe", new_callable=AsyncMock) as mock_to, \
+             patch.object(handler.context_builder, "build") as mock_build, \
+             patch.object(handler.context_builder, "format_for_prompt", return_value="ctx"):
+            mock_to.return_value = ObserveResult(actions=[], description="ok")
+            await handler.observe(mock_bridge_process)
+            await handler.observe(mock_bridge_process)
+            assert mock_build.call_count == 1
+
+            mock_bridge_process.stop_id = 2
+            await handler.observe(mock_bridge_process)
+            assert mock_build.call_count == 2
+
+            mock_bridge_process.state_epoch += 1
+            await handler.observe(mock_bridge_process)
+            assert mock_build.call_count == 3
+
+            handler.context_builder.invalidate()
+            await handler.observe(mock_bridge_process)
+            assert mock_build.call_count == 4
@@ -50,6 +50,8 @@ def _mock_process():
     process.selected_thread = thread
     process.read_memory.return_value = b"\xde\xad\xbe\xef" * 16
     process.pid = 12345
+    process.stop_id = 1
+    process.state_epoch = 0
     process.state = "stopped"
     process._sb = MagicMock()
     return process
@@ -777,6 +779,7 @@ class TestAgentREPLRouting:
         session._target = MagicMock()
         session._process = _mock_process()
         session._execution_callback = None
+        session._context_builder = MagicMock()
 
         mock_repl_result = REPLResult(
             result="analysis complete",
@@ -814,6 +817,7 @@ class TestAgentREPLRouting:
         session._target = MagicMock()
         session._process = _mock_process()
         session._execution_callback = None
+        session._context_builder = MagicMock()
 
         mock_repl_result = REPLResult(
             result="done", steps=1, code_blocks_executed=1,
@@ -842,6 +846,7 @@ class TestAgentREPLRouting:
         session._target = MagicMock()
         session._process = _mock_process()
         session._execution_callback = None
+        session._context_builder = MagicMock()
 
         mock_steps = [AgentStep(step_number=1, action="done", observation="ok", reasoning="ok")]
 
@@ -968,6 +973,7 @@ class TestCustomTools:
         session._target = MagicMock()
         session._process = _mock_process()
         session._execution_callback = None
+        session._context_builder = MagicMock()
         session._persistent_repl = None
 
         mock_repl_result = REPLResult(
@@ -1116,6 +1122,7 @@ class TestMultiTurnPersistence:
         session._target = MagicMock()
         session._process = _mock_process()
         session._execution_callback = None
+        session._context_builder = MagicMock()
         session._persistent_repl = None
 
         mock_result = REPLResult(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -151,6 +153,13 @@ class TestAsyncSession:
         async with session as s:
             assert s is not None
 
+    async def test_context_manager_closes_llm_client(self):
+        session = _make_async_session()
+        session.llm_client.aclose = AsyncMock()
+        async with session:
+            pass
+        session.llm_client.aclose.assert_awaited_once()
+
     # -- primitive method tests -----------------------------------------------
 
     async def test_act(self, started_session):
@@ -163,6 +172,29 @@ class TestAsyncSession:
         assert result.success is True
         started_session._act_handler.act.assert_called_once()
 
+    async def test_act_invalidates_cached_context(self, started_session):
+        started_session._act_handler.act = AsyncMock(
+            return_value=ActResult(success=True, message="ok", actions=[]),
+        )
+        started_session._context_builder._prompt_cache = (("fp",), MagicMock(), "ctx")
+        await started_session.act("write memory")
+        assert started_session._context_builder._prompt_cache is None
+
+    def test_extract_observe_handlers_built_on_first_use(self):
+        session = _make_session()._async_session
+        assert "_extract_handler" not in session.__dict__
+        assert "_observe_handler" not in session.__dict__
+        session._invalidate_contexts()
+        assert "_observe_handler" not in session.__dict__
+        handler = session._observe_handler
+        assert session._observe_handler is handler
+
+    def test_handlers_share_context_builder(self, started_session):
+        builder = started_session._context_builder
+        assert started_session._extract_handler.context_builder is builder
+        assert started_session._observe_handler.context_builder is builder
+        assert started_session._act_handler.context_builder is builder
+
     async def test_observe(self, started_session):
         expected = ObserveResult(actions=[], description="stopped")
         started_session._observe_handler.observe = AsyncMock(return_value=expected)
@@ -288,3 +320,82 @@ class TestSession:
         session._async_session._extract_handler.extract = AsyncMock(return_value=expected)
         result = session.extract("get", response_model=SampleModel)
         assert result.name == "x"
+
+    def test_run_reuses_background_loop(self):
+        """Sync calls share one background event loop until end()."""
+        session = _make_session()
+
+        async def _loop():
+            return asyncio.get_running_loop()
+
+        first = session._run(_loop())
+        assert session._run(_loop()) is first
+        thread = session._loop_thread
+        session.end()
+        assert first.is_closed()
+        assert not thread.is_alive()
+        assert session._loop is None
+
+    def test_end_closes_llm_client_on_background_loop(self):
+        session = _make_session()
+        aclose = session._async_session.llm_client.aclose = AsyncMock()
+
+        async def _noop():
+            return None
+
+        session._run(_noop())
+        session.end()
+        aclose.assert_awaited_once()
+
+    def test_interrupted_run_cancels_coroutine(self):
+        """Ctrl+C while waiting cancels the call on the background loop."""
+        session = _make_session()
+        started = threading.Event()
+        cancelled = threading.Event()
+
+        async def _forever():
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        real_submit = asyncio.run_coroutine_threadsafe
+
+        def _submit(coro, loop):
+            future = real_submit(coro, loop)
+            started.wait(1.0)
+            future.result = MagicMock(side_effect=KeyboardInterrupt)
+            return future
+
+        with patch("morgul.core.session.asyncio.run_coroutine_threadsafe", _submit):
+            with pytest.raises(KeyboardInterrupt):
+                session._run(_forever())
+        assert cancelled.wait(1.0)
+        session.end()
+
+    def test_run_from_loop_thread_raises(self):
+        """A sync call from the session's loop thread fails instead of deadlocking."""
+        session = _make_session()
+
+        async def _nested():
+            async def _inner():
+                return 1
+
+            return session._run(_inner())
+
+        with pytest.raises(RuntimeError, match="own event loop"):
+            session._run(_nested())
+        session.end()
+
+    async def test_run_inside_running_loop(self):
+        """_run works when the caller already has a loop running (e.g. Jupyter)."""
+        session = _make_session()
+
+        async def _value(v):
+            return v
+
+        assert session._run(_value(1)) == 1
+        assert session._loop is not asyncio.get_running_loop()
+        session.end()
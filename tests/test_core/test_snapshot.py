@@ -116,3 +116,11 @@ class TestCaptureSnapshot:
         snap = capture_snapshot(process)
         assert len(snap.modules) == 1
         assert snap.modules[0].name == "a.out"
+
+    def test_snapshot_matches_validated_model(self):
+        frame = self._make_frame()
+        thread = self._make_thread(frame)
+        process = self._make_process(thread)
+        snap = capture_snapshot(process)
+        # Built without validation, but must still be a valid snapshot
+        assert ProcessSnapshot.model_validate(snap.model_dump()) == snap
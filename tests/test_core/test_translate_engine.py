@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pydantic import BaseModel
@@ -43,6 +44,18 @@ class TestTranslateEngine:
         assert isinstance(result, TranslateResponse)
         assert result.code == "print(thread.get_frames())"
 
+    async def test_translate_sends_static_system_prompt(self, engine, snapshot):
+        from morgul.core.translate.prompts import ACT_SYSTEM_PROMPT
+
+        engine.llm.chat_structured.return_value = TranslateResponse(code="pass")
+        await engine.translate("show backtrace", snapshot, "context text")
+        system, user = engine.llm.chat_structured.call_args.kwargs["messages"]
+        assert system.role == "system"
+        assert system.content == ACT_SYSTEM_PROMPT
+        assert system.cache_control is None
+        assert "context text" in user.content
+        assert "show backtrace" in user.content
+
     async def test_translate_with_actions(self, engine, snapshot):
         expected = TranslateResponse(
             actions=[Action(code="print('hello')", description="greet")],
@@ -96,6 +109,21 @@ class TestTranslateEngine:
         assert isinstance(result, SampleExtract)
         assert result.function_name == "main"
 
+    async def test_translate_extract_reuses_schema_text(self, engine):
+        class Fresh(BaseModel):
+            value: int
+
+        engine.llm.chat_structured.return_value = Fresh(value=1)
+        with patch(
+            "morgul.core.translate.engine.pydantic_to_json_schema",
+            return_value={"type": "object"},
+        ) as schema:
+            await engine.translate_extract("a", "ctx", Fresh)
+            await engine.translate_extract("b", "ctx", Fresh)
+        assert schema.call_count == 1
+        prompt = engine.llm.chat_structured.call_args.kwargs["messages"][-1].content
+        assert '"type": "object"' in prompt
+
     async def test_translate_observe(self, engine):
         expected = ObserveResult(
             actions=[Action(code="print(thread.get_frames())", description="backtrace")],
@@ -126,6 +154,68 @@ class TestTranslateEngine:
         result = await engine.translate_observe(context_text="context")
         assert isinstance(result, ObserveResult)
 
+    async def test_translate_observe_batch_dedups_and_keeps_order(self, engine):
+        async def respond(messages, response_model):
+            return ObserveResult(actions=[], description=messages[-1].content)
+
+        engine.llm.chat_structured.side_effect = respond
+
+        results = await engine.translate_observe_batch(
+            [("ctx-a", None), ("ctx-b", "heap"), ("ctx-a", None)]
+        )
+        assert engine.llm.chat_structured.await_count == 2
+        assert "ctx-a" in results[0].description
+        assert "ctx-b" in results[1].description
+        assert results[2] is results[0]
+
+    async def test_translate_observe_stream_yields_before_completion(self, engine):
+        body = json.dumps({
+            "actions": [
+                {"code": "print('{')", "description": "first"},
+                {"code": "print(2)", "description": "second"},
+            ],
+            "description": "ok",
+        })
+        split = body.index("second") - 10
+        sent = []
+
+        async def chat_stream(messages):
+            for piece in (body[:20], body[20:split], body[split:]):
+                sent.append(piece)
+                yield piece
+
+        engine.llm.chat_stream = chat_stream
+        seen = []
+        async for action in engine.translate_observe_stream("ctx"):
+            seen.append((action.description, len(sent)))
+
+        assert seen == [("first", 2), ("second", 3)]
+
+    async def test_translate_observe_stream_without_streaming_client(self, engine):
+        del engine.llm.chat_stream
+        engine.llm.chat_structured.return_value = ObserveResult(
+            actions=[Action(code="print(1)", description="one")], description="d"
+        )
+        actions = [a async for a in engine.translate_observe_stream("ctx")]
+        assert [a.description for a in actions] == ["one"]
+
+    def test_cache_key_is_stable_and_part_sensitive(self):
+        engine = TranslateEngine(MagicMock())
+        key = engine._cache_key("a", "b")
+        assert len(key) == 16
+        assert key == engine._cache_key("a", "b")
+        assert key != engine._cache_key("ab")
+        assert key != engine._cache_key("a", "c")
+
+    def test_context_digest_reused_for_same_text(self):
+        engine = TranslateEngine(MagicMock())
+        with patch.object(engine, "_cache_key", wraps=engine._cache_key) as key:
+            first = engine._context_digest("ctx" * 100)
+            assert engine._context_digest("ctx" * 100) == first
+            assert key.call_count == 1
+            assert engine._context_digest("other") != first
+            assert key.call_count == 2
+
     def test_parse_raw_response_code_format(self):
         engine = TranslateEngine(MagicMock())
         result = engine._parse_raw_response(
@@ -145,6 +235,13 @@ class TestTranslateEngine:
         result = engine._parse_raw_response("print(frame.registers)")
         assert result.code == "print(frame.registers)"
 
+    def test_parse_raw_response_surrounded_by_prose(self):
+        engine = TranslateEngine(MagicMock())
+        result = engine._parse_raw_response(
+            'Use a dict like {x}. {"code": "print(\'}\')", "reasoning": "r"} done}'
+        )
+        assert result.code == "print('}')"
+
     def test_parse_observe_response_valid(self):
         engine = TranslateEngine(MagicMock())
         result = engine._parse_observe_response(
@@ -152,8 +249,93 @@ class TestTranslateEngine:
         )
         assert result.actions[0].code == "print(1)"
 
+    def test_parse_observe_response_wrong_field_types(self):
+        engine = TranslateEngine(MagicMock())
+        result = engine._parse_observe_response(
+            '{"actions": [{"code": 1, "description": "test"}], "description": "ok"}'
+        )
+        assert result.actions == []
+        assert "Failed" in result.description
+
     def test_parse_observe_response_invalid(self):
         engine = TranslateEngine(MagicMock())
         result = engine._parse_observe_response("unparseable")
         assert result.actions == []
         assert "Failed" in result.description
+
+
+class TestSemanticCache:
+    @staticmethod
+    def _embedder(text):
+        # Paraphrases of "registers" map to the same direction.
+        return [1.0, 0.0] if "register" in text else [0.0, 1.0]
+
+    @pytest.fixture()
+    def engine(self, mock_llm_client, tmp_cache_dir):
+        from morgul.core.cache import ContentCache, FileStorage
+
+        cache = ContentCache(storage=FileStorage(directory=str(tmp_cache_dir)))
+        return TranslateEngine(mock_llm_client, cache=cache, embedder=self._embedder)
+
+    async def test_paraphrase_hits_semantic_cache(self, engine):
+        engine.llm.chat_structured.return_value = SampleExtract(function_name="main", address=1)
+        await engine.translate_extract("show registers", "ctx", SampleExtract)
+        result = await engine.translate_extract("print the registers", "ctx", SampleExtract)
+        assert result.function_name == "main"
+        assert engine.llm.chat_structured.await_count == 1
+
+    async def test_semantic_hit_scoped_to_context(self, engine):
+        engine.llm.chat_structured.return_value = SampleExtract(function_name="main", address=1)
+        await engine.translate_extract("show registers", "ctx", SampleExtract)
+        await engine.translate_extract("print the registers", "other ctx", SampleExtract)
+        assert engine.llm.chat_structured.await_count == 2
+
+    async def test_dissimilar_instruction_misses(self, engine):
+        engine.llm.chat_structured.return_value = ObserveResult(actions=[], description="ok")
+        await engine.translate_observe("ctx", instruction="check registers")
+        await engine.translate_observe("ctx", instruction="walk the heap")
+        assert engine.llm.chat_structured.await_count == 2
+
+    async def test_semantic_hit_backfills_exact_key(self, engine):
+        from morgul.core.translate.engine import CacheStatus
+
+        engine.llm.chat_structured.return_value = SampleExtract(function_name="main", address=1)
+        await engine.translate_extract("show registers", "ctx", SampleExtract)
+        assert engine.last_cache_status is CacheStatus.MISS
+        await engine.translate_extract("print the registers", "ctx", SampleExtract)
+        assert engine.last_cache_status is CacheStatus.HIT_L2
+        await engine.translate_extract("print the registers", "ctx", SampleExtract)
+        assert engine.last_cache_status is CacheStatus.HIT_L1
+        assert engine.llm.chat_structured.await_count == 1
+
+    async def test_stream_cache_hit_looks_up_once(self, engine):
+        from morgul.core.translate.engine import CacheStatus
+
+        engine.llm.chat_structured.return_value = ObserveResult(
+            actions=[Action(code="print(1)", description="one")], description="d"
+        )
+        await engine.translate_observe("ctx")
+        engine.llm.chat_stream = MagicMock()
+
+        with patch.object(engine._cache, "aget_by_key", wraps=engine._cache.aget_by_key) as get:
+            actions = [a async for a in engine.translate_observe_stream("ctx")]
+
+        assert [a.description for a in actions] == ["one"]
+        assert get.await_count == 1
+        assert engine.last_cache_status is CacheStatus.HIT_L1
+        engine.llm.chat_stream.assert_not_called()
+
+    async def test_cache_status_is_per_task(self, engine):
+        from morgul.core.translate.engine import CacheStatus
+
+        engine.llm.chat_structured.return_value = ObserveResult(actions=[], description="ok")
+        await engine.translate_observe("ctx", instruction="walk the heap")
+
+        async def observe(instruction):
+            await engine.translate_observe("ctx", instruction=instruction)
+            await asyncio.sleep(0)
+            return engine.last_cache_status
+
+        statuses = await asyncio.gather(observe("walk the heap"), observe("check registers"))
+        assert statuses == [CacheStatus.HIT_L1, CacheStatus.MISS]
+        assert engine.last_cache_status is CacheStatus.MISS
@@ -34,6 +34,17 @@ class TestPromptTemplates:
         assert "{instruction}" in EXTRACT_PROMPT
         assert "{schema}" in EXTRACT_PROMPT
 
+    def test_system_prompts_are_static(self):
+        from morgul.core.translate.prompts import (
+            ACT_SYSTEM_PROMPT,
+            EXTRACT_SYSTEM_PROMPT,
+            OBSERVE_SYSTEM_PROMPT,
+        )
+
+        for prompt in (ACT_SYSTEM_PROMPT, EXTRACT_SYSTEM_PROMPT, OBSERVE_SYSTEM_PROMPT):
+            assert "{context}" not in prompt
+            assert "{instruction" not in prompt
+
     def test_observe_prompt_has_placeholders(self):
         assert "{context}" in OBSERVE_PROMPT
         assert "{instruction_section}" in OBSERVE_PROMPT
@@ -73,3 +84,31 @@ class TestPromptTemplates:
         assert "read_string" in BRIDGE_API_REFERENCE
         assert "read_pointer" in BRIDGE_API_REFERENCE
         assert "read_uint64" in BRIDGE_API_REFERENCE
+
+    def test_renderers_match_str_format(self):
+        from morgul.core.translate.prompts import (
+            ACT_USER_PROMPT,
+            EXTRACT_USER_PROMPT,
+            OBSERVE_USER_PROMPT,
+            render_act,
+            render_agent_system,
+            render_extract,
+            render_observe,
+        )
+
+        # "$" in values must pass through untouched
+        assert render_act("$ctx", "do {x}") == ACT_USER_PROMPT.format(
+            context="$ctx", instruction="do {x}"
+        )
+        assert render_extract("ctx", "get", "{}") == EXTRACT_USER_PROMPT.format(
+            context="ctx", instruction="get", schema="{}"
+        )
+        assert render_observe("ctx", "heap") == OBSERVE_USER_PROMPT.format(
+            context="ctx", instruction_section="## User Focus\nheap"
+        )
+        assert render_observe("ctx") == OBSERVE_USER_PROMPT.format(
+            context="ctx", instruction_section=""
+        )
+        assert render_agent_system("depth-first", "desc", "task", 5) == AGENT_SYSTEM_PROMPT.format(
+            strategy="depth-first", strategy_description="desc", task="task", max_steps=5
+        )
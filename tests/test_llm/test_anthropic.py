@@ -58,6 +58,17 @@ class TestAnthropicClient:
         assert len(result.tool_calls) == 1
         assert result.tool_calls[0].name == "act"
 
+    def test_tool_dicts_reused_across_calls(self, client):
+        tool = ToolDefinition(name="act", description="Act", parameters={"type": "object"})
+        other = ToolDefinition(name="act", description="Act", parameters={"type": "object"})
+
+        first = client._tools_to_anthropic([tool])
+        second = client._tools_to_anthropic([tool, other])
+
+        assert second[0] is first[0]
+        assert second[1] is not first[0]
+        assert second[1] == first[0]
+
     async def test_chat_api_error(self, client):
         client._client.messages.create = AsyncMock(side_effect=Exception("API error"))
 
@@ -95,6 +106,19 @@ class TestAnthropicClient:
         result = await client.chat_structured(messages, response_model=SimpleOutput)
         assert result.answer == "hello"
 
+    async def test_chat_structured_keeps_caller_tools(self, client, mock_anthropic_response):
+        text_block = MagicMock()
+        text_block.type = "text"
+        text_block.text = '{"answer": "hi", "confidence": 0.1}'
+        mock_anthropic_response.content = [text_block]
+        client._client.messages.create = AsyncMock(return_value=mock_anthropic_response)
+
+        extra = ToolDefinition(name="lookup", description="d", parameters={"type": "object"})
+        messages = [ChatMessage(role="user", content="Extract")]
+        await client.chat_structured(messages, response_model=SimpleOutput, tools=[extra])
+        sent = client._client.messages.create.call_args.kwargs["tools"]
+        assert [t["name"] for t in sent] == ["lookup", "extract_simpleoutput"]
+
     def test_to_anthropic_messages_system(self):
         from morgul.llm.anthropic import AnthropicClient
         messages = [
@@ -106,6 +130,30 @@ class TestAnthropicClient:
         assert len(api) == 1
         assert api[0]["role"] == "user"
 
+    def test_to_anthropic_messages_multiple_system(self):
+        from morgul.llm.anthropic import AnthropicClient
+        messages = [
+            ChatMessage(role="system", content="One"),
+            ChatMessage(role="user", content="Hi"),
+            ChatMessage(role="system", content="Two"),
+        ]
+        system, api = AnthropicClient._to_anthropic_messages(messages)
+        assert system == "One\n\nTwo"
+        assert [m["content"] for m in api] == ["Hi"]
+        assert AnthropicClient._to_anthropic_messages(messages[1:2])[0] is None
+
+    def test_to_anthropic_messages_cache_control(self):
+        from morgul.llm.anthropic import AnthropicClient
+        messages = [
+            ChatMessage(role="system", content="Reference", cache_control="ephemeral"),
+            ChatMessage(role="user", content="Hi"),
+        ]
+        system, api = AnthropicClient._to_anthropic_messages(messages)
+        assert system == [
+            {"type": "text", "text": "Reference", "cache_control": {"type": "ephemeral"}},
+        ]
+        assert api[0]["content"] == "Hi"
+
     def test_to_anthropic_messages_tool_result(self):
         from morgul.llm.anthropic import AnthropicClient
         messages = [
@@ -150,3 +198,169 @@ class TestAnthropicClient:
         result = AnthropicClient._from_anthropic_response(response)
         assert result.content == "hello"
         assert result.usage is None
+
+    def test_from_anthropic_response_joins_text_blocks(self):
+        from morgul.llm.anthropic import AnthropicClient
+        blocks = []
+        for text in ("a", "b", "c"):
+            block = MagicMock()
+            block.type = "text"
+            block.text = text
+            blocks.append(block)
+
+        response = MagicMock()
+        response.content = blocks
+        response.usage = None
+
+        result = AnthropicClient._from_anthropic_response(response)
+        assert result.content == "a\nb\nc"
+        assert result.tool_calls is None
+
+    def test_from_anthropic_response_empty(self):
+        from morgul.llm.anthropic import AnthropicClient
+        response = MagicMock(spec=["content"])
+        response.content = []
+
+        result = AnthropicClient._from_anthropic_response(response)
+        assert result.content == ""
+        assert result.usage is None
+
+
+class TestAnthropicResponseCache:
+    @pytest.fixture()
+    def client(self, anthropic_config):
+        mock_sdk = MagicMock()
+        mock_sdk.AsyncAnthropic.return_value = AsyncMock()
+        config = anthropic_config.model_copy(update={"enable_cache": True})
+        with patch.dict(sys.modules, {"anthropic": mock_sdk}):
+            from morgul.llm.anthropic import AnthropicClient
+            c = AnthropicClient(config)
+        return c
+
+    async def test_identical_requests_hit_cache(self, client, mock_anthropic_response):
+        create = AsyncMock(return_value=mock_anthropic_response)
+        client._client.messages.create = create
+
+        messages = [ChatMessage(role="user", content="Hello")]
+        first = await client.chat(messages)
+        second = await client.chat([ChatMessage(role="user", content="Hello")])
+        assert second is first
+        assert create.await_count == 1
+
+        await client.chat([ChatMessage(role="user", content="Bye")])
+        assert create.await_count == 2
+
+    async def test_cache_disabled_by_default(self, anthropic_config):
+        mock_sdk = MagicMock()
+        mock_sdk.AsyncAnthropic.return_value = AsyncMock()
+        with patch.dict(sys.modules, {"anthropic": mock_sdk}):
+            from morgul.llm.anthropic import AnthropicClient
+            client = AnthropicClient(anthropic_config)
+        assert client._response_cache is None
+
+
+class TestToolFormatCache:
+    def test_converts_each_tool_once(self):
+        from morgul.llm.cache import ToolFormatCache
+
+        convert = MagicMock(side_effect=lambda t: {"name": t.name})
+        cache = ToolFormatCache(convert)
+        a = ToolDefinition(name="a", description="A")
+        b = ToolDefinition(name="b", description="B")
+
+        first = cache.convert_all([a, b])
+        second = cache.convert_all([a, b])
+
+        assert first == [{"name": "a"}, {"name": "b"}]
+        assert second[0] is first[0] and second[1] is first[1]
+        assert convert.call_count == 2
+
+    def test_cleared_when_full(self):
+        from morgul.llm.cache import ToolFormatCache
+
+        cache = ToolFormatCache(lambda t: {"name": t.name}, maxsize=2)
+        tools = [ToolDefinition(name=str(i), description="") for i in range(3)]
+        cache.convert_all(tools)
+        assert len(cache) == 1
+
+
+class TestAnthropicTransport:
+    def test_pooled_http_client(self, anthropic_config):
+        mock_sdk = MagicMock()
+        mock_sdk.AsyncAnthropic.return_value = AsyncMock()
+        config = anthropic_config.model_copy(update={"http_keepalive_expiry": 42.0})
+        with patch.dict(sys.modules, {"anthropic": mock_sdk}):
+            from morgul.llm.anthropic import AnthropicClient
+            AnthropicClient(config)
+
+        limits = mock_sdk.DefaultAsyncHttpxClient.call_args.kwargs["limits"]
+        assert limits.keepalive_expiry == 42.0
+        assert limits.max_keepalive_connections == config.http_max_keepalive
+        http_client = mock_sdk.DefaultAsyncHttpxClient.return_value
+        assert mock_sdk.AsyncAnthropic.call_args.kwargs["http_client"] is http_client
+
+    async def test_aclose(self, anthropic_config):
+        mock_sdk = MagicMock()
+        mock_sdk.AsyncAnthropic.return_value = AsyncMock()
+        with patch.dict(sys.modules, {"anthropic": mock_sdk}):
+            from morgul.llm.anthropic import AnthropicClient
+            client = AnthropicClient(anthropic_config)
+        await client.aclose()
+        client._client.close.assert_awaited_once()
+
+
+class _FakeStream:
+    def __init__(self, chunks, final):
+        self._chunks = chunks
+        self._final = final
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self._chunks:
+            yield chunk
+
+    async def get_final_message(self):
+        return self._final
+
+
+class TestAnthropicStreaming:
+    @pytest.fixture()
+    def client(self, anthropic_config):
+        mock_sdk = MagicMock()
+        mock_sdk.AsyncAnthropic.return_value = AsyncMock()
+        config = anthropic_config.model_copy(update={"enable_cache": True})
+        with patch.dict(sys.modules, {"anthropic": mock_sdk}):
+            from morgul.llm.anthropic import AnthropicClient
+            c = AnthropicClient(config)
+        return c
+
+    async def test_chat_stream_yields_text(self, client, mock_anthropic_response):
+        client._client.messages.stream = MagicMock(
+            return_value=_FakeStream(["Here is ", "my response"], mock_anthropic_response)
+        )
+        messages = [
+            ChatMessage(role="system", content="sys"),
+            ChatMessage(role="user", content="Hi"),
+        ]
+
+        chunks = [c async for c in client.chat_stream(messages)]
+
+        assert chunks == ["Here is ", "my response"]
+        kwargs = client._client.messages.stream.call_args.kwargs
+        assert kwargs["system"] == "sys"
+
+        # The completed message was cached, so a repeat is served whole
+        again = [c async for c in client.chat_stream(messages)]
+        assert again == ["Here is my response"]
+        assert client._client.messages.stream.call_count == 1
+
+    def test_satisfies_streaming_protocol(self, client):
+        from morgul.llm.client import StreamingLLMClient
+
+        assert isinstance(client, StreamingLLMClient)
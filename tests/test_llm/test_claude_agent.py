@@ -0,0 +1,133 @@
+"""Tests for ClaudeAgentClient helpers with a mocked SDK."""
+
+from __future__ import annotations
+
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from morgul.llm import claude_agent
+from morgul.llm.types import ToolDefinition
+
+
+@pytest.fixture()
+def mock_sdk(monkeypatch):
+    sdk = MagicMock()
+    # @tool(name, description, params) returns a decorator; keep the handler
+    sdk.tool.side_effect = lambda name, desc, params: (lambda fn: (name, params, fn))
+    monkeypatch.setattr(claude_agent, "_sdk", None)
+    with patch.dict(sys.modules, {"claude_agent_sdk": sdk}):
+        yield sdk
+
+
+class TestBuildMcpTools:
+    def test_param_types_from_schema(self, mock_sdk):
+        tools = [
+            ToolDefinition(
+                name="read_memory",
+                description="Read memory",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "address": {"type": "integer"},
+                        "size": {"type": "number"},
+                        "label": {},
+                        "raw": {"type": "array"},
+                    },
+                },
+            ),
+            ToolDefinition(name="done", description="Finish"),
+        ]
+        built = claude_agent._build_mcp_tools(tools, AsyncMock(), [])
+
+        assert built[0][1] == {"address": int, "size": float, "label": str, "raw": str}
+        assert built[1][1] == {}
+
+    def test_sdk_imported_once(self, mock_sdk):
+        claude_agent._build_mcp_tools([], AsyncMock(), [])
+        with patch.dict(sys.modules, {"claude_agent_sdk": None}):
+            # Cached: no re-import, so a missing module is not noticed
+            claude_agent._build_mcp_tools([], AsyncMock(), [])
+
+    async def test_handler_logs_result(self, mock_sdk):
+        log: list = []
+        executor = AsyncMock(return_value="ok")
+        tools = [ToolDefinition(name="act", description="Act")]
+        (_, _, handler), = claude_agent._build_mcp_tools(tools, executor, log)
+
+        result = await handler({"instruction": "bt"})
+
+        executor.assert_awaited_once_with("act", {"instruction": "bt"})
+        assert log == [{"name": "act", "arguments": {"instruction": "bt"}, "result": "ok"}]
+        assert result == {"content": [{"type": "text", "text": "ok"}]}
+
+
+class _Block:
+    def __init__(self, **kw):
+        self.__dict__.update(kw)
+
+
+class _Text(_Block):
+    pass
+
+
+class _ToolUse(_Block):
+    pass
+
+
+class _Assistant(_Block):
+    pass
+
+
+@pytest.fixture()
+def sdk_session(mock_sdk):
+    """Wire the mocked SDK so one session emits a tool call and a final text."""
+    mock_sdk.AssistantMessage = _Assistant
+    mock_sdk.TextBlock = _Text
+    mock_sdk.ToolUseBlock = _ToolUse
+
+    session = MagicMock()
+    session.query = AsyncMock()
+
+    async def receive_response():
+        (_, _, handler), = mock_sdk.create_sdk_mcp_server.call_args.kwargs["tools"]
+        await handler({"instruction": "bt"})
+        yield _Assistant(content=[_ToolUse(name="act", input={"instruction": "bt"})])
+        yield _Assistant(content=[_Text(text="finished")])
+
+    session.receive_response = receive_response
+    mock_sdk.ClaudeSDKClient.return_value.__aenter__ = AsyncMock(return_value=session)
+    mock_sdk.ClaudeSDKClient.return_value.__aexit__ = AsyncMock(return_value=False)
+    return mock_sdk
+
+
+class TestClaudeAgentClient:
+    async def test_run_agent(self, sdk_session):
+        tools = [ToolDefinition(name="act", description="Act")]
+        client = claude_agent.ClaudeAgentClient(model="sonnet")
+
+        result = await client.run_agent("go", tools, AsyncMock(return_value="ok"))
+
+        assert result.result == "finished"
+        assert result.steps == 1
+        assert result.tool_calls == [
+            {"name": "act", "arguments": {"instruction": "bt"}, "result": "ok"}
+        ]
+        options = sdk_session.ClaudeAgentOptions.return_value
+        assert options.model == "sonnet"
+        assert sdk_session.ClaudeAgentOptions.call_args.kwargs["allowed_tools"] == [
+            "mcp__morgul-lldb__act"
+        ]
+
+    async def test_run_agent_stream(self, sdk_session):
+        tools = [ToolDefinition(name="act", description="Act")]
+        client = claude_agent.ClaudeAgentClient()
+
+        events = [
+            e async for e in client.run_agent_stream("go", tools, AsyncMock(return_value="ok"))
+        ]
+
+        assert [e.type for e in events] == ["tool_call", "tool_result", "text", "done"]
+        assert events[1].data == {"name": "act", "result": "ok"}
+        assert events[-1].data == "finished"
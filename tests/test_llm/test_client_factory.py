@@ -47,3 +47,47 @@ class TestCreateLLMClient:
         with patch.dict(sys.modules, {"anthropic": None}):
             with pytest.raises((ImportError, ModuleNotFoundError)):
                 create_llm_client(anthropic_config)
+
+
+class TestChatMany:
+    async def test_bounded_concurrency_and_order(self):
+        import asyncio
+
+        from morgul.llm.client import chat_many
+        from morgul.llm.types import ChatMessage, LLMResponse
+
+        in_flight = 0
+        peak = 0
+
+        class FakeClient:
+            async def chat(self, messages, tools=None):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return LLMResponse(content=messages[0].content)
+
+        conversations = [[ChatMessage(role="user", content=str(i))] for i in range(6)]
+        results = await chat_many(FakeClient(), conversations, max_concurrency=2)
+
+        assert [r.content for r in results] == [str(i) for i in range(6)]
+        assert peak == 2
+
+    async def test_structured_variant(self):
+        from pydantic import BaseModel
+
+        from morgul.llm.client import chat_structured_many
+        from morgul.llm.types import ChatMessage
+
+        class Answer(BaseModel):
+            value: str
+
+        class FakeClient:
+            async def chat_structured(self, messages, response_model, tools=None):
+                return response_model(value=messages[0].content.upper())
+
+        conversations = [[ChatMessage(role="user", content=c)] for c in "abc"]
+        results = await chat_structured_many(FakeClient(), conversations, Answer)
+
+        assert [r.value for r in results] == ["A", "B", "C"]
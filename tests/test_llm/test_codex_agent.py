@@ -0,0 +1,75 @@
+"""Tests for CodexClient's JSONL event handling."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from morgul.llm.codex_agent import CodexClient
+
+
+def _make_proc(lines):
+    proc = MagicMock()
+    proc.stdout.readline = AsyncMock(side_effect=[*lines, b""])
+    proc.stdin.write = MagicMock()
+    proc.stdin.drain = AsyncMock()
+    return proc
+
+
+class TestProcessEvents:
+    async def test_tool_call_round_trip(self):
+        proc = _make_proc([
+            b"\n",
+            b"not json\n",
+            b'{"type": "tool_call", "name": "act", "arguments": {"instruction": "bt"}}\n',
+            b'{"type": "done", "result": "finished"}\n',
+        ])
+        executor = AsyncMock(return_value="ok")
+
+        result, log, steps = await CodexClient()._process_events(proc, executor)
+
+        assert result == "finished"
+        assert steps == 1
+        executor.assert_awaited_once_with("act", {"instruction": "bt"})
+        (written,), _ = proc.stdin.write.call_args
+        assert written.endswith(b"\n")
+        assert json.loads(written) == {"type": "tool_result", "name": "act", "result": "ok"}
+
+    async def test_stream_events(self):
+        proc = _make_proc([
+            b'{"type": "text", "text": "hi"}\n',
+            b"\xff\xfe\n",
+            b'{"type": "done", "result": "r"}\n',
+        ])
+        events = [e async for e in CodexClient()._stream_events(proc, AsyncMock())]
+        assert [(e.type, e.data) for e in events] == [("text", "hi"), ("done", "r")]
+
+
+class TestToolResultLine:
+    def test_matches_json_dumps(self):
+        from morgul.llm.codex_agent import _tool_result_line
+
+        cases = (("act", "ok"), ('we"ird', "line\nbreak \u00e9"), ("n", {"a": [1, None]}))
+        for name, result in cases:
+            line = _tool_result_line(name, result)
+            expected = json.dumps({"type": "tool_result", "name": name, "result": result})
+            assert line == (expected + "\n").encode("utf-8")
+
+
+class TestSpawn:
+    async def test_large_stream_limit(self):
+        from unittest.mock import patch
+
+        from morgul.llm import codex_agent
+
+        with patch.object(
+            codex_agent.asyncio, "create_subprocess_exec", AsyncMock()
+        ) as spawn:
+            await CodexClient(cli_path="codex")._spawn(["codex", "--json"])
+        assert spawn.call_args.kwargs["limit"] == codex_agent._STREAM_LIMIT
+
+    async def test_missing_cli(self):
+        import pytest
+
+        with pytest.raises(RuntimeError, match="Codex CLI not found"):
+            await CodexClient(cli_path="/nonexistent/codex")._spawn(["/nonexistent/codex"])
@@ -0,0 +1,187 @@
+"""Tests for InstrumentedLLMClient event hooks."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from morgul.llm.events import InstrumentedLLMClient
+from morgul.llm.types import ChatMessage, LLMResponse, Usage
+
+
+@pytest.fixture()
+def inner():
+    client = AsyncMock()
+    client.chat.return_value = LLMResponse(
+        content="hi", usage=Usage(input_tokens=3, output_tokens=2)
+    )
+    return client
+
+
+class TestInstrumentedLLMClient:
+    async def test_chat_fires_start_and_end(self, inner):
+        callback = MagicMock()
+        client = InstrumentedLLMClient(inner, callback)
+
+        await client.chat([ChatMessage(role="user", content="x")])
+
+        assert [c.args[1] for c in callback.call_args_list] == [True, False]
+        event = callback.call_args.args[0]
+        assert event.method == "chat"
+        assert event.usage.input_tokens == 3
+        assert event.duration >= 0.0
+
+    async def test_error_is_reported(self, inner):
+        inner.chat.side_effect = RuntimeError("boom")
+        callback = MagicMock()
+        client = InstrumentedLLMClient(inner, callback)
+
+        with pytest.raises(RuntimeError):
+            await client.chat([])
+        assert callback.call_args.args[0].error == "boom"
+
+    async def test_no_callback_forwards_directly(self, inner):
+        client = InstrumentedLLMClient(inner, None)
+        response = await client.chat([])
+        assert response.content == "hi"
+
+    def test_delegated_methods_are_cached(self, inner):
+        inner.config = "cfg"
+        client = InstrumentedLLMClient(inner, None)
+
+        method = client.aclose
+        assert client.__dict__["aclose"] is method
+        assert client.config == "cfg"
+        assert "config" not in client.__dict__
+        inner.config = "new"
+        assert client.config == "new"
+
+    async def test_chat_stream_fires_start_and_end(self, inner):
+        async def stream(messages, tools):
+            yield "a"
+            yield "b"
+
+        inner.chat_stream = stream
+        callback = MagicMock()
+        client = InstrumentedLLMClient(inner, callback)
+
+        chunks = [c async for c in client.chat_stream([ChatMessage(role="user", content="x")])]
+
+        assert chunks == ["a", "b"]
+        assert [c.args[1] for c in callback.call_args_list] == [True, False]
+        assert callback.call_args.args[0].method == "chat_stream"
+
+    def test_chat_stream_missing_when_client_cannot_stream(self):
+        client = InstrumentedLLMClient(object(), MagicMock())
+        assert getattr(client, "chat_stream", None) is None
+
+
+class TestRequestCoalescing:
+    async def test_concurrent_identical_requests_share_one_call(self, inner):
+        gate = asyncio.Event()
+        response = LLMResponse(content="shared")
+
+        async def slow_chat(messages, tools):
+            await gate.wait()
+            return response
+
+        inner.chat.side_effect = slow_chat
+        callback = MagicMock()
+        client = InstrumentedLLMClient(inner, callback, coalesce=True)
+        messages = [ChatMessage(role="user", content="summarize")]
+
+        tasks = [asyncio.create_task(client.chat(messages)) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks)
+
+        assert inner.chat.await_count == 1
+        assert all(r is response for r in results)
+        assert callback.call_count == 2
+        assert client._pending == {}
+
+    async def test_not_coalesced_by_default(self, inner):
+        client = InstrumentedLLMClient(inner, None)
+        messages = [ChatMessage(role="user", content="a")]
+        await asyncio.gather(client.chat(messages), client.chat(messages))
+        assert inner.chat.await_count == 2
+
+    async def test_different_requests_are_not_coalesced(self, inner):
+        client = InstrumentedLLMClient(inner, None, coalesce=True)
+        await asyncio.gather(
+            client.chat([ChatMessage(role="user", content="a")]),
+            client.chat([ChatMessage(role="user", content="b")]),
+        )
+        assert inner.chat.await_count == 2
+
+    async def test_sequential_requests_call_again(self, inner):
+        client = InstrumentedLLMClient(inner, None, coalesce=True)
+        messages = [ChatMessage(role="user", content="a")]
+        await client.chat(messages)
+        await client.chat(messages)
+        assert inner.chat.await_count == 2
+
+    async def test_cancelling_first_caller_leaves_others_running(self, inner):
+        gate = asyncio.Event()
+        response = LLMResponse(content="shared")
+
+        async def slow_chat(messages, tools):
+            await gate.wait()
+            return response
+
+        inner.chat.side_effect = slow_chat
+        client = InstrumentedLLMClient(inner, None, coalesce=True)
+        messages = [ChatMessage(role="user", content="a")]
+
+        first = asyncio.create_task(client.chat(messages))
+        second = asyncio.create_task(client.chat(messages))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        gate.set()
+
+        assert await second is response
+        assert first.cancelled()
+        assert inner.chat.await_count == 1
+
+    async def test_request_cancelled_once_every_caller_cancels(self, inner):
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def slow_chat(messages, tools):
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        inner.chat.side_effect = slow_chat
+        client = InstrumentedLLMClient(inner, None, coalesce=True)
+        caller = asyncio.create_task(client.chat([ChatMessage(role="user", content="a")]))
+        await started.wait()
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1.0)
+        await asyncio.sleep(0)
+        assert client._pending == {}
+
+    async def test_error_propagates_to_waiters(self, inner):
+        gate = asyncio.Event()
+
+        async def failing_chat(messages, tools):
+            await gate.wait()
+            raise RuntimeError("boom")
+
+        inner.chat.side_effect = failing_chat
+        client = InstrumentedLLMClient(inner, None, coalesce=True)
+        messages = [ChatMessage(role="user", content="a")]
+
+        tasks = [asyncio.create_task(client.chat(messages)) for _ in range(2)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert inner.chat.await_count == 1
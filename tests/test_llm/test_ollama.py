@@ -68,6 +68,20 @@ class TestOllamaClient:
         assert isinstance(result, SimpleOutput)
         assert result.answer == "42"
 
+    async def test_chat_structured_schema_instruction(self, client):
+        from morgul.llm.ollama import _schema_instruction_for
+
+        client._client.chat = AsyncMock(
+            return_value={"message": {"content": '{"answer": "a", "confidence": 1}'}}
+        )
+        messages = [ChatMessage(role="user", content="Extract")]
+        await client.chat_structured(messages, response_model=SimpleOutput)
+
+        system = client._client.chat.call_args.kwargs["messages"][0]
+        assert system["role"] == "system"
+        assert '"answer"' in system["content"]
+        assert system["content"] == _schema_instruction_for(SimpleOutput)
+
     async def test_chat_structured_object_response(self, client):
         """Test when Ollama returns an object-like response instead of dict."""
         msg = MagicMock()
@@ -81,6 +95,38 @@ class TestOllamaClient:
         result = await client.chat_structured(messages, response_model=SimpleOutput)
         assert result.answer == "hello"
 
+    def test_unpack_response_object_without_message(self):
+        from morgul.llm.ollama import OllamaClient
+
+        response = MagicMock(spec=["prompt_eval_count", "eval_count"])
+        response.prompt_eval_count = 7
+        response.eval_count = 3
+        assert OllamaClient._unpack_response(response) == ("", None, 7, 3)
+
+    def test_tool_call_ids(self):
+        from morgul.llm.ollama import OllamaClient
+
+        response = {
+            "message": {
+                "content": "",
+                "tool_calls": [
+                    {"id": "call_1", "function": {"name": "act", "arguments": {}}},
+                    {"function": {"name": "step", "arguments": {}}},
+                ],
+            }
+        }
+        kept, generated = OllamaClient._from_ollama_response(response).tool_calls
+        assert kept.id == "call_1"
+        assert len(generated.id) == 32
+
+    def test_zero_usage_is_shared(self):
+        from morgul.llm.ollama import OllamaClient
+
+        first = OllamaClient._from_ollama_response({"message": {"content": "a"}})
+        second = OllamaClient._from_ollama_response({"message": {"content": "b"}})
+        assert first.usage.input_tokens == 0 and first.usage.output_tokens == 0
+        assert first.usage is second.usage
+
     def test_to_ollama_messages(self):
         from morgul.llm.ollama import OllamaClient
         messages = [
@@ -132,3 +178,77 @@ class TestOllamaClient:
         result = OllamaClient._tool_to_ollama(tool)
         assert result["type"] == "function"
         assert result["function"]["name"] == "test"
+
+
+class TestOllamaTransport:
+    def test_pooled_http_client(self, ollama_config):
+        mock_sdk = MagicMock()
+        mock_sdk.AsyncClient.return_value = AsyncMock()
+        with patch.dict(sys.modules, {"ollama": mock_sdk}):
+            from morgul.llm.ollama import OllamaClient
+            OllamaClient(ollama_config)
+
+        kwargs = mock_sdk.AsyncClient.call_args.kwargs
+        assert kwargs["limits"].keepalive_expiry == ollama_config.http_keepalive_expiry
+        assert kwargs["http2"] is ollama_config.http2
+
+    async def test_aclose(self, ollama_config):
+        mock_sdk = MagicMock()
+        mock_sdk.AsyncClient.return_value = AsyncMock()
+        with patch.dict(sys.modules, {"ollama": mock_sdk}):
+            from morgul.llm.ollama import OllamaClient
+            client = OllamaClient(ollama_config)
+        await client.aclose()
+        client._client._client.aclose.assert_awaited_once()
+
+
+class TestOllamaDirectHttp:
+    @pytest.fixture()
+    def client(self, ollama_config):
+        import httpx
+
+        mock_sdk = MagicMock()
+        mock_sdk.AsyncClient.return_value = AsyncMock()
+        config = ollama_config.model_copy(update={"direct_http": True})
+        with patch.dict(sys.modules, {"ollama": mock_sdk}):
+            from morgul.llm.ollama import OllamaClient
+            c = OllamaClient(config)
+
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "message": {
+                        "role": "assistant",
+                        "content": '{"answer": "1", "confidence": 0.5}',
+                    },
+                    "prompt_eval_count": 4,
+                    "eval_count": 2,
+                },
+            )
+
+        c._http = httpx.AsyncClient(
+            base_url="http://ollama.test", transport=httpx.MockTransport(handler)
+        )
+        return c
+
+    async def test_chat_posts_to_api(self, client):
+        messages = [ChatMessage(role="user", content="Hi")]
+        result = await client.chat(messages)
+
+        assert result.usage.input_tokens == 4
+        client._client.chat.assert_not_called()
+        (request,) = self.requests
+        assert request.url.path == "/api/chat"
+        body = json.loads(request.content)
+        assert body["stream"] is False
+        assert body["messages"] == [{"role": "user", "content": "Hi"}]
+
+    async def test_chat_structured(self, client):
+        messages = [ChatMessage(role="user", content="Extract")]
+        result = await client.chat_structured(messages, response_model=SimpleOutput)
+        assert result.answer == "1"
+        assert json.loads(self.requests[0].content)["format"] == "json"
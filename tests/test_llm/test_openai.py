@@ -120,6 +120,28 @@ class TestOpenAIClient:
         assert result["type"] == "function"
         assert result["function"]["name"] == "test"
 
+    async def test_tool_dicts_reused_across_calls(self, client, mock_openai_response):
+        client._client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+        tool = ToolDefinition(name="act", description="Act", parameters={"type": "object"})
+        messages = [ChatMessage(role="user", content="Hi")]
+
+        await client.chat(messages, tools=[tool])
+        await client.chat(messages, tools=[tool])
+
+        first, second = client._client.chat.completions.create.call_args_list
+        assert second.kwargs["tools"][0] is first.kwargs["tools"][0]
+
+    async def test_raw_kept_by_default(self, client, mock_openai_response):
+        client._client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+        result = await client.chat([ChatMessage(role="user", content="Hi")])
+        assert result.raw is mock_openai_response
+
+    async def test_keep_raw_disabled(self, client, mock_openai_response):
+        client._config = client._config.model_copy(update={"keep_raw": False})
+        client._client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+        result = await client.chat([ChatMessage(role="user", content="Hi")])
+        assert result.raw is None
+
     def test_from_openai_response_no_tool_calls(self, mock_openai_response):
         from morgul.llm.openai import OpenAIClient
         result = OpenAIClient._from_openai_response(mock_openai_response)
@@ -131,3 +153,81 @@ class TestOpenAIClient:
         result = OpenAIClient._from_openai_response(mock_openai_tool_response)
         assert result.tool_calls is not None
         assert result.tool_calls[0].name == "act"
+
+
+class TestOpenAITransport:
+    def test_pooled_http_client(self, openai_config):
+        mock_sdk = MagicMock()
+        mock_sdk.AsyncOpenAI.return_value = AsyncMock()
+        config = openai_config.model_copy(update={"http_max_connections": 7})
+        with patch.dict(sys.modules, {"openai": mock_sdk}):
+            from morgul.llm.openai import OpenAIClient
+            OpenAIClient(config)
+
+        limits = mock_sdk.DefaultAsyncHttpxClient.call_args.kwargs["limits"]
+        assert limits.max_connections == 7
+        assert limits.keepalive_expiry == config.http_keepalive_expiry
+        http_client = mock_sdk.DefaultAsyncHttpxClient.return_value
+        assert mock_sdk.AsyncOpenAI.call_args.kwargs["http_client"] is http_client
+
+    async def test_aclose(self, openai_config):
+        mock_sdk = MagicMock()
+        mock_sdk.AsyncOpenAI.return_value = AsyncMock()
+        with patch.dict(sys.modules, {"openai": mock_sdk}):
+            from morgul.llm.openai import OpenAIClient
+            client = OpenAIClient(openai_config)
+        await client.aclose()
+        client._client.close.assert_awaited_once()
+
+
+class TestOpenAINativeStructured:
+    @pytest.fixture()
+    def client(self, openai_config):
+        mock_sdk = MagicMock()
+        mock_sdk.AsyncOpenAI.return_value = AsyncMock()
+        config = openai_config.model_copy(update={"structured_mode": "native"})
+        with patch.dict(sys.modules, {"openai": mock_sdk}):
+            from morgul.llm.openai import OpenAIClient
+            c = OpenAIClient(config)
+        return c
+
+    @staticmethod
+    def _completion(parsed=None, refusal=None, content=None):
+        message = MagicMock(parsed=parsed, refusal=refusal, content=content)
+        return MagicMock(choices=[MagicMock(message=message)])
+
+    async def test_uses_response_format(self, client):
+        expected = SimpleOutput(answer="42", confidence=0.9)
+        client._client.chat.completions.parse = AsyncMock(
+            return_value=self._completion(parsed=expected)
+        )
+        client._client.chat.completions.create = AsyncMock()
+
+        messages = [ChatMessage(role="user", content="Extract")]
+        result = await client.chat_structured(messages, response_model=SimpleOutput)
+
+        assert result is expected
+        kwargs = client._client.chat.completions.parse.call_args.kwargs
+        assert kwargs["response_format"] is SimpleOutput
+        assert "tools" not in kwargs
+        client._client.chat.completions.create.assert_not_called()
+
+    async def test_refusal(self, client):
+        client._client.chat.completions.parse = AsyncMock(
+            return_value=self._completion(refusal="no")
+        )
+        messages = [ChatMessage(role="user", content="Extract")]
+        with pytest.raises(ValueError, match="refused"):
+            await client.chat_structured(messages, response_model=SimpleOutput)
+
+    async def test_tools_use_extraction_tool(self, client, mock_openai_response):
+        client._client.chat.completions.parse = AsyncMock()
+        mock_openai_response.choices[0].message.content = '{"answer": "a", "confidence": 1}'
+        client._client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+
+        extra = ToolDefinition(name="lookup", description="d")
+        messages = [ChatMessage(role="user", content="Extract")]
+        result = await client.chat_structured(messages, response_model=SimpleOutput, tools=[extra])
+
+        assert result.answer == "a"
+        client._client.chat.completions.parse.assert_not_called()
@@ -11,6 +11,7 @@ from morgul.llm.structured import (
     create_extraction_tool,
     parse_structured_response,
     pydantic_to_json_schema,
+    validate_structured_data,
 )
 
 
@@ -61,6 +62,23 @@ class TestPydanticToJsonSchema:
         assert "required_field" in schema["properties"]
         assert "optional_field" in schema["properties"]
 
+    def test_inline_refs_shares_ref_free_subtrees(self):
+        from morgul.llm.structured import _inline_refs
+
+        plain = {"type": "object", "properties": {"a": {"type": "string"}}}
+        schema = {"properties": {"plain": plain, "ref": {"$ref": "#/$defs/Foo"}}}
+        out = _inline_refs(schema, {"Foo": {"title": "Foo", "type": "integer"}})
+
+        assert out["properties"]["ref"] == {"type": "integer"}
+        assert out["properties"]["plain"] is plain
+        assert schema["properties"]["ref"] == {"$ref": "#/$defs/Foo"}
+        assert _inline_refs(plain, {}) is plain
+
+    def test_cached_per_model(self):
+        assert pydantic_to_json_schema(SimpleModel) is pydantic_to_json_schema(SimpleModel)
+        pydantic_to_json_schema.cache_clear()
+        assert pydantic_to_json_schema(SimpleModel) == pydantic_to_json_schema(SimpleModel)
+
 
 class TestParseStructuredResponse:
     def test_valid_json(self):
@@ -76,6 +94,19 @@ class TestParseStructuredResponse:
         with pytest.raises(ValueError, match="does not match schema"):
             parse_structured_response('{"wrong_field": "test"}', SimpleModel)
 
+    def test_json_wrapped_in_prose(self):
+        content = 'Sure! Here it is:\n```json\n{"name": "test", "value": 42}\n```'
+        result = parse_structured_response(content, SimpleModel)
+        assert result.value == 42
+
+    def test_wrapped_json_schema_mismatch(self):
+        with pytest.raises(ValueError, match="does not match schema"):
+            parse_structured_response('Result: {"wrong_field": 1}', SimpleModel)
+
+    def test_truncated_json(self):
+        with pytest.raises(ValueError, match="not valid JSON"):
+            parse_structured_response('{"name": "test", "value": 4', SimpleModel)
+
     def test_nested_model(self):
         data = '{"items": [{"name": "a", "value": 1}], "total": 1}'
         result = parse_structured_response(data, NestedModel)
@@ -83,6 +114,16 @@ class TestParseStructuredResponse:
         assert result.items[0].name == "a"
 
 
+class TestValidateStructuredData:
+    def test_valid_dict(self):
+        result = validate_structured_data({"name": "test", "value": 42}, SimpleModel)
+        assert result.value == 42
+
+    def test_schema_mismatch(self):
+        with pytest.raises(ValueError, match="does not match schema"):
+            validate_structured_data({"wrong_field": "test"}, SimpleModel)
+
+
 class TestCreateExtractionTool:
     def test_creates_tool(self):
         tool = create_extraction_tool(SimpleModel)
@@ -94,3 +135,7 @@ class TestCreateExtractionTool:
         tool = create_extraction_tool(SimpleModel)
         assert "properties" in tool.parameters
         assert "name" in tool.parameters["properties"]
+
+    def test_cached_per_model(self):
+        assert create_extraction_tool(SimpleModel) is create_extraction_tool(SimpleModel)
+        assert create_extraction_tool(SimpleModel) is not create_extraction_tool(NestedModel)
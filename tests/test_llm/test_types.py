@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import pytest
 from pydantic import BaseModel
 
 from morgul.llm.types import ChatMessage, ModelConfig, ToolCall, ToolDefinition, ToolResult, Usage
@@ -46,6 +47,16 @@ def test_usage():
     assert usage.input_tokens == 100
 
 
+def test_zero_usage_is_frozen():
+    from pydantic import ValidationError
+
+    from morgul.llm.types import _ZERO_USAGE
+
+    with pytest.raises(ValidationError):
+        _ZERO_USAGE.input_tokens = 5
+    assert _ZERO_USAGE.input_tokens == 0
+
+
 class SampleModel(BaseModel):
     name: str
     value: int
@@ -68,3 +79,17 @@ def test_create_extraction_tool():
     tool = create_extraction_tool(SampleModel)
     assert tool.name == "extract_samplemodel"
     assert "SampleModel" in tool.description
+
+
+def test_response_cache_lru():
+    from morgul.llm.cache import ResponseCache
+
+    cache = ResponseCache(maxsize=2)
+    k1 = cache.key_for({"model": "m", "messages": [{"role": "user", "content": "a"}]})
+    assert k1 == cache.key_for({"messages": [{"role": "user", "content": "a"}], "model": "m"})
+    cache.put(k1, "one")
+    cache.put("k2", "two")
+    assert cache.get(k1) == "one"  # k1 now most recent
+    cache.put("k3", "three")
+    assert cache.get("k2") is None
+    assert len(cache) == 2